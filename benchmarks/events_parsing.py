@@ -0,0 +1,38 @@
+"""
+Throughput of `get_event_object` with every types backend on the recorded events
+(`bot_events.json`, the raw events of tests/types).
+
+    python benchmarks/events_parsing.py
+"""
+
+import json
+import pathlib
+import timeit
+
+from vkwave.types.backend import TypesBackend, set_types_backend
+from vkwave.types.bot_events import get_event_object
+
+CORPUS = json.loads((pathlib.Path(__file__).parent / "bot_events.json").read_text())
+
+
+def parse_corpus() -> None:
+    for raw_event in CORPUS:
+        get_event_object(raw_event)
+
+
+def main() -> None:
+    number = 200
+    results = {}
+    for backend in TypesBackend:
+        set_types_backend(backend)
+        parse_corpus()  # native models are built on first use
+        best = min(timeit.repeat(parse_corpus, number=number, repeat=5))
+        results[backend] = number * len(CORPUS) / best
+
+    base = results[TypesBackend.PYDANTIC_V1]
+    for backend, events_per_second in results.items():
+        print(f"{backend.value}: {events_per_second:.0f} events/s ({events_per_second / base:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Parse throughput of vkwave.types with both backends.
+
+    python benchmarks/types_parsing.py
+"""
+
+import copy
+import timeit
+
+from vkwave.types.backend import to_native_model
+from vkwave.types.bot_events import MessageNew
+from vkwave.types.lazy import LazyModel
+from vkwave.types.responses import MessagesGetHistoryResponse, UsersGetResponse
+
+PHOTO = {
+    "id": 457239498,
+    "album_id": -3,
+    "owner_id": 578716413,
+    "sizes": [
+        {"type": size, "url": "https://sun9-1.userapi.com/c1/v1/a.jpg", "width": 75, "height": 56}
+        for size in "smxyopqr"
+    ],
+    "text": "",
+    "date": 1582576949,
+    "access_key": "6ce8a9a2e8f6c1e2c1",
+}
+
+MESSAGE = {
+    "date": 1582576963,
+    "from_id": 578716413,
+    "id": 305,
+    "out": 0,
+    "peer_id": 578716413,
+    "text": "bruh",
+    "conversation_message_id": 304,
+    "fwd_messages": [
+        {
+            "date": 1582576949,
+            "from_id": 578716413,
+            "text": "meh",
+            "attachments": [{"type": "photo", "photo": PHOTO}],
+            "conversation_message_id": 303,
+        }
+    ],
+    "important": False,
+    "random_id": 0,
+    "attachments": [{"type": "photo", "photo": PHOTO}],
+    "is_hidden": False,
+}
+
+MESSAGE_NEW = {
+    "type": "message_new",
+    "object": {
+        "message": MESSAGE,
+        "client_info": {
+            "button_actions": ["text", "vkpay", "open_app", "location", "open_link"],
+            "keyboard": True,
+            "inline_keyboard": True,
+            "carousel": False,
+            "lang_id": 0,
+        },
+    },
+    "group_id": 191949777,
+    "event_id": "2a01ffba5838ff2016ae555327fd77c8633bbef6",
+}
+
+GET_HISTORY = {"response": {"count": 200, "items": [copy.deepcopy(MESSAGE) for _ in range(200)]}}
+
+USERS_GET = {
+    "response": [
+        {
+            "id": 1 + i,
+            "first_name": "Pavel",
+            "last_name": "Durov",
+            "is_closed": False,
+            "can_access_closed": True,
+            "sex": 2,
+            "screen_name": "durov",
+            "photo_100": "https://sun9-1.userapi.com/c1/v1/a.jpg",
+            "online": 0,
+            "city": {"id": 2, "title": "Saint Petersburg"},
+        }
+        for i in range(100)
+    ]
+}
+
+CASES = [
+    ("MessageNew", MessageNew, MESSAGE_NEW, 2000),
+    ("MessagesGetHistoryResponse (200 items)", MessagesGetHistoryResponse, GET_HISTORY, 20),
+    ("UsersGetResponse (100 items)", UsersGetResponse, USERS_GET, 100),
+]
+
+
+def main() -> None:
+    for name, model, data, number in CASES:
+        native = to_native_model(model)
+        v1 = min(timeit.repeat(lambda: model(**data), number=number, repeat=5)) / number
+        v2 = min(timeit.repeat(lambda: native.model_validate(data), number=number, repeat=5))
+        v2 /= number
+        print(
+            f"{name}: pydantic_v1 {1 / v1:.0f}/s, pydantic_v2 {1 / v2:.0f}/s ({v1 / v2:.1f}x)"
+        )
+
+    number = 10000
+    lazy = min(
+        timeit.repeat(
+            lambda: LazyModel(MessagesGetHistoryResponse, GET_HISTORY).response.count,
+            number=number,
+            repeat=5,
+        )
+    )
+    print(f"MessagesGetHistoryResponse (200 items), lazy `.response.count`: {number / lazy:.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
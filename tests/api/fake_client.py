@@ -0,0 +1,43 @@
+from typing import List, Tuple, Union
+
+from vkwave.client.abstract import AbstractAPIClient
+from vkwave.client.context import RequestContext
+from vkwave.client.factory import AbstractFactory, DefaultFactory
+from vkwave.client.types import MethodName
+
+
+class FakeClient(AbstractAPIClient):
+    """Client that returns prepared responses (or raises prepared exceptions) one by one."""
+
+    def __init__(self, *responses: Union[dict, Exception]):
+        self._factory = DefaultFactory()
+        self.responses = list(responses)
+        self.requests: List[Tuple[MethodName, dict]] = []
+        self.contexts: List[RequestContext] = []
+
+    @property
+    def context_factory(self) -> AbstractFactory:
+        return self._factory
+
+    def set_context_factory(self, factory: AbstractFactory) -> None:
+        self._factory = factory
+
+    async def callback(self, method_name: MethodName, params: dict) -> dict:
+        self.requests.append((method_name, dict(params)))
+        response = self.responses[0] if len(self.responses) == 1 else self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def create_request(self, method_name: MethodName, params: dict) -> RequestContext:
+        ctx = self.context_factory.create_context(
+            exceptions={},
+            request_callback=self.callback,
+            request_params=params,
+            method_name=method_name,
+        )
+        self.contexts.append(ctx)
+        return ctx
+
+    async def close(self):
+        pass
@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+from vkwave.api.methods import API, ExecuteBatcher
+from vkwave.api.methods._error import APIError
+from vkwave.api.token.token import BotSyncSingleToken, Token
+from vkwave.client.types import MethodName
+
+from .fake_client import FakeClient
+
+
+def get_ctx(client: FakeClient, **kwargs):
+    api = API(
+        BotSyncSingleToken(Token("token")),
+        clients=client,
+        execute_batcher=ExecuteBatcher(**kwargs),
+    )
+    return api.get_context()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_merged():
+    client = FakeClient(
+        {
+            "response": [[{"id": 1}], False, 1],
+            "execute_errors": [
+                {"method": "users.get", "error_code": 113, "error_msg": "Invalid user id"}
+            ],
+        }
+    )
+    ctx = get_ctx(client)
+
+    first, second, third = await asyncio.gather(
+        ctx.api_request("users.get", {"user_ids": "1"}),
+        ctx.api_request("users.get", {"user_ids": "-1"}),
+        ctx.api_request("messages.send", {"peer_id": 1, "random_id": 0}),
+        return_exceptions=True,
+    )
+
+    assert len(client.requests) == 1
+    method_name, params = client.requests[0]
+    assert method_name == "execute"
+    assert params["code"] == (
+        'return [API.users.get({"user_ids": "1"}),API.users.get({"user_ids": "-1"}),'
+        'API.messages.send({"peer_id": 1, "random_id": 0})];'
+    )
+    assert params["access_token"] == "token"
+    assert first == {"response": [{"id": 1}]}
+    assert isinstance(second, APIError) and second.code == 113
+    assert third == {"response": 1}
+
+
+@pytest.mark.asyncio
+async def test_single_call_is_not_wrapped():
+    client = FakeClient({"response": [{"id": 1}]})
+    ctx = get_ctx(client)
+
+    assert await ctx.api_request("users.get", {"user_ids": "1"}) == {"response": [{"id": 1}]}
+    assert client.requests[0][0] == "users.get"
+
+
+@pytest.mark.asyncio
+async def test_batch_is_sent_when_full():
+    client = FakeClient({"response": [1, 1]})
+    ctx = get_ctx(client, delay=60, max_calls=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            ctx.api_request("messages.send", {"random_id": 0}),
+            ctx.api_request("messages.send", {"random_id": 1}),
+        ),
+        timeout=1,
+    )
+    assert results == [{"response": 1}, {"response": 1}]
+
+
+def test_excluded_methods():
+    batcher = ExecuteBatcher(exclude=["photos.getUploadServer"])
+    assert not batcher.is_batchable(MethodName("execute"))
+    assert not batcher.is_batchable(MethodName("photos.getUploadServer"))
+    assert batcher.is_batchable(MethodName("users.get"))
+
+    with pytest.raises(ValueError):
+        ExecuteBatcher(max_calls=26)
+
+
+@pytest.mark.asyncio
+async def test_false_results_are_told_from_errors():
+    client = FakeClient(
+        {
+            "response": [False, False, False],
+            "execute_errors": [
+                {"method": "users.get", "error_code": 113, "error_msg": "Invalid user id"}
+            ],
+        }
+    )
+    ctx = get_ctx(client)
+
+    is_member, user, other_is_member = await asyncio.gather(
+        ctx.api_request("groups.isMember", {"group_id": 1, "user_id": 1}),
+        ctx.api_request("users.get", {"user_ids": "-1"}),
+        ctx.api_request("groups.isMember", {"group_id": 1, "user_id": 2}),
+        return_exceptions=True,
+    )
+    assert is_member == other_is_member == {"response": False}
+    assert isinstance(user, APIError) and user.code == 113
+    assert len(client.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_ambiguous_calls_are_sent_alone():
+    client = FakeClient(
+        {
+            "response": [False, False],
+            "execute_errors": [
+                {"method": "groups.isMember", "error_code": 100, "error_msg": "Invalid group"}
+            ],
+        },
+        {"response": False},
+        {"error": {"error_code": 100, "error_msg": "Invalid group", "request_params": []}},
+    )
+    ctx = get_ctx(client)
+
+    first, second = await asyncio.gather(
+        ctx.api_request("groups.isMember", {"group_id": 1, "user_id": 1}),
+        ctx.api_request("groups.isMember", {"group_id": -1, "user_id": 1}),
+        return_exceptions=True,
+    )
+    assert first == {"response": False}
+    assert isinstance(second, APIError) and second.code == 100
+    assert [method_name for method_name, _ in client.requests] == [
+        "execute",
+        "groups.isMember",
+        "groups.isMember",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_reaches_callers():
+    client = FakeClient(ConnectionResetError())
+    ctx = get_ctx(client)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            ctx.api_request("users.get", {"user_ids": "1"}),
+            ctx.api_request("users.get", {"user_ids": "2"}),
+            return_exceptions=True,
+        ),
+        timeout=1,
+    )
+    assert all(isinstance(result, ConnectionResetError) for result in results)
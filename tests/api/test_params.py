@@ -0,0 +1,47 @@
+import pytest
+
+from vkwave.api import API
+from vkwave.api.methods._utils import dump_param, get_params
+from vkwave.types.objects import BaseBoolInt, UsersFields
+
+from .fake_client import FakeClient
+
+
+def test_dump_param():
+    assert dump_param(True) == 1
+    assert dump_param(False) == 0
+    assert dump_param(BaseBoolInt.YES) == 1
+    assert dump_param(UsersFields.SEX) == "sex"
+    assert dump_param([UsersFields.SEX, "bdate", 1]) == "sex,bdate,1"
+    assert dump_param({"one_time": True, "buttons": []}) == '{"one_time": true, "buttons": []}'
+
+
+def test_get_params():
+    def method(self, return_raw_response=False, user_id=None, fields=None, flag=None):
+        return get_params(locals())
+
+    def compiled(self, return_raw_response=False, user_id=None, fields=None, flag=None):
+        return get_params(locals(), "Tests.compiled")
+
+    for call in (method, compiled, compiled):  # serializer is compiled once and reused
+        assert call(None, user_id=1) == {"user_id": 1}
+        assert call(None, True, "durov", [UsersFields.SEX], False) == {
+            "user_id": "durov",
+            "fields": "sex",
+            "flag": 0,
+        }
+        assert call(None, flag={"one_time": True}) == {"flag": '{"one_time": true}'}
+
+
+@pytest.mark.asyncio
+async def test_method_params():
+    client = FakeClient({"response": 1})
+    api = API(tokens="token", clients=client)
+    await api.get_context().messages.send(
+        peer_id=1, message="hi", random_id=0, disable_mentions=True, keyboard="{}"
+    )
+    _, params = client.requests[0]
+    assert params["disable_mentions"] == 1
+    assert params["random_id"] == 0
+    assert params["keyboard"] == "{}"
+    assert params["access_token"] == "token"
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from vkwave.api.methods import API, ProfileLoader, ProfileNotFound
+from vkwave.api.methods._error import APIError
+from vkwave.api.token.token import BotSyncSingleToken, Token
+
+from .fake_client import FakeClient
+
+
+def get_api(client: FakeClient) -> API:
+    return API(
+        BotSyncSingleToken(Token("token")), clients=client, profile_loader=ProfileLoader()
+    )
+
+
+@pytest.mark.asyncio
+async def test_users_are_loaded_with_one_request():
+    client = FakeClient({"response": [{"id": 1, "first_name": "a"}, {"id": 2, "first_name": "b"}]})
+    api = get_api(client)
+    loader, ctx = api.default_api_options.profile_loader, api.get_context()
+
+    first, second, again = await asyncio.gather(
+        loader.load_user(ctx, 1, fields=["sex", "city"]),
+        loader.load_user(ctx, 2, fields=["sex", "city"]),
+        loader.load_user(ctx, 1, fields=["sex", "city"]),
+    )
+    assert first == again == {"id": 1, "first_name": "a"}
+    assert second["first_name"] == "b"
+    method_name, params = client.requests[0]
+    assert method_name == "users.get"
+    assert (params["user_ids"], params["fields"]) == ("1,2", "sex,city")
+
+    # cached
+    assert await loader.load_user(ctx, 2, fields=["sex", "city"]) == second
+    assert len(client.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_profile():
+    client = FakeClient({"response": [{"id": 1}]})
+    api = get_api(client)
+    loader, ctx = api.default_api_options.profile_loader, api.get_context()
+
+    found, missing = await asyncio.gather(
+        loader.load_group(ctx, -1), loader.load_group(ctx, 3), return_exceptions=True
+    )
+    assert found == {"id": 1}
+    assert isinstance(missing, ProfileNotFound)
+    assert [(name, params["group_ids"]) for name, params in client.requests] == [
+        ("groups.getById", "1,3")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_different_params_are_different_requests():
+    client = FakeClient({"response": [{"id": 1}]})
+    api = get_api(client)
+    loader, ctx = api.default_api_options.profile_loader, api.get_context()
+
+    await asyncio.gather(loader.load_user(ctx, 1), loader.load_user(ctx, 1, name_case="gen"))
+    assert len(client.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_invalid_id_fails_only_its_lookup():
+    invalid = {"error": {"error_code": 113, "error_msg": "Invalid user id", "request_params": []}}
+    client = FakeClient(invalid, {"response": [{"id": 1}]}, invalid)
+    api = get_api(client)
+    loader, ctx = api.default_api_options.profile_loader, api.get_context()
+
+    found, invalid_user = await asyncio.gather(
+        loader.load_user(ctx, 1), loader.load_user(ctx, -5), return_exceptions=True
+    )
+    assert found == {"id": 1}
+    assert isinstance(invalid_user, APIError) and invalid_user.code == 113
+    assert [params["user_ids"] for _, params in client.requests] == ["1,-5", "1", "-5"]
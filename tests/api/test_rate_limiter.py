@@ -0,0 +1,78 @@
+import asyncio
+import time
+
+import pytest
+
+from vkwave.api import API
+from vkwave.api.methods import RateLimiter, TokenBucket
+from vkwave.api.methods._limiter import get_tokens_type
+from vkwave.api.token.token import BotSyncSingleToken, Token, TokenType, UserSyncSingleToken
+
+from .fake_client import FakeClient
+
+
+@pytest.mark.asyncio
+async def test_bucket_waits_when_empty():
+    bucket = TokenBucket(rate=20, capacity=2)
+    start = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+    # two requests are free, next two wait for 1/20 s each
+    assert time.monotonic() - start >= 0.09
+    assert bucket.level < 1
+
+
+@pytest.mark.asyncio
+async def test_bucket_keeps_rate_in_any_second():
+    rate = 50
+    bucket = TokenBucket(rate=rate)
+    times = []
+    for _ in range(rate + 10):
+        await bucket.acquire()
+        times.append(time.monotonic())
+    # the first request and the one `rate` requests later can't be in the same second
+    assert all(later - earlier >= 1 for earlier, later in zip(times, times[rate:]))
+
+
+def test_bucket_capacity():
+    assert TokenBucket(rate=20).capacity == 1
+    with pytest.raises(ValueError):
+        TokenBucket(rate=20, capacity=0)
+
+
+@pytest.mark.asyncio
+async def test_bucket_is_fair():
+    bucket = TokenBucket(rate=100, capacity=1)
+    order = []
+
+    async def request(i: int):
+        await bucket.acquire()
+        order.append(i)
+
+    await asyncio.gather(*(request(i) for i in range(5)))
+    assert order == [0, 1, 2, 3, 4]
+
+
+def test_limits_by_token_type():
+    limiter = RateLimiter({TokenType.USER: 2})
+    assert limiter.get_bucket(Token("user"), TokenType.USER).rate == 2
+    assert limiter.get_bucket(Token("bot"), TokenType.BOT).rate == 20
+
+    limiter.set_token_limit(Token("bot"), 5, capacity=1)
+    bucket = limiter.get_bucket(Token("bot"), TokenType.BOT)
+    assert (bucket.rate, bucket.capacity) == (5, 1)
+    assert limiter.levels() == {Token("user"): 1, Token("bot"): 1}
+
+
+def test_tokens_type():
+    assert get_tokens_type([UserSyncSingleToken(Token("1"))]) is TokenType.USER
+    assert get_tokens_type([BotSyncSingleToken(Token("1"))]) is TokenType.BOT
+    assert get_tokens_type([Token("1")]) is TokenType.BOT
+    assert get_tokens_type([Token("1")], TokenType.USER) is TokenType.USER
+
+
+def test_token_context_type():
+    api = API(UserSyncSingleToken(Token("user")), clients=FakeClient())
+    # raw string tokens of contexts have the type of the default tokens, or the given one
+    assert api.with_token(Token("1")).api_options.token_type is TokenType.USER
+    assert api.with_token(Token("2"), TokenType.BOT).api_options.token_type is TokenType.BOT
@@ -0,0 +1,82 @@
+import pytest
+
+from vkwave.api.methods import API, APIOptionsRequestContext
+from vkwave.api.methods.messages import Messages
+from vkwave.api.token.token import BotSyncSingleToken, Token
+from vkwave.types.lazy import LazyModel
+
+from .fake_client import FakeClient
+
+
+class DummyClient:
+    async def close(self):
+        pass
+
+
+def get_api(**kwargs) -> API:
+    return API(BotSyncSingleToken(Token("default")), clients=DummyClient(), **kwargs)
+
+
+def test_categories_are_lazy():
+    ctx = get_api().get_context()
+    assert "messages" not in ctx.__dict__
+
+    messages = ctx.messages
+    assert isinstance(messages, Messages)
+    assert messages.make_method_name("send") == "messages.send"
+    assert ctx.messages is messages
+    assert "users" not in ctx.__dict__
+
+
+def test_with_token_is_cached():
+    api = get_api()
+    token = BotSyncSingleToken(Token("123"))
+    other = BotSyncSingleToken(Token("456"))
+
+    ctx = api.with_token(token)
+    assert isinstance(ctx, APIOptionsRequestContext)
+    assert api.with_token(token) is ctx
+    assert api.with_token(other) is not ctx
+    assert ctx.api_options.tokens == [token]
+    assert api.default_api_options.tokens != [token]
+
+
+def test_with_token_cache_is_bounded():
+    api = get_api(max_cached_contexts=2)
+    tokens = [BotSyncSingleToken(Token(str(i))) for i in range(3)]
+    first = api.with_token(tokens[0])
+    api.with_token(tokens[1])
+    api.with_token(tokens[0])  # becomes most recently used
+    api.with_token(tokens[2])
+
+    assert len(api._token_contexts) == 2
+    assert api.with_token(tokens[0]) is first
+    assert tokens[1] not in api._token_contexts
+
+
+def test_clear_contexts_cache():
+    api = get_api()
+    token = BotSyncSingleToken(Token("123"))
+    ctx = api.with_token(token)
+    default = api.get_context()
+    assert api.get_context() is default
+
+    api.clear_contexts_cache()
+    assert api.with_token(token) is not ctx
+    assert api.get_context() is not default
+
+
+@pytest.mark.asyncio
+async def test_lazy_responses():
+    client = FakeClient({"response": [{"id": 1, "first_name": "Pavel", "last_name": "Durov"}]})
+    ctx = API(tokens="token", clients=client).get_context()
+
+    lazy_ctx = ctx.lazy()
+    assert lazy_ctx is ctx.lazy()
+    assert lazy_ctx.lazy() is lazy_ctx
+    assert not ctx.api_options.lazy_responses
+
+    users = await lazy_ctx.users.get(user_ids=["1"])
+    assert isinstance(users, LazyModel)
+    assert users.response[0].first_name == "Pavel"
+    assert not isinstance(await ctx.users.get(user_ids=["1"]), LazyModel)
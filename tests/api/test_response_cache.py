@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from vkwave.api.methods import API, LRUCacheStorage, RateLimiter, ResponseCache
+from vkwave.api.token.token import BotSyncSingleToken, Token
+
+from .fake_client import FakeClient
+
+
+def get_api(client: FakeClient, **kwargs) -> API:
+    return API(
+        BotSyncSingleToken(Token("token")),
+        clients=client,
+        response_cache=ResponseCache({"users.get": 60}),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_method():
+    client = FakeClient({"response": [{"id": 1}]})
+    limiter = RateLimiter()
+    limiter.set_token_limit(Token("token"), 20, capacity=20)
+    ctx = get_api(client, rate_limiter=limiter).get_context()
+
+    for _ in range(3):
+        assert await ctx.users.get(user_ids=[1], return_raw_response=True) == {
+            "response": [{"id": 1}]
+        }
+    assert len(client.requests) == 1
+    assert ctx.api_options.response_cache.hits == 2
+    # cached calls don't spend rate limit
+    assert limiter.levels()[Token("token")] > 18
+
+    await ctx.users.get(user_ids=[2], return_raw_response=True)
+    await ctx.messages.send(peer_id=1, random_id=0, return_raw_response=True)
+    await ctx.messages.send(peer_id=1, random_id=0, return_raw_response=True)
+    assert len(client.requests) == 4
+
+
+@pytest.mark.asyncio
+async def test_cached_responses_are_copied():
+    client = FakeClient({"response": [{"id": 1}]})
+    ctx = get_api(client).get_context()
+
+    response = await ctx.users.get(user_ids=[1], return_raw_response=True)
+    response["response"][0]["id"] = 2
+    assert await ctx.users.get(user_ids=[1], return_raw_response=True) == {
+        "response": [{"id": 1}]
+    }
+
+
+@pytest.mark.asyncio
+async def test_cache_is_scoped_to_token():
+    client = FakeClient({"response": [{"id": 1}]})
+    api = get_api(client)
+
+    await api.with_token(BotSyncSingleToken(Token("1"))).users.get(user_ids=[1])
+    await api.with_token(BotSyncSingleToken(Token("2"))).users.get(user_ids=[1])
+    assert len(client.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    error = {"error": {"error_code": 5, "error_msg": "auth", "request_params": []}}
+    client = FakeClient(error, {"response": [{"id": 1}]})
+    ctx = get_api(client).get_context()
+
+    with pytest.raises(Exception):
+        await ctx.users.get(user_ids=[1])
+    await ctx.users.get(user_ids=[1])
+    await ctx.users.get(user_ids=[1])
+    assert len(client.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_lru_storage():
+    storage = LRUCacheStorage(max_size=2)
+    await storage.put("a", 1, ttl=60)
+    await storage.put("b", 2, ttl=60)
+    assert await storage.get("a") == 1
+    await storage.put("c", 3, ttl=60)
+    assert not await storage.contains("b")
+
+    await storage.put("d", 4, ttl=0.001)
+    await asyncio.sleep(0.002)
+    assert await storage.get("d", "expired") == "expired"
+
+    # like in `TTLStorage`, negative TTL means that key never expires
+    await storage.put("e", 5, ttl=-1)
+    assert await storage.get("e") == 5
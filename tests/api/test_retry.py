@@ -0,0 +1,64 @@
+import pytest
+from aiohttp import ClientConnectionError
+
+from vkwave.api.methods import API, Backoff, RetryPolicy
+from vkwave.api.methods._error import APIError
+from vkwave.api.token.token import BotSyncSingleToken, Token
+
+from .fake_client import FakeClient
+
+FAST = Backoff(retries=2, base_delay=0.001)
+
+
+def get_ctx(client: FakeClient):
+    policy = RetryPolicy(codes={6: FAST, 10: FAST}, exceptions_backoff=FAST)
+    api = API(BotSyncSingleToken(Token("token")), clients=client, retry_policy=policy)
+    return api.get_context()
+
+
+def error(code: int) -> dict:
+    return {"error": {"error_code": code, "error_msg": "error", "request_params": []}}
+
+
+@pytest.mark.asyncio
+async def test_retry_on_error_code():
+    client = FakeClient(error(6), error(10), {"response": 1})
+    ctx = get_ctx(client)
+
+    assert await ctx.api_request("users.get", {}) == {"response": 1}
+    assert len(client.requests) == 3
+    assert [ctx.attempt for ctx in client.contexts] == [0, 1, 2]
+    assert ctx.api_options.retry_policy.stats == {6: 1, 10: 1}
+
+
+@pytest.mark.asyncio
+async def test_retries_are_limited():
+    client = FakeClient(error(6))
+    ctx = get_ctx(client)
+
+    with pytest.raises(APIError):
+        await ctx.api_request("users.get", {})
+    assert len(client.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_not_transient_error_is_not_retried():
+    client = FakeClient(error(5))
+    ctx = get_ctx(client)
+
+    with pytest.raises(APIError):
+        await ctx.api_request("users.get", {})
+    assert len(client.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_on_connection_error_keeps_random_id():
+    client = FakeClient(ClientConnectionError(), {"response": 1})
+    ctx = get_ctx(client)
+
+    assert await ctx.api_request("messages.send", {"peer_id": 1, "random_id": 0}) == {
+        "response": 1
+    }
+    first, second = client.requests
+    assert first[1]["random_id"] != 0
+    assert first[1]["random_id"] == second[1]["random_id"]
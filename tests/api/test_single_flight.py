@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from vkwave.api.methods import API, SingleFlight
+from vkwave.api.methods._error import APIError
+from vkwave.api.token.token import BotSyncSingleToken, Token
+from vkwave.client.types import MethodName
+
+from .fake_client import FakeClient
+
+
+class SlowClient(FakeClient):
+    async def callback(self, method_name: MethodName, params: dict) -> dict:
+        await asyncio.sleep(0.01)
+        return await super().callback(method_name, params)
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_are_shared():
+    client = SlowClient({"response": {"count": 2, "items": []}})
+    api = API(BotSyncSingleToken(Token("token")), clients=client, single_flight=SingleFlight())
+    ctx = api.get_context()
+
+    results = await asyncio.gather(
+        *(ctx.api_request("messages.getConversationMembers", {"peer_id": 1}) for _ in range(10)),
+        ctx.api_request("messages.getConversationMembers", {"peer_id": 2}),
+    )
+    assert all(result == {"response": {"count": 2, "items": []}} for result in results)
+    assert len(client.requests) == 2
+    assert api.default_api_options.single_flight.shared == 9
+
+    # every caller has its own result
+    results[0]["response"]["items"].append(1)
+    assert results[1] == {"response": {"count": 2, "items": []}}
+
+
+@pytest.mark.asyncio
+async def test_not_read_only_methods_are_not_shared():
+    client = SlowClient({"response": 1})
+    api = API(BotSyncSingleToken(Token("token")), clients=client, single_flight=SingleFlight())
+    ctx = api.get_context()
+
+    await asyncio.gather(*(ctx.api_request("messages.send", {"peer_id": 1}) for _ in range(3)))
+    assert len(client.requests) == 3
+    await asyncio.gather(*(ctx.api_request("execute.getMembers", {}) for _ in range(3)))
+    assert len(client.requests) == 6
+
+
+@pytest.mark.asyncio
+async def test_exception_is_shared():
+    single_flight = SingleFlight()
+
+    async def request():
+        await asyncio.sleep(0.01)
+        raise RuntimeError()
+
+    results = await asyncio.gather(
+        single_flight.do("key", request), single_flight.do("key", request), return_exceptions=True
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert not single_flight._in_flight
+
+
+def test_is_shared():
+    assert SingleFlight().is_shared(MethodName("users.get"))
+    assert not SingleFlight().is_shared(MethodName("messages.send"))
+    assert not SingleFlight(methods=["users.get"]).is_shared(MethodName("groups.getById"))
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others():
+    single_flight = SingleFlight()
+
+    async def request():
+        await asyncio.sleep(0.02)
+        return {"response": 1}
+
+    leader = asyncio.ensure_future(single_flight.do("key", request))
+    waiter = asyncio.ensure_future(single_flight.do("key", request))
+    await asyncio.sleep(0.005)
+    leader.cancel()
+
+    assert await waiter == {"response": 1}
+    assert leader.cancelled()
+    assert not single_flight._in_flight
+
+
+@pytest.mark.asyncio
+async def test_request_is_cancelled_with_all_callers():
+    single_flight = SingleFlight()
+    finished = []
+
+    async def request():
+        await asyncio.sleep(0.02)
+        finished.append(True)
+        return {"response": 1}
+
+    callers = [asyncio.ensure_future(single_flight.do("key", request)) for _ in range(2)]
+    await asyncio.sleep(0.005)
+    for caller in callers:
+        caller.cancel()
+    await asyncio.sleep(0.03)
+    assert not finished
+    assert not single_flight._in_flight
+
+
+@pytest.mark.asyncio
+async def test_execute_errors_without_token():
+    api = API(BotSyncSingleToken(Token("token")), clients=FakeClient({"response": 1}))
+    ctx = api.get_context()
+    result = {
+        "response": [False],
+        "execute_errors": [{"method": "users.get", "error_code": 113, "error_msg": "Invalid id"}],
+    }
+    # params of shared requests have no token
+    with pytest.raises(APIError):
+        await ctx.process_result(result, {"user_ids": 0})
@@ -0,0 +1,65 @@
+import pytest
+
+from vkwave.api import API
+from vkwave.api.token.strategy import (
+    BudgetAwareGetTokenStrategy,
+    LeastInFlightGetTokenStrategy,
+    RoundRobinGetTokenStrategy,
+)
+from vkwave.api.token.token import BotSyncPoolTokens, BotSyncSingleToken, Token
+
+from .fake_client import FakeClient
+
+
+@pytest.mark.asyncio
+async def test_round_robin():
+    strategy = RoundRobinGetTokenStrategy()
+    tokens = [BotSyncSingleToken(Token("1")), BotSyncPoolTokens([Token("2"), Token("3")])]
+    got = [await strategy.get_token(tokens) for _ in range(6)]
+    assert got == ["1", "2", "3", "1", "2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_least_in_flight():
+    strategy = LeastInFlightGetTokenStrategy()
+    tokens = [BotSyncSingleToken(Token("1")), BotSyncSingleToken(Token("2"))]
+
+    first = await strategy.get_token(tokens)
+    second = await strategy.get_token(tokens)
+    assert {first, second} == {"1", "2"}
+
+    strategy.release_token(first)
+    assert await strategy.get_token(tokens) == first
+    assert strategy.in_flight == {tokens[int(first) - 1]: 1, tokens[int(second) - 1]: 1}
+
+
+@pytest.mark.asyncio
+async def test_budget_aware_skips_cooling_tokens():
+    strategy = BudgetAwareGetTokenStrategy(cooldowns={6: 60})
+    tokens = [Token("1"), Token("2")]
+
+    token = await strategy.get_token(tokens)
+    strategy.release_token(token, error_code=6)
+    other = "2" if token == "1" else "1"
+    for _ in range(3):
+        got = await strategy.get_token(tokens)
+        strategy.release_token(got)
+        assert got == other
+
+    # every token is cooling down: the one that is ready first is used
+    strategy.release_token(await strategy.get_token(tokens), error_code=6)
+    assert await strategy.get_token(tokens) == token
+
+
+@pytest.mark.asyncio
+async def test_sync_token_releases_token():
+    strategy = LeastInFlightGetTokenStrategy()
+    client = FakeClient({"response": []})
+    api = API([Token("1"), Token("2")], clients=client, get_token_strategy=strategy)
+
+    async with api.get_context().sync_token() as ctx:
+        assert ctx.api_options.tokens[0] in ("1", "2")
+        assert strategy.in_flight == {}
+        await ctx.api_request("users.get", {})
+    assert strategy.in_flight == {}
+    assert client.requests[0][1]["access_token"] == ctx.api_options.tokens[0]
@@ -0,0 +1,221 @@
+import asyncio
+import logging
+
+import pytest
+
+from vkwave.api import API
+from vkwave.api.methods import RateLimiter
+from vkwave.api.token.token import Token
+from vkwave.bots import (
+    BaseEvent,
+    BaseMiddleware,
+    DefaultRouter,
+    Dispatcher,
+    EventTypeFilter,
+    MiddlewareResult,
+    TextFilter,
+)
+from vkwave.bots.core.dispatching.dp.executor import WorkerPoolExecutor, get_peer_id
+from vkwave.bots.core.dispatching.dp.processing_options import ProcessEventOptions
+from vkwave.bots.core.dispatching.events.raw import ExtensionEvent
+from vkwave.bots.core.tokens.storage import UserTokenStorage
+from vkwave.bots.core.types.bot_type import BotType
+from vkwave.client import LogSampler
+
+OPTIONS = ProcessEventOptions(do_not_handle=False)
+
+
+class DummyClient:
+    async def close(self):
+        pass
+
+
+class TokenStorage:
+    def __init__(self):
+        self.lookups = 0
+
+    async def get_token(self, *args):
+        self.lookups += 1
+        return "token"
+
+
+def do_nothing(event):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_skip_unsubscribed_events():
+    token_storage = TokenStorage()
+    dp = Dispatcher(
+        API("token", clients=DummyClient()),
+        token_storage,
+        bot_type=BotType.USER,
+        skip_unsubscribed_events=True,
+    )
+    router = DefaultRouter()
+    router.register_handler(EventTypeFilter((3, 4)), callback="message")
+    dp.add_router(router)
+    assert dp.get_event_types() == {3, 4}
+
+    friend_online = ExtensionEvent(BotType.USER, [8, -1, 1, 1600000000])
+    assert not await dp.process_event(friend_online, OPTIONS)
+    assert dp.skipped_events == 1
+    assert token_storage.lookups == 0
+
+    router.register_handler(callback=do_nothing)
+    assert dp.get_event_types() is None
+    await dp.process_event(friend_online, OPTIONS)
+    assert dp.skipped_events == 1
+    assert token_storage.lookups == 1
+
+    other_router = DefaultRouter([EventTypeFilter(8)])
+    other_router.register_handler(EventTypeFilter((8, 9)), callback="online")
+    assert other_router.get_event_types() == {8}
+
+
+@pytest.mark.asyncio
+async def test_event_types_cache():
+    token_storage = TokenStorage()
+    dp = Dispatcher(
+        API("token", clients=DummyClient()),
+        token_storage,
+        bot_type=BotType.USER,
+        skip_unsubscribed_events=True,
+    )
+    router = DefaultRouter()
+    router.register_handler(EventTypeFilter(4), callback="message")
+    dp.add_router(router)
+
+    friend_online = ExtensionEvent(BotType.USER, [8, -1, 1, 1600000000])
+    assert not await dp.process_event(friend_online, OPTIONS)
+    assert dp.skipped_events == 1
+    assert dp.get_event_types() is dp.get_event_types()
+
+    router.register_handler(EventTypeFilter(8), callback=do_nothing)
+    assert await dp.process_event(friend_online, OPTIONS)
+    assert dp.skipped_events == 1
+    assert token_storage.lookups == 1
+
+    other_router = DefaultRouter()
+    other_router.register_handler(EventTypeFilter(9), callback="offline")
+    dp.add_router(other_router)
+    assert dp.get_event_types() == {4, 8, 9}
+
+
+class BatchMiddleware(BaseMiddleware):
+    def __init__(self):
+        self.batches = []
+
+    async def pre_process_event(self, event: BaseEvent) -> MiddlewareResult:
+        return MiddlewareResult(True)
+
+    async def pre_process_events(self, events):
+        self.batches.append(events)
+
+
+@pytest.mark.asyncio
+async def test_process_events():
+    token_storage = TokenStorage()
+    dp = Dispatcher(
+        API("token", clients=DummyClient()),
+        token_storage,
+        bot_type=BotType.USER,
+        skip_unsubscribed_events=True,
+    )
+    middleware = BatchMiddleware()
+    dp.middleware_manager.add_middleware(middleware)
+    router = DefaultRouter()
+    handled = []
+
+    def handle(event: BaseEvent):
+        handled.append(event)
+
+    router.register_handler(EventTypeFilter(4), TextFilter("hi"), callback=handle)
+    dp.add_router(router)
+
+    revents = [
+        ExtensionEvent(BotType.USER, [4, 1, 1, 1, 1600000000, "hi", {}, {}]),
+        ExtensionEvent(BotType.USER, [8, -1, 1, 1600000000]),
+        ExtensionEvent(BotType.USER, [4, 2, 1, 1, 1600000000, "bye", {}, {}]),
+    ]
+    await dp.process_events(revents, OPTIONS)
+    await dp.executor.join()
+    assert [event.facts.text for event in handled] == ["hi"]
+    assert token_storage.lookups == 1
+    assert dp.skipped_events == 1
+    assert [len(batch) for batch in middleware.batches] == [2]
+    assert middleware.batches[0][0].api_ctx is middleware.batches[0][1].api_ctx
+
+
+@pytest.mark.asyncio
+async def test_process_events_in_peer_order():
+    executor = WorkerPoolExecutor(workers=4, key=get_peer_id)
+    dp = Dispatcher(
+        API("token", clients=DummyClient()),
+        TokenStorage(),
+        bot_type=BotType.USER,
+        executor=executor,
+    )
+    router = DefaultRouter()
+    handled = []
+
+    async def handle(event: BaseEvent):
+        await asyncio.sleep(0.01 if event.facts.text == "first" else 0)
+        handled.append(event.facts.text)
+
+    router.register_handler(EventTypeFilter(4), callback=handle)
+    dp.add_router(router)
+
+    revents = [
+        ExtensionEvent(BotType.USER, [4, 1, 1, 1, 1600000000, "first", {}, {}]),
+        ExtensionEvent(BotType.USER, [4, 2, 1, 1, 1600000000, "second", {}, {}]),
+    ]
+    await dp.process_events(revents, OPTIONS)
+    await executor.join()
+    assert handled == ["first", "second"]
+    await executor.close()
+
+
+@pytest.mark.asyncio
+async def test_user_event_rate_limit():
+    limiter = RateLimiter()
+    dp = Dispatcher(
+        API("token", clients=DummyClient(), rate_limiter=limiter),
+        UserTokenStorage("user token"),
+        bot_type=BotType.USER,
+    )
+    contexts = []
+
+    def handle(event: BaseEvent):
+        contexts.append(event.api_ctx)
+
+    router = DefaultRouter()
+    router.register_handler(callback=handle)
+    dp.add_router(router)
+    await dp.process_event(ExtensionEvent(BotType.USER, [8, -1, 1, 1600000000]), OPTIONS)
+
+    await contexts[0].api_options.wait_for_rate_limit(Token("user token"))
+    assert limiter.buckets[Token("user token")].rate == 3
+
+
+class UnprintableEvent(ExtensionEvent):
+    def __repr__(self):
+        raise AssertionError("event was formatted")
+
+
+@pytest.mark.asyncio
+async def test_debug_logging(caplog):
+    dp = Dispatcher(API("token", clients=DummyClient()), TokenStorage(), bot_type=BotType.USER)
+    dp.add_router(DefaultRouter())
+    revent = UnprintableEvent(BotType.USER, [8, -1, 1, 1600000000])
+    with caplog.at_level(logging.INFO):
+        assert not await dp.process_event(revent, OPTIONS)
+
+    dp.log_sampler = LogSampler(rate=2)
+    revent = ExtensionEvent(BotType.USER, [8, -1, 1, 1600000000])
+    with caplog.at_level(logging.DEBUG):
+        for _ in range(4):
+            await dp.process_event(revent, OPTIONS)
+    raw_records = [record for record in caplog.records if record.msg.startswith("New event! Raw")]
+    assert len(raw_records) == 2
+    assert raw_records[0].args == (revent,)
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from vkwave.api import API
+from vkwave.bots import BotEvent
+from vkwave.bots.addons.easy.easy_handlers import SimpleBotEvent
+from vkwave.bots.core.dispatching.filters.builtin import (
+    AttachmentTypeFilter,
+    CommandsFilter,
+    PayloadContainsFilter,
+    PayloadFilter,
+    TextFilter,
+    get_id,
+    get_text,
+)
+from vkwave.bots.fsm.fsm import get_peer_from_ids
+from vkwave.types.bot_events import get_event_object
+
+
+class DummyClient:
+    async def close(self):
+        pass
+
+
+def make_event(raw_object: dict, event_type: str = "message_new") -> BotEvent:
+    raw_event = {"type": event_type, "object": raw_object, "group_id": 1, "event_id": "1"}
+    api = API("token", clients=DummyClient())
+    return BotEvent(get_event_object(raw_event), api.get_context())
+
+
+def message_new(**message) -> BotEvent:
+    raw_message = {"date": 1, "from_id": 10, "id": 1, "out": 0, "peer_id": 2000000001, "text": ""}
+    return make_event({"message": {**raw_message, **message}, "client_info": {"lang_id": 0}})
+
+
+@pytest.mark.asyncio
+async def test_filters_share_facts():
+    event = message_new(text="/Start Now", payload=json.dumps({"button": "start"}))
+    assert (await TextFilter("/start now").check(event))
+    assert (await CommandsFilter("start").check(event))
+    assert (await PayloadFilter({"button": "start"}).check(event))
+    assert (await PayloadContainsFilter("button").check(event))
+    assert event.facts.text_lower == "/start now"
+    assert event.facts.get_payload_data() is event.facts.get_payload_data()
+
+
+@pytest.mark.asyncio
+async def test_attachment_types():
+    event = message_new(attachments=[{"type": "sticker", "sticker": {"sticker_id": 1}}])
+    assert event.facts.attachment_types == ("sticker",)
+    assert (await AttachmentTypeFilter("sticker").check(event))
+    assert not (await AttachmentTypeFilter("photo").check(event))
+
+
+def test_message_ids():
+    event = message_new(text="hi")
+    assert get_text(event) == "hi"
+    assert get_id(event) == 10
+    assert get_peer_from_ids(event) == (10, 2000000001)
+
+
+def test_callback_ids():
+    event = make_event(
+        {"user_id": 10, "peer_id": 10, "event_id": "1", "payload": {"a": "1"}}, "message_event"
+    )
+    assert get_text(event) is None
+    assert get_id(event) is None
+    assert get_peer_from_ids(event) == (10, 10)
+
+    simple_event = SimpleBotEvent(event)
+    assert simple_event.from_id == 10
+    assert simple_event.payload == {"a": "1"}
@@ -0,0 +1,162 @@
+import asyncio
+
+import pytest
+
+from vkwave.bots.core.dispatching.dp.executor import (
+    LOW_PRIORITY_EVENTS,
+    EventPriority,
+    WorkerPoolExecutor,
+    get_peer_id,
+)
+from vkwave.bots.core.dispatching.dp.processing_options import ProcessEventOptions
+from vkwave.bots.core.dispatching.events.raw import ExtensionEvent
+from vkwave.bots.core.types.bot_type import BotType
+
+OPTIONS = ProcessEventOptions(do_not_handle=False)
+
+
+def make_revent(number: int, peer_id: int = 1) -> ExtensionEvent:
+    message = {"peer_id": peer_id}
+    raw_event = {"type": "message_new", "object": {"message": message}, "number": number}
+    return ExtensionEvent(BotType.BOT, raw_event)
+
+
+class Processor:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+        self.processed = []
+        self.processed_peers = []
+
+    async def __call__(self, revent: ExtensionEvent, options: ProcessEventOptions):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if revent.raw_event["number"] < 0:
+                raise ValueError("bad event")
+            self.processed.append(revent.raw_event["number"])
+            self.processed_peers.append(get_peer_id(revent))
+        finally:
+            self.running -= 1
+
+
+@pytest.mark.asyncio
+async def test_worker_pool():
+    executor = WorkerPoolExecutor(workers=2, queue_size=2)
+    process = Processor(delay=0.01)
+    for number in range(6):
+        await executor.submit(process, make_revent(number), OPTIONS)
+        assert executor.queue_depth <= 2
+    await executor.submit(process, make_revent(-1), OPTIONS)
+    await executor.join()
+
+    assert sorted(process.processed) == list(range(6))
+    assert process.max_running == 2
+    assert executor.stats.processed == 6
+    assert executor.stats.failed == 1
+    await executor.close()
+
+
+@pytest.mark.asyncio
+async def test_drop_and_timeout():
+    executor = WorkerPoolExecutor(workers=1, queue_size=1, timeout=0.01)
+    process = Processor(delay=1)
+    assert executor.submit_nowait(process, make_revent(1), OPTIONS)
+    await asyncio.sleep(0)  # the worker takes the first event
+    assert executor.submit_nowait(process, make_revent(2), OPTIONS)
+    assert not executor.submit_nowait(process, make_revent(3), OPTIONS)
+    await executor.join()
+
+    assert executor.stats.dropped == 1
+    assert executor.stats.timed_out == 2
+    assert process.processed == []
+    await executor.close()
+
+
+@pytest.mark.asyncio
+async def test_handler_timeout_is_failure():
+    async def process(revent: ExtensionEvent, options: ProcessEventOptions):
+        raise asyncio.TimeoutError  # e.g. a request of handler timed out
+
+    executor = WorkerPoolExecutor(workers=1, timeout=1)
+    await executor.submit(process, make_revent(1), OPTIONS)
+    await executor.join()
+
+    assert executor.stats.failed == 1
+    assert executor.stats.timed_out == 0
+    await executor.close()
+
+
+def test_get_peer_id():
+    assert get_peer_id(make_revent(1, peer_id=2000000001)) == 2000000001
+    raw_event = {"type": "message_event", "object": {"user_id": 1, "peer_id": 2}}
+    assert get_peer_id(ExtensionEvent(BotType.BOT, raw_event)) == 2
+    raw_event = {"type": "group_join", "object": {"user_id": 1, "join_type": "join"}}
+    assert get_peer_id(ExtensionEvent(BotType.BOT, raw_event)) == 1
+    assert get_peer_id(ExtensionEvent(BotType.USER, [4, 100, 1, 5, 0, "hi"])) == 5
+    assert get_peer_id(ExtensionEvent(BotType.USER, [8, -7, 1])) == -7
+
+
+@pytest.mark.asyncio
+async def test_peer_order():
+    executor = WorkerPoolExecutor(workers=4, key=get_peer_id)
+    process = Processor(delay=0.01)
+    for number in range(12):
+        await executor.submit(process, make_revent(number, peer_id=number % 3), OPTIONS)
+    await executor.join()
+
+    for peer_id in range(3):
+        numbers = [
+            number
+            for number, peer in zip(process.processed, process.processed_peers)
+            if peer == peer_id
+        ]
+        assert numbers == list(range(peer_id, 12, 3))
+    # one event of every peer at once
+    assert process.max_running == 3
+    await executor.close()
+
+
+@pytest.mark.asyncio
+async def test_priorities():
+    priorities = {"message_new": EventPriority.HIGH, **LOW_PRIORITY_EVENTS}
+    executor = WorkerPoolExecutor(workers=1, queue_size=4, shed_depth=2, priorities=priorities)
+    process = Processor()
+
+    def make_typing(number: int) -> ExtensionEvent:
+        raw_event = {"type": "message_typing_state", "object": {"from_id": 1}, "number": number}
+        return ExtensionEvent(BotType.BOT, raw_event)
+
+    await executor.submit(process, make_typing(0), OPTIONS)
+    await executor.submit(process, make_revent(1), OPTIONS)
+    await executor.submit(process, make_typing(2), OPTIONS)  # shed
+    await executor.submit(process, make_revent(3), OPTIONS)
+    await executor.join()
+
+    assert process.processed == [1, 3, 0]
+    assert executor.stats.shed == 1
+    await executor.close()
+
+
+@pytest.mark.asyncio
+async def test_priority_of_peer_backlog():
+    priorities = {"message_new": EventPriority.HIGH, **LOW_PRIORITY_EVENTS}
+    executor = WorkerPoolExecutor(workers=1, key=get_peer_id, priorities=priorities)
+    process = Processor()
+
+    def make_event(event_type: str, number: int, peer_id: int) -> ExtensionEvent:
+        raw_event = {"type": event_type, "object": {"from_id": peer_id}, "number": number}
+        return ExtensionEvent(BotType.BOT, raw_event)
+
+    await executor.submit(process, make_event("message_typing_state", 0, peer_id=1), OPTIONS)
+    await executor.submit(process, make_event("group_join", 1, peer_id=2), OPTIONS)
+    # it waits for the typing event of its peer, so that one isn't left behind normal events
+    await executor.submit(process, make_event("message_new", 2, peer_id=1), OPTIONS)
+    await executor.submit(process, make_event("message_typing_state", 3, peer_id=1), OPTIONS)
+    await executor.join()
+
+    assert process.processed == [0, 2, 1, 3]
+    assert executor.queue_depth == 0
+    await executor.close()
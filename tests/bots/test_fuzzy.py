@@ -0,0 +1,33 @@
+import pytest
+
+from vkwave.bots.core.dispatching.filters.builtin import LevenshteinFilter
+from vkwave.bots.core.dispatching.filters.fuzzy import FuzzyIndex, levenshtein_distance
+
+from .test_router_index import message_new
+
+
+def test_levenshtein_distance():
+    assert levenshtein_distance("kitten", "sitting") == 3
+    assert levenshtein_distance("", "abc") == 3
+    assert levenshtein_distance("flaw", "lawn") == 2
+    assert levenshtein_distance("kitten", "sitting", max_distance=2) == 3
+    assert levenshtein_distance("kitten", "sitting", max_distance=3) == 3
+    assert levenshtein_distance("a" * 1000, "b" * 1000, max_distance=1) == 2
+
+
+def test_fuzzy_index():
+    texts = ["hello", "help", "goodbye", "hi", "a"]
+    index = FuzzyIndex(texts, max_distance=1)
+    assert sorted(index.search("helo")) == ["hello", "help"]
+    assert sorted(index.search("h")) == ["a", "hi"]
+    assert list(index.search("goodbye!")) == ["goodbye"]
+    assert list(index.search("hello there")) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [1, LevenshteinFilter.INDEX_THRESHOLD])
+async def test_levenshtein_filter(count: int):
+    texts = ["hello"] + [f"command {number}" for number in range(count - 1)]
+    filter = LevenshteinFilter(texts, mistake=1)
+    assert await filter.check(message_new("Helo"))
+    assert not await filter.check(message_new("goodbye"))
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+
+import pytest
+
+from vkwave.bots import DefaultRouter, SimpleBotEvent, simple_bot_message_handler
+from vkwave.bots.core.dispatching.filters.base import SyncFuncFilter
+from vkwave.bots.core.dispatching.handler.callback import ConstantCallback, SyncFuncCallback
+from vkwave.bots.core.dispatching.offload import ThreadOffloader
+
+from .test_router_index import message_new
+
+
+def get_thread_name(event):
+    return threading.current_thread().name
+
+
+def is_offloaded(event):
+    return threading.current_thread() is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_router_offloader():
+    pool = ThreadOffloader(max_workers=2)
+    router = DefaultRouter(offloader=pool)
+    router.register_handler(is_offloaded, callback=get_thread_name)
+
+    name = await router.process_event(message_new("hi"))
+    assert name.startswith("vkwave-offload")
+    assert pool.stats.submitted == pool.stats.completed == 2
+    assert pool.stats.pending == 0
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_handler_offloader():
+    pool = ThreadOffloader(max_workers=1)
+    other_pool = ThreadOffloader(max_workers=1)
+    router = DefaultRouter(offloader=other_pool)
+    router.register_handler(callback=get_thread_name, offloader=pool)
+    router.register_handler(callback="text")
+
+    handler, text_handler = router.registrar.handlers
+    assert handler.callback.offloader is pool
+    assert isinstance(text_handler.callback, ConstantCallback)
+    await router.process_event(message_new("hi"))
+    assert pool.stats.completed == 1
+    assert other_pool.stats.submitted == 0
+    pool.shutdown()
+    other_pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shared_filters_are_not_changed():
+    pool = ThreadOffloader(max_workers=1)
+    shared_filter = SyncFuncFilter(is_offloaded)
+    shared_callback = SyncFuncCallback(get_thread_name)
+    router = DefaultRouter(offloader=pool)
+    router.register_handler(~~shared_filter, callback=shared_callback)
+    router.register_handler(shared_filter & shared_filter, callback=shared_callback)
+    other_router = DefaultRouter()
+    other_router.register_handler(~shared_filter, callback=shared_callback)
+
+    assert shared_filter.offloader is None
+    assert shared_callback.offloader is None
+    assert (await router.process_event(message_new("hi"))).startswith("vkwave-offload")
+    assert await other_router.process_event(message_new("hi")) == "MainThread"
+    assert pool.stats.completed == 2
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_easy_handler_offloader():
+    pool = ThreadOffloader(max_workers=1)
+    router = DefaultRouter(offloader=pool)
+    threads = []
+
+    offloaded = SyncFuncFilter(is_offloaded)
+
+    @simple_bot_message_handler(router, offloaded | offloaded)
+    def handle(event: SimpleBotEvent):
+        threads.append(get_thread_name(event))
+
+    await router.process_event(message_new("hi"))
+    assert threads[0].startswith("vkwave-offload")
+    assert pool.stats.completed == 2
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_max_pending():
+    pool = ThreadOffloader(max_workers=4, max_pending=1)
+    running = []
+
+    def work(event):
+        running.append(pool.stats.pending)
+        return event
+
+    callback = SyncFuncCallback(work, offloader=pool)
+    assert await asyncio.gather(*(callback.execute(n) for n in range(3))) == [0, 1, 2]
+    assert running == [1, 1, 1]
+    assert pool.stats.max_queue_time >= 0
+    pool.shutdown()
+
+    with pytest.raises(ValueError):
+        ThreadOffloader(max_pending=0)
@@ -0,0 +1,80 @@
+import pytest
+
+from vkwave.api import API
+from vkwave.api.token.strategy import LeastInFlightGetTokenStrategy
+from vkwave.bots import BotEvent
+from vkwave.bots.addons.easy import AttachmentAnswer, ProcessCallback, ProcessMessage
+from vkwave.bots.addons.easy.easy_handlers import SimpleAttachment
+from vkwave.bots.core.dispatching.offload import ProcessOffloader
+from vkwave.types.bot_events import get_event_object
+
+from .test_router_index import DummyClient, message_new
+
+
+def describe(message: ProcessMessage):
+    return " ".join(
+        f"{attachment.type}:{bytes(attachment.data).decode()}"
+        for attachment in message.attachments
+    ) or message.text
+
+
+def answer_with_photo(message: ProcessMessage):
+    return AttachmentAnswer("photo1_2", message="photo")
+
+
+class DownloadedCallback(ProcessCallback):
+    async def _download_attachments(self, event):
+        return [("photo", b"cat"), ("doc", b""), ("audio_message", b"meow")]
+
+
+class SentCallback(ProcessCallback):
+    async def _send(self, result, event):
+        return result
+
+
+@pytest.fixture
+def offloader():
+    offloader = ProcessOffloader(max_workers=1)
+    yield offloader
+    offloader.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_callback(offloader):
+    callback = DownloadedCallback(describe, offloader)
+    assert await callback.execute(message_new("hi")) == "photo:cat doc: audio_message:meow"
+
+    callback = ProcessCallback(describe, offloader)
+    assert await callback.execute(message_new("hi")) == "hi"
+    assert offloader.stats.completed == 2
+
+    callback = SentCallback(answer_with_photo, offloader)
+    assert await callback.execute(message_new("hi")) == AttachmentAnswer("photo1_2", "photo")
+
+
+class HTTPClient:
+    async def request_data(self, method: str, url: str) -> bytes:
+        return b"cat"
+
+
+class DownloadClient(DummyClient):
+    http_client = HTTPClient()
+
+
+@pytest.mark.asyncio
+async def test_download_takes_no_token():
+    strategy = LeastInFlightGetTokenStrategy()
+    api = API("token", clients=DownloadClient(), get_token_strategy=strategy)
+    doc = {"id": 1, "owner_id": 1, "title": "cat", "size": 3, "ext": "txt", "url": "https://doc"}
+    message = {"date": 1, "from_id": 1, "id": 1, "out": 0, "peer_id": 1, "text": ""}
+    message["attachments"] = [{"type": "doc", "doc": doc}]
+    raw_event = {
+        "type": "message_new",
+        "object": {"message": message, "client_info": {"lang_id": 0}},
+        "group_id": 1,
+    }
+    event = BotEvent(get_event_object(raw_event), api.get_context())
+
+    attachment = event.object.object.message.attachments[0]
+    assert await SimpleAttachment(attachment, event=event).download() == b"cat"
+    assert strategy.in_flight == {}
@@ -0,0 +1,134 @@
+import re
+
+import pytest
+
+from vkwave.api import API
+from vkwave.bots import BotEvent, DefaultRouter, EventTypeFilter
+from vkwave.bots.core.dispatching.filters.builtin import (
+    CommandsFilter,
+    RegexFilter,
+    TextFilter,
+    TextStartswithFilter,
+)
+from vkwave.bots.core.dispatching.router.router import HANDLER_NOT_FOUND
+from vkwave.types.bot_events import get_event_object
+
+
+class DummyClient:
+    async def close(self):
+        pass
+
+
+def make_event(event_type: str, raw_object: dict) -> BotEvent:
+    raw_event = {"type": event_type, "object": raw_object, "group_id": 1, "event_id": "1"}
+    return BotEvent(get_event_object(raw_event), API("token", clients=DummyClient()).get_context())
+
+
+def message_new(text: str) -> BotEvent:
+    message = {"date": 1, "from_id": 1, "id": 1, "out": 0, "peer_id": 1, "text": text}
+    return make_event("message_new", {"message": message, "client_info": {"lang_id": 0}})
+
+
+def group_join() -> BotEvent:
+    return make_event("group_join", {"user_id": 1, "join_type": "join"})
+
+
+def test_index():
+    router = DefaultRouter()
+    registrar = router.registrar
+    router.register_handler(EventTypeFilter("message_new"), callback="message")
+    router.register_handler(callback="any")
+    router.register_handler(EventTypeFilter(("message_new", "group_join")), callback="both")
+
+    message_handlers = registrar.get_handlers("message_new")
+    assert message_handlers == registrar.handlers
+    assert registrar.get_handlers("group_join") == registrar.handlers[1:]
+    assert registrar.get_handlers("wall_post_new") == registrar.handlers[1:2]
+
+    # registered without `register`
+    handler = registrar.new().with_filters(EventTypeFilter("group_join")).handle("join").ready()
+    registrar.handlers.append(handler)
+    assert registrar.get_handlers("group_join") == registrar.handlers[1:]
+
+
+@pytest.mark.asyncio
+async def test_first_match_order():
+    router = DefaultRouter()
+    router.register_handler(EventTypeFilter("message_new"), TextFilter("hi"), callback="hi")
+    router.register_handler(EventTypeFilter("group_leave"), callback="leave")
+    router.register_handler(lambda event: event.facts.text == "bye", callback="bye")
+    router.register_handler(EventTypeFilter("message_new"), callback="message")
+
+    assert await router.process_event(message_new("hi")) == "hi"
+    assert await router.process_event(message_new("bye")) == "bye"
+    assert await router.process_event(message_new("hello")) == "message"
+    assert await router.process_event(group_join()) is HANDLER_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_text_index():
+    router = DefaultRouter()
+    registrar = router.registrar
+    for number in range(100):
+        router.register_handler(CommandsFilter(f"cmd{number}"), callback=f"cmd{number}")
+    router.register_handler(TextFilter("Hi", ignore_case=False), callback="Hi")
+    router.register_handler(EventTypeFilter("message_new"), callback="message")
+    router.register_handler(TextStartswithFilter("hi"), callback="hi...")
+    router.register_handler(TextFilter(("hi", "hello")), callback="hi")
+
+    event = message_new("Hi there")
+    assert list(registrar.get_event_handlers(event)) == registrar.handlers[-3:-1]
+    event = message_new("hi")
+    assert list(registrar.get_event_handlers(event)) == registrar.handlers[-3:]
+    event = message_new("/CMD42 arg")
+    assert list(registrar.get_event_handlers(event)) == [
+        registrar.handlers[42],
+        registrar.handlers[-3],
+    ]
+    assert await router.process_event(event) == "cmd42"
+    assert await router.process_event(message_new("!cmd7")) == "cmd7"
+    assert await router.process_event(message_new("Hi")) == "Hi"
+    assert await router.process_event(message_new("hello")) == "message"
+    assert list(registrar.get_event_handlers(group_join())) == registrar.get_handlers("group_join")
+
+
+@pytest.mark.asyncio
+async def test_regex_index():
+    router = DefaultRouter()
+    registrar = router.registrar
+    router.register_handler(RegexFilter(r"user#(\d+)$"), callback="user")
+    router.register_handler(RegexFilter(r"(\w)\1"), callback="double")  # isn't combined
+    router.register_handler(RegexFilter(r"USER", re.IGNORECASE), callback="any user")
+    router.register_handler(EventTypeFilter("group_join"), RegexFilter(r"user"), callback="-")
+
+    event = message_new("user#12")
+    assert list(registrar.get_event_handlers(event)) == registrar.handlers[:3]
+    assert await router.process_event(event) == "user"
+    assert event["regex_match"].group(1) == "12"
+    assert await router.process_event(message_new("user#1a")) == "any user"
+    assert await router.process_event(message_new("oops")) == "double"
+    assert await router.process_event(message_new("bye")) is HANDLER_NOT_FOUND
+
+
+def test_index_follows_changes():
+    router = DefaultRouter()
+    registrar = router.registrar
+    router.register_handler(EventTypeFilter("message_new"), callback="message")
+    router.register_handler(EventTypeFilter("group_join"), callback="join")
+    assert registrar.get_handlers("group_join") == registrar.handlers[1:]
+
+    # the same length, but other handlers
+    registrar.handlers.reverse()
+    assert registrar.get_handlers("group_join") == registrar.handlers[:1]
+    leave = registrar.new().with_filters(EventTypeFilter("group_leave")).handle("leave").ready()
+    registrar.handlers[0] = leave
+    assert registrar.get_handlers("group_join") == []
+    assert registrar.get_handlers("group_leave") == [leave]
+
+    # handlers of another registrar are shared
+    other = DefaultRouter().registrar
+    other.handlers = registrar.handlers
+    registrar.handlers.sort(key=lambda handler: handler is leave)
+    assert other.get_handlers("group_leave") == registrar.handlers[1:]
+    other.handlers = []
+    assert other.get_handlers("group_leave") == []
@@ -3,6 +3,7 @@ import pytest
 from vkwave.client.abstract import AbstractAPIClient
 from vkwave.client.context import RequestContext, Signal
 from vkwave.client.factory import AbstractFactory, DefaultFactory
+from vkwave.client.sampling import LogSampler
 from vkwave.client.types import MethodName
 
 
@@ -101,3 +102,11 @@ async def test_signals(client):
 async def test_no_http_client(client):
     with pytest.raises(NotImplementedError):
         client.http_client
+
+
+def test_log_sampler():
+    sampler = LogSampler(rate=3)
+    assert [sampler.sample() for _ in range(6)] == [False, False, True, False, False, True]
+    assert all(LogSampler().sample() for _ in range(3))
+    with pytest.raises(ValueError):
+        LogSampler(rate=0)
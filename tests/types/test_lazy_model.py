@@ -0,0 +1,48 @@
+import pydantic.v1 as pydantic
+import pytest
+
+from vkwave.types.lazy import LazyModel
+from vkwave.types.objects import BaseBoolInt, MessagesMessage
+from vkwave.types.responses import MessagesGetHistoryResponse
+
+RAW_HISTORY = {
+    "response": {
+        "count": 2,
+        "items": [
+            {"date": 1, "from_id": 1, "id": 1, "out": 0, "peer_id": 1, "text": "hi"},
+            {"date": 2, "from_id": 1, "id": "broken", "out": 1, "peer_id": 1, "text": "bye"},
+        ],
+    }
+}
+
+
+def test_fields_are_validated_on_access():
+    history = LazyModel(MessagesGetHistoryResponse, RAW_HISTORY)
+    assert history.response.count == 2
+
+    first, second = history.response.items
+    assert isinstance(first, LazyModel)
+    assert first.out is BaseBoolInt.NO
+    assert second.text == "bye"
+    with pytest.raises(pydantic.ValidationError):
+        second.id  # noqa: B018
+
+
+def test_fields_are_cached():
+    history = LazyModel(MessagesGetHistoryResponse, RAW_HISTORY)
+    assert history.response is history.response
+    assert history.response.items is history.response.items
+
+
+def test_missing_fields():
+    message = LazyModel(MessagesMessage, {"text": "hi"})
+    assert message.action is None
+    with pytest.raises(AttributeError):
+        message.unknown_field  # noqa: B018
+    with pytest.raises(pydantic.ValidationError):
+        LazyModel(MessagesGetHistoryResponse, {}).response  # noqa: B018
+
+
+def test_to_model():
+    message = LazyModel(MessagesMessage, RAW_HISTORY["response"]["items"][0])
+    assert message.to_model() == MessagesMessage(**RAW_HISTORY["response"]["items"][0])
@@ -0,0 +1,143 @@
+import json
+import pathlib
+import typing
+
+import pytest
+from pydantic import v1 as pydantic_v1
+
+from vkwave.types import bot_events, user_events
+from vkwave.types.backend import (
+    NativeModel,
+    TypesBackend,
+    construct_model,
+    get_types_backend,
+    set_types_backend,
+    to_native_model,
+)
+from vkwave.types.objects import (
+    MessagesMessage,
+    MessagesMessageAttachment,
+    MessagesMessageAttachmentType,
+)
+
+RAW_MESSAGE = {
+    "date": 1582576963,
+    "from_id": 578716413,
+    "id": 305,
+    "out": 0,
+    "peer_id": 578716413,
+    "text": "bruh",
+    "fwd_messages": [
+        {
+            "date": 1582576949,
+            "from_id": 578716413,
+            "text": "meh",
+            "attachments": [
+                {"type": "photo", "photo": {"id": 1, "album_id": -3, "owner_id": 1, "date": 1}}
+            ],
+        }
+    ],
+}
+
+
+@pytest.fixture
+def native_backend():
+    backend = get_types_backend()
+    set_types_backend(TypesBackend.PYDANTIC_V2)
+    yield
+    set_types_backend(backend)
+
+
+def test_native_model_is_same():
+    native = to_native_model(MessagesMessage)
+    assert issubclass(native, NativeModel)
+    assert native.model_validate(RAW_MESSAGE).dict() == MessagesMessage(**RAW_MESSAGE).dict()
+    assert to_native_model(MessagesMessage) is native
+
+
+def test_native_bot_event(native_backend):
+    event = bot_events.get_event_object(
+        {
+            "type": "message_new",
+            "object": {"message": RAW_MESSAGE, "client_info": {"lang_id": 0}},
+            "group_id": 123,
+            "event_id": "2a01ffba5838ff2016ae555327fd77c8633bbef6",
+        }
+    )
+    assert isinstance(event, NativeModel)
+    photo = event.object.message.fwd_messages[0].attachments[0].photo
+    assert photo.album_id == -3
+    assert event.object.message.out.value == 0
+
+
+def test_native_user_event_validators(native_backend):
+    event = user_events.get_event_object([2, 1, 3, 2000000001])
+    assert isinstance(event, NativeModel)
+    assert event.object.flags == [
+        user_events.MessageFlag.UNREAD,
+        user_events.MessageFlag.OUTBOX,
+        3,
+    ]
+
+
+@pytest.fixture
+def construct_backend():
+    backend = get_types_backend()
+    set_types_backend(TypesBackend.CONSTRUCT)
+    yield
+    set_types_backend(backend)
+
+
+def test_construct_model_is_same():
+    message = construct_model(MessagesMessage, RAW_MESSAGE)
+    assert message == MessagesMessage(**RAW_MESSAGE)
+    assert message.__fields_set__ == MessagesMessage(**RAW_MESSAGE).__fields_set__
+    attachment = message.fwd_messages[0].attachments[0]
+    assert attachment.type is MessagesMessageAttachmentType.PHOTO
+
+
+def test_construct_model_keeps_explicit_none():
+    class Model(pydantic_v1.BaseModel):
+        count: typing.Optional[int] = 1
+        names: typing.Optional[typing.List[str]] = ["name"]
+
+    model = construct_model(Model, {"count": None, "names": None})
+    assert model == Model(count=None, names=None)
+    assert model.__fields_set__ == {"count", "names"}
+
+
+def fields_sets(model: pydantic_v1.BaseModel) -> typing.Dict[str, typing.Any]:
+    return {
+        name: fields_sets(value) if isinstance(value, pydantic_v1.BaseModel) else None
+        for name, value in model
+        if name in model.__fields_set__
+    }
+
+
+def test_construct_corpus_is_same():
+    path = pathlib.Path(__file__).parents[2] / "benchmarks" / "bot_events.json"
+    for raw_event in json.loads(path.read_text()):
+        parsed = bot_events.get_event_object(raw_event)
+        constructed = construct_model(type(parsed), raw_event)
+        assert constructed.dict() == parsed.dict()
+        assert fields_sets(constructed) == fields_sets(parsed)
+
+
+def test_construct_model_keeps_unknown_enum_values():
+    attachment = construct_model(MessagesMessageAttachment, {"type": "new_type"})
+    assert attachment.type == "new_type"
+
+
+def test_construct_events(construct_backend):
+    event = bot_events.get_event_object(
+        {"type": "group_join", "object": {"user_id": 1, "join_type": "approved"}, "group_id": 1}
+    )
+    assert isinstance(event, bot_events.GroupJoin)
+    assert event.object.join_type.value == "approved"
+
+    event = user_events.get_event_object([2, 1, 3, 2000000001])
+    assert event.object.flags == [
+        user_events.MessageFlag.UNREAD,
+        user_events.MessageFlag.OUTBOX,
+        3,
+    ]
@@ -1,3 +1,13 @@
-from .methods import API, APIOptionsRequestContext
+from .methods import (
+    API,
+    APIOptionsRequestContext,
+    Backoff,
+    ExecuteBatcher,
+    ProfileLoader,
+    RateLimiter,
+    ResponseCache,
+    RetryPolicy,
+    SingleFlight,
+)
 from .token import BotSyncSingleToken, Token
 from .utils.get_all import Fetcher
@@ -1,2 +1,8 @@
 from ._abc import API, APIOptionsRequestContext  # noqa: F401
+from ._batch import ExecuteBatcher  # noqa: F401
+from ._cache import LRUCacheStorage, ResponseCache  # noqa: F401
 from ._error import RETURN_RESULT_ERRORS
+from ._limiter import RateLimiter, TokenBucket  # noqa: F401
+from ._loader import ProfileLoader, ProfileNotFound  # noqa: F401
+from ._retry import Backoff, RetryPolicy  # noqa: F401
+from ._single_flight import SingleFlight  # noqa: F401
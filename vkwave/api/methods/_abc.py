@@ -1,17 +1,25 @@
 import copy
 import random
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, List, Optional, Tuple, Union, cast
 
 from vkwave import __api_version__
 from vkwave.api.methods._error import Error, ErrorDispatcher, UnsuccessAPIRequestException
 from vkwave.api.token.strategy import ABCGetTokenStrategy, RandomGetTokenStrategy
-from vkwave.api.token.token import AnyABCToken, Token
+from vkwave.api.token.token import AnyABCToken, Token, TokenType
 from vkwave.client import AIOHTTPClient
 from vkwave.client.abstract import AbstractAPIClient
 from vkwave.client.context import ResultState
 from vkwave.client.types import MethodName
 
+from ._batch import ExecuteBatcher
+from ._cache import ResponseCache, make_request_key
+from ._category import LazyCategory
+from ._limiter import RateLimiter, get_tokens_type
+from ._loader import ProfileLoader
+from ._retry import Backoff, RetryPolicy
+from ._single_flight import SingleFlight
 from .account import Account
 from .ads import Ads
 from .app_widgets import AppWidgets
@@ -65,12 +73,28 @@ class APIOptions:
         get_token_strategy: ABCGetTokenStrategy,
         api_version: str,
         error_dispatcher: ErrorDispatcher,
+        execute_batcher: Optional[ExecuteBatcher] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        profile_loader: Optional[ProfileLoader] = None,
+        lazy_responses: bool = False,
     ):
         self.tokens = tokens if isinstance(tokens, list) else [tokens]
         self.clients = clients if isinstance(clients, list) else [clients]
         self.get_token_strategy = get_token_strategy
         self.api_version: str = api_version
         self.error_dispatcher = error_dispatcher
+        self.execute_batcher = execute_batcher
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.response_cache = response_cache
+        self.single_flight = single_flight
+        self.profile_loader = profile_loader
+        self.lazy_responses = lazy_responses
+        # type of raw string tokens, they are bot's tokens by default
+        self.token_type: Optional[TokenType] = None
 
     def add_token(self, tokens: TokensInput):
         self.tokens.extend(tokens if isinstance(tokens, list) else [tokens])
@@ -87,55 +111,82 @@ class APIOptions:
     async def get_client_and_token(self) -> Tuple[AbstractAPIClient, Token]:
         return self.get_client(), await self.get_token()
 
+    def release_token(self, token: Token, result: Optional[dict]) -> None:
+        error_code = None
+        if result is not None and "error" in result:
+            error_code = result["error"].get("error_code")
+        self.get_token_strategy.release_token(token, error_code)
+
+    async def wait_for_rate_limit(self, token: Token) -> None:
+        if self.rate_limiter is not None:
+            token_type = get_tokens_type(self.tokens, self.token_type or TokenType.BOT)
+            await self.rate_limiter.acquire(token, token_type)
+
     def update_pre_request_params(self, params: dict, token: Token) -> dict:
         params.update(v=self.api_version, access_token=token)
         return params
 
 
 class APIOptionsRequestContext:
+    account = LazyCategory(Account, "account")
+    ads = LazyCategory(Ads, "ads")
+    app_widgets = LazyCategory(AppWidgets, "appWidgets")
+    apps = LazyCategory(Apps, "apps")
+    audio = LazyCategory(Audio, "audio")
+    auth = LazyCategory(Auth, "auth")
+    board = LazyCategory(Board, "board")
+    donut = LazyCategory(Donut, "donut")
+    database = LazyCategory(Database, "database")
+    docs = LazyCategory(Docs, "docs")
+    execute = LazyCategory(Execute, "execute")
+    fave = LazyCategory(Fave, "fave")
+    friends = LazyCategory(Friends, "friends")
+    gifts = LazyCategory(Gifts, "gifts")
+    groups = LazyCategory(Groups, "groups")
+    lead_forms = LazyCategory(LeadForms, "leadForms")
+    likes = LazyCategory(Likes, "likes")
+    market = LazyCategory(Market, "market")
+    money = LazyCategory(Money, "money")
+    messages = LazyCategory(Messages, "messages")
+    newsfeed = LazyCategory(Newsfeed, "newsfeed")
+    notes = LazyCategory(Notes, "notes")
+    notifications = LazyCategory(Notifications, "notifications")
+    orders = LazyCategory(Orders, "orders")
+    pages = LazyCategory(Pages, "pages")
+    photos = LazyCategory(Photos, "photos")
+    polls = LazyCategory(Polls, "polls")
+    pretty_cards = LazyCategory(PrettyCards, "prettyCards")
+    search = LazyCategory(Search, "search")
+    secure = LazyCategory(Secure, "secure")
+    stats = LazyCategory(Stats, "stats")
+    status = LazyCategory(Status, "status")
+    storage = LazyCategory(Storage, "storage")
+    stories = LazyCategory(Stories, "stories")
+    streaming = LazyCategory(Streaming, "streaming")
+    users = LazyCategory(Users, "users")
+    utils = LazyCategory(Utils, "utils")
+    video = LazyCategory(Video, "video")
+    wall = LazyCategory(Wall, "wall")
+    widgets = LazyCategory(Widgets, "widgets")
+
     def __init__(self, api_options: APIOptions):
         self.api_options = api_options
-
-        self.account = Account("account", self)
-        self.ads = Ads("ads", self)
-        self.app_widgets = AppWidgets("appWidgets", self)
-        self.apps = Apps("apps", self)
-        self.audio = Audio("audio", self)
-        self.auth = Auth("auth", self)
-        self.board = Board("board", self)
-        self.donut = Donut("donut", self)
-        self.database = Database("database", self)
-        self.docs = Docs("docs", self)
-        self.execute = Execute("execute", self)
-        self.fave = Fave("fave", self)
-        self.friends = Friends("friends", self)
-        self.gifts = Gifts("gifts", self)
-        self.groups = Groups("groups", self)
-        self.lead_forms = LeadForms("leadForms", self)
-        self.likes = Likes("likes", self)
-        self.market = Market("market", self)
-        self.money = Money("money", self)
-        self.messages = Messages("messages", self)
-        self.newsfeed = Newsfeed("newsfeed", self)
-        self.notes = Notes("notes", self)
-        self.notifications = Notifications("notifications", self)
-        self.orders = Orders("orders", self)
-        self.pages = Pages("pages", self)
-        self.photos = Photos("photos", self)
-        self.polls = Polls("polls", self)
-        self.pretty_cards = PrettyCards("prettyCards", self)
-        self.search = Search("search", self)
-        self.secure = Secure("secure", self)
-        self.stats = Stats("stats", self)
-        self.status = Status("status", self)
-        self.storage = Storage("storage", self)
-        self.stories = Stories("stories", self)
-        self.streaming = Streaming("streaming", self)
-        self.users = Users("users", self)
-        self.utils = Utils("utils", self)
-        self.video = Video("video", self)
-        self.wall = Wall("wall", self)
-        self.widgets = Widgets("widgets", self)
+        self._lazy_context: Optional[APIOptionsRequestContext] = None
+
+    def lazy(self) -> "APIOptionsRequestContext":
+        """
+        Context whose typed results are lazy models: fields are validated on first access.
+
+        >>> history = await api.get_context().lazy().messages.get_history(peer_id=1)
+        >>> history.response.count  # messages aren't validated
+        """
+        if self.api_options.lazy_responses:
+            return self
+        if self._lazy_context is None:
+            copied = copy.copy(self.api_options)
+            copied.lazy_responses = True
+            self._lazy_context = APIOptionsRequestContext(copied)
+        return self._lazy_context
 
     async def handle_error(self, error: Error) -> Optional[dict]:
         dispatcher = self.api_options.error_dispatcher
@@ -148,7 +199,10 @@ class APIOptionsRequestContext:
     async def sync_token(self) -> AsyncGenerator["APIOptionsRequestContext", None]:
         """Grab random token and work only with it"""
         copied = copy.copy(self.api_options)
-        copied.tokens = [random.choice(await copied.get_token())]
+        token = await copied.get_token()
+        # nothing is sent with it here, requests of the context are counted by strategy themselves
+        copied.release_token(token, None)
+        copied.tokens = [token]
         new = APIOptionsRequestContext(copied)
         yield new
         del copied
@@ -156,10 +210,97 @@ class APIOptionsRequestContext:
 
     async def api_request(self, method_name: Union[str, MethodName], params: dict) -> dict:
         method_name = cast(MethodName, method_name)
+        retry_policy = self.api_options.retry_policy
+        if retry_policy is None:
+            result = await self._api_request_once(method_name, params)
+            return await self.process_result(result, params)
+
+        retry_policy.prepare_params(method_name, params)
+        attempt = 0
+        while True:
+            backoff: Optional[Backoff]
+            try:
+                result = await self._api_request_once(method_name, params, attempt)
+            except Exception as exc:
+                backoff = retry_policy.get_exception_backoff(exc, attempt)
+                if backoff is None:
+                    raise
+            else:
+                backoff = retry_policy.get_result_backoff(result, attempt)
+                if backoff is None:
+                    return await self.process_result(result, params)
+            await retry_policy.wait(method_name, backoff, attempt)
+            attempt += 1
+
+    async def _api_request_once(
+        self, method_name: MethodName, params: dict, attempt: int = 0
+    ) -> dict:
         client, token = await self.api_options.get_client_and_token()
 
+        result: Optional[dict] = None
+        try:
+            result = await self._get_result(client, token, method_name, params, attempt)
+        finally:
+            self.api_options.release_token(token, result)
+        return cast(dict, result)
+
+    async def _get_result(
+        self,
+        client: AbstractAPIClient,
+        token: Token,
+        method_name: MethodName,
+        params: dict,
+        attempt: int,
+    ) -> dict:
+        cache = self.api_options.response_cache
+        if cache is not None and not cache.is_cached(method_name):
+            cache = None
+        single_flight = self.api_options.single_flight
+        if single_flight is not None and not single_flight.is_shared(method_name):
+            single_flight = None
+
+        key = ""
+        if cache is not None or single_flight is not None:
+            key = make_request_key(method_name, params, token)
+
+        if cache is not None:
+            cached = await cache.get(key)
+            if cached is not None:
+                return cached
+
+        if single_flight is not None:
+            result = await single_flight.do(
+                key, lambda: self._send(client, token, method_name, params, attempt)
+            )
+        else:
+            result = await self._send(client, token, method_name, params, attempt)
+
+        if cache is not None:
+            await cache.put(key, method_name, result)
+        return result
+
+    async def _send(
+        self,
+        client: AbstractAPIClient,
+        token: Token,
+        method_name: MethodName,
+        params: dict,
+        attempt: int,
+    ) -> dict:
+        batcher = self.api_options.execute_batcher
+        if batcher is not None and batcher.is_batchable(method_name):
+            return await batcher.add(self, method_name, params, token)
+
+        await self.api_options.wait_for_rate_limit(token)
         params = self.api_options.update_pre_request_params(params, token)
+        return await self.send_request(client, method_name, params, attempt)
+
+    async def send_request(
+        self, client: AbstractAPIClient, method_name: MethodName, params: dict, attempt: int = 0
+    ) -> dict:
+        """Send request and return raw result without running error handlers"""
         ctx = client.create_request(method_name, params)
+        ctx.attempt = attempt
         await ctx.send_request()
 
         state = ctx.result.state
@@ -181,11 +322,13 @@ class APIOptionsRequestContext:
 
         result = data or exc_data
         result = cast(dict, result)
+        return result
 
+    async def process_result(self, result: dict, params: dict) -> dict:
         if "error" in result or "execute_errors" in result:
             if "execute_errors" in result:
                 result["request_params"] = params
-                del result["request_params"]["access_token"]
+                result["request_params"].pop("access_token", None)
             err_handler_result = await self.handle_error(Error(result))
             if err_handler_result:
                 result = err_handler_result
@@ -201,6 +344,14 @@ class API:
         get_token_strategy: Optional[ABCGetTokenStrategy] = None,
         api_version: Optional[str] = None,
         error_dispatcher: Optional[ErrorDispatcher] = None,
+        max_cached_contexts: int = 1024,
+        execute_batcher: Optional[ExecuteBatcher] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        profile_loader: Optional[ProfileLoader] = None,
+        lazy_responses: bool = False,
     ):
         self.default_api_options = APIOptions(
             tokens,
@@ -208,16 +359,65 @@ class API:
             get_token_strategy or RandomGetTokenStrategy(),
             api_version or __api_version__,
             error_dispatcher or ErrorDispatcher(),
+            execute_batcher,
+            rate_limiter,
+            retry_policy,
+            response_cache,
+            single_flight,
+            profile_loader,
+            lazy_responses,
         )
+        self.max_cached_contexts = max_cached_contexts
+        self._default_context: Optional[APIOptionsRequestContext] = None
+        self._token_contexts: "OrderedDict[AnyABCToken, APIOptionsRequestContext]" = OrderedDict()
 
     def get_context(self) -> APIOptionsRequestContext:
-        return APIOptionsRequestContext(self.default_api_options)
-
-    def with_token(self, token: AnyABCToken) -> APIOptionsRequestContext:
-        copied = copy.copy(self.default_api_options)
+        if self._default_context is None:
+            self._default_context = APIOptionsRequestContext(self.default_api_options)
+        return self._default_context
+
+    def with_token(
+        self, token: AnyABCToken, token_type: Optional[TokenType] = None
+    ) -> APIOptionsRequestContext:
+        """
+        Context bound to one token. Contexts are cached per token (least recently used
+        ones are evicted after `max_cached_contexts`), so the same context is reused
+        for every event of the same group or user.
+
+        :param token_type: type of raw string token (e.g. for rate limits),
+            type of default tokens by default
+        """
+        try:
+            ctx = self._token_contexts.get(token)
+        except TypeError:  # unhashable token
+            return self._create_token_context(token, token_type)
+
+        if ctx is not None:
+            self._token_contexts.move_to_end(token)
+            return ctx
+
+        ctx = self._create_token_context(token, token_type)
+        self._token_contexts[token] = ctx
+        if len(self._token_contexts) > self.max_cached_contexts:
+            self._token_contexts.popitem(last=False)
+        return ctx
+
+    def _create_token_context(
+        self, token: AnyABCToken, token_type: Optional[TokenType]
+    ) -> APIOptionsRequestContext:
+        options = self.default_api_options
+        copied = copy.copy(options)
         copied.tokens = [token]
+        copied.token_type = token_type or get_tokens_type(
+            options.tokens, options.token_type or TokenType.BOT
+        )
         return APIOptionsRequestContext(copied)
 
+    def clear_contexts_cache(self) -> None:
+        """Drop cached contexts. Call it after changing `default_api_options`."""
+        self._default_context = None
+        self._token_contexts.clear()
+
     def with_options(self, options: APIOptions) -> APIOptionsRequestContext:
         return APIOptionsRequestContext(options)
 
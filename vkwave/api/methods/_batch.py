@@ -0,0 +1,186 @@
+import asyncio
+import json
+import typing
+from enum import Enum
+
+from vkwave.api.token.token import Token
+from vkwave.client.types import MethodName
+
+if typing.TYPE_CHECKING:
+    from ._abc import APIOptionsRequestContext
+
+# VK allows only 25 API calls inside one `execute`
+MAX_EXECUTE_CALLS = 25
+
+
+def _vkscript_default(value: typing.Any) -> typing.Any:
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+class _BatchedCall(typing.NamedTuple):
+    method_name: MethodName
+    params: dict
+    future: "asyncio.Future[dict]"
+
+
+class _Batch:
+    def __init__(
+        self,
+        ctx: "APIOptionsRequestContext",
+        calls: typing.Optional[typing.List[_BatchedCall]] = None,
+    ):
+        self.ctx = ctx
+        self.calls: typing.List[_BatchedCall] = calls or []
+        self.timer: typing.Optional[asyncio.TimerHandle] = None
+
+
+class ExecuteBatcher:
+    """
+    Collects API calls made concurrently with the same token and sends them as one `execute`.
+    Every caller gets its own result (or error) back, as if the request was sent alone.
+
+    >>> api = API(tokens=..., execute_batcher=ExecuteBatcher(delay=0.05))
+    """
+
+    def __init__(
+        self,
+        delay: float = 0.01,
+        max_calls: int = MAX_EXECUTE_CALLS,
+        exclude: typing.Optional[typing.Iterable[str]] = None,
+    ):
+        """
+        :param delay: how long (in seconds) to wait for other calls before sending a batch
+        :param max_calls: batch is sent at once when it has that many calls (25 at most)
+        :param exclude: methods that are always sent alone
+        """
+        if not 0 < max_calls <= MAX_EXECUTE_CALLS:
+            raise ValueError(f"max_calls must be in range 1..{MAX_EXECUTE_CALLS}")
+        self.delay = delay
+        self.max_calls = max_calls
+        self.exclude: typing.Set[str] = set(exclude or ())
+        self._batches: typing.Dict[Token, _Batch] = {}
+        # the loop keeps only weak references to tasks
+        self._flushes: typing.Set["asyncio.Task[None]"] = set()
+
+    def is_batchable(self, method_name: MethodName) -> bool:
+        return not method_name.startswith("execute") and method_name not in self.exclude
+
+    async def add(
+        self,
+        ctx: "APIOptionsRequestContext",
+        method_name: MethodName,
+        params: dict,
+        token: Token,
+    ) -> dict:
+        """Add call to the token's batch and wait for its own result."""
+        loop = asyncio.get_running_loop()
+        batch = self._batches.get(token)
+        if batch is None:
+            batch = self._batches[token] = _Batch(ctx)
+            batch.timer = loop.call_later(self.delay, self._flush_soon, token)
+
+        future: "asyncio.Future[dict]" = loop.create_future()
+        batch.calls.append(_BatchedCall(method_name, params, future))
+        if len(batch.calls) >= self.max_calls:
+            self._flush_soon(token)
+        return await future
+
+    def _flush_soon(self, token: Token) -> None:
+        batch = self._batches.pop(token, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.get_running_loop().create_task(self._flush(batch, token))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    @staticmethod
+    def build_code(calls: typing.Sequence[_BatchedCall]) -> str:
+        requests = ",".join(
+            f"API.{call.method_name}({json.dumps(call.params, default=_vkscript_default)})"
+            for call in calls
+        )
+        return f"return [{requests}];"
+
+    async def _flush(self, batch: _Batch, token: Token) -> None:
+        try:
+            await self._send(batch, token)
+        except BaseException as exc:
+            # callers must not wait forever, whatever happened
+            for call in batch.calls:
+                if not call.future.done():
+                    call.future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+
+    async def _send(self, batch: _Batch, token: Token) -> None:
+        calls = batch.calls
+        api_options = batch.ctx.api_options
+        if len(calls) == 1:
+            # there is nothing to merge, so don't pay for the `execute` wrapper
+            method_name, params = calls[0].method_name, calls[0].params
+        else:
+            method_name, params = MethodName("execute"), {"code": self.build_code(calls)}
+
+        await api_options.wait_for_rate_limit(token)
+        request_params = api_options.update_pre_request_params(params, token)
+        client = api_options.get_client()
+        result = await batch.ctx.send_request(client, method_name, request_params)
+
+        for call in self._resolve(calls, result):
+            # it's unknown whether its `false` is a result or an error, so it's sent alone
+            await self._send(_Batch(batch.ctx, [call]), token)
+
+    @staticmethod
+    def _resolve(calls: typing.List[_BatchedCall], result: dict) -> typing.List[_BatchedCall]:
+        """Set results of calls. Return calls whose results are ambiguous."""
+        if len(calls) == 1 or "error" in result:
+            # single request or failed `execute` itself: every caller handles the same error
+            for call in calls:
+                if not call.future.done():
+                    call.future.set_result(result)
+            return []
+
+        responses = result.get("response") or []
+        # failed calls are `false` in response, their errors are listed in order without indexes
+        errors: typing.Dict[str, typing.List[dict]] = {}
+        for error in result.get("execute_errors") or []:
+            errors.setdefault(error.get("method"), []).append(error)
+        falses: typing.Dict[str, typing.List[_BatchedCall]] = {}
+        for index, call in enumerate(calls):
+            if index >= len(responses):
+                _set_error(call, {"error_code": 1, "error_msg": "Unknown error occurred"})
+                continue
+            response = responses[index]
+            if response is False:
+                falses.setdefault(call.method_name, []).append(call)
+            elif not call.future.done():
+                call.future.set_result({"response": response})
+
+        ambiguous: typing.List[_BatchedCall] = []
+        for method_name, method_calls in falses.items():
+            method_errors = errors.get(method_name, [])
+            if not method_errors:
+                # nothing of the method failed, e.g. `groups.isMember` returned `false`
+                for call in method_calls:
+                    if not call.future.done():
+                        call.future.set_result({"response": False})
+            elif len(method_errors) >= len(method_calls):
+                for call, error in zip(method_calls, method_errors):
+                    _set_error(call, error)
+            else:
+                ambiguous.extend(call for call in method_calls if not call.future.done())
+        return ambiguous
+
+
+def _set_error(call: _BatchedCall, error: dict) -> None:
+    if call.future.done():
+        return
+    error = dict(error)
+    error["request_params"] = [
+        {"key": key, "value": str(value)} for key, value in call.params.items()
+    ]
+    call.future.set_result({"error": error})
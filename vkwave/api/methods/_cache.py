@@ -0,0 +1,112 @@
+import copy
+import hashlib
+import json
+import time
+import typing
+from collections import OrderedDict
+
+from vkwave.api.token.token import Token
+from vkwave.client.types import MethodName
+
+# methods that return (almost) static data and their default TTL in seconds
+DEFAULT_CACHE_TTLS: typing.Dict[str, float] = {
+    "users.get": 300,
+    "groups.getById": 300,
+    "messages.getConversationsById": 60,
+    "utils.resolveScreenName": 3600,
+    "database.getCities": 86400,
+    "database.getCountries": 86400,
+}
+
+# params added to every request, they don't make results different
+_SKIPPED_PARAMS = ("access_token", "v")
+
+
+def make_request_key(method_name: MethodName, params: dict, token: Token) -> str:
+    """Key of request. It contains hash of the token instead of the token itself."""
+    token_hash = hashlib.sha1(token.encode()).hexdigest()[:16]
+    key_params = {k: v for k, v in params.items() if k not in _SKIPPED_PARAMS}
+    dumped = json.dumps(key_params, sort_keys=True, default=str)
+    return f"vkwave:api:{token_hash}:{method_name}:{dumped}"
+
+
+class LRUCacheStorage:
+    """
+    In-process storage with expiration and bounded size (least recently used keys are dropped).
+    Like `TTLStorage` from `vkwave.bots.storage`, keys with negative TTL never expire.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self.data: "OrderedDict[str, typing.Tuple[typing.Any, float]]" = OrderedDict()
+
+    async def get(self, key: str, default: typing.Any = None) -> typing.Any:
+        item = self.data.get(key)
+        if item is None:
+            return default
+        value, expire = item
+        if expire < time.monotonic():
+            del self.data[key]
+            return default
+        self.data.move_to_end(key)
+        return value
+
+    async def put(self, key: str, value: typing.Any, ttl: float) -> None:
+        expire = float("inf") if ttl < 0 else time.monotonic() + ttl
+        self.data[key] = (value, expire)
+        self.data.move_to_end(key)
+        if len(self.data) > self.max_size:
+            self.data.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+    async def contains(self, key: str) -> bool:
+        return await self.get(key) is not None
+
+
+class ResponseCache:
+    """
+    Read-through cache of responses.
+    Cached calls don't send requests and don't wait for rate limit.
+    Keys include hash of the token, so different groups (users) don't share results.
+    Every caller gets its own copy of cached response.
+
+    >>> cache = ResponseCache({"users.get": 60}, storage=TTLStorage())
+    >>> api = API(tokens=..., response_cache=cache)
+    """
+
+    def __init__(
+        self,
+        ttls: typing.Optional[typing.Dict[str, float]] = None,
+        storage: typing.Any = None,
+        max_size: int = 10000,
+    ):
+        """
+        :param ttls: methods to cache and their TTL in seconds (default ones if not passed)
+        :param storage: any storage with `AbstractExpiredStorage` interface
+            (in-process LRU by default)
+        :param max_size: max count of responses in the default storage
+        """
+        self.ttls: typing.Dict[str, float] = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.storage = storage if storage is not None else LRUCacheStorage(max_size)
+        self.hits = 0
+        self.misses = 0
+
+    def is_cached(self, method_name: MethodName) -> bool:
+        return method_name in self.ttls
+
+    async def get(self, key: str) -> typing.Optional[dict]:
+        result = await self.storage.get(key, None)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # callers may change responses, the cached one must stay as is
+        return copy.deepcopy(result)
+
+    async def put(self, key: str, method_name: MethodName, result: dict) -> None:
+        if "error" in result or "execute_errors" in result:
+            return
+        # the caller gets `result` itself, so a copy is cached
+        await self.storage.put(key, copy.deepcopy(result), self.ttls[method_name])
@@ -1,10 +1,15 @@
 import typing
 
 from vkwave.client.types import MethodName
+from vkwave.types.backend import parse_model
+from vkwave.types.lazy import LazyModel
 
 if typing.TYPE_CHECKING:
     from ._abc import APIOptionsRequestContext
 
+C = typing.TypeVar("C", bound="Category")
+R = typing.TypeVar("R")
+
 
 class TemporaryException(Exception):
     """It means nothing."""
@@ -20,3 +25,41 @@ class Category:
 
     async def api_request(self, method_name: str, params: dict) -> dict:
         return await self.__api.api_request(self.make_method_name(method_name), params)
+
+    def parse_response(self, model: typing.Type[R], raw_result: dict) -> R:
+        if self.__api.api_options.lazy_responses:
+            return LazyModel(model, raw_result)  # type: ignore
+        return parse_model(model, raw_result)  # type: ignore
+
+
+class LazyCategory(typing.Generic[C]):
+    """
+    Category that is built on first access and then stored in the instance's `__dict__`,
+    so next lookups don't touch the descriptor at all.
+
+    >>> class Context:
+    ...     messages = LazyCategory(Messages, "messages")
+    """
+
+    def __init__(self, category: typing.Type[C], name: str):
+        self.category = category
+        self.name = name
+        self.attr_name = name
+
+    def __set_name__(self, owner: type, attr_name: str) -> None:
+        self.attr_name = attr_name
+
+    @typing.overload
+    def __get__(self, instance: None, owner: type) -> "LazyCategory[C]":
+        ...
+
+    @typing.overload
+    def __get__(self, instance: "APIOptionsRequestContext", owner: type) -> C:
+        ...
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        category = self.category(self.name, instance)
+        instance.__dict__[self.attr_name] = category
+        return category
@@ -0,0 +1,107 @@
+import asyncio
+import time
+import typing
+
+from vkwave.api.token.token import AnyABCToken, Token, TokenType
+
+# requests per second allowed by VK
+DEFAULT_RATE_LIMITS: typing.Dict[TokenType, float] = {TokenType.BOT: 20, TokenType.USER: 3}
+
+
+def get_tokens_type(
+    tokens: typing.List[AnyABCToken], default: TokenType = TokenType.BOT
+) -> TokenType:
+    """Type of tokens in options. Raw string tokens are considered as tokens of `default` type."""
+    for token in tokens:
+        return getattr(token, "typeof", default)
+    return default
+
+
+class TokenBucket:
+    """
+    Token bucket: it's refilled with `rate` units per second and holds `capacity` units at most.
+    Waiters are served in order of their arrival.
+
+    With the default capacity of 1 unit, requests are spaced by `1 / rate` seconds, so any second
+    has `rate` requests at most. Bigger capacity allows bursts: a full bucket lets `capacity`
+    requests through at once and it's refilled while they are spent.
+    """
+
+    def __init__(self, rate: float, capacity: typing.Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        capacity = 1 if capacity is None else capacity
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._level = self.capacity
+        self._updated = time.monotonic()
+        self._lock: typing.Optional[asyncio.Lock] = None
+        self.waiting = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def level(self) -> float:
+        """Units available right now"""
+        self._refill()
+        return self._level
+
+    async def acquire(self) -> None:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        self.waiting += 1
+        try:
+            # asyncio.Lock wakes up waiters in FIFO order, so requests are queued fairly
+            async with self._lock:
+                self._refill()
+                while self._level < 1:
+                    await asyncio.sleep((1 - self._level) / self.rate)
+                    self._refill()
+                self._level -= 1
+        finally:
+            self.waiting -= 1
+
+
+class RateLimiter:
+    """
+    Per token requests limiter. Requests wait for their turn instead of failing with error 6.
+
+    >>> limiter = RateLimiter({TokenType.BOT: 20, TokenType.USER: 3})
+    >>> limiter.set_token_limit(Token("..."), 5)
+    >>> api = API(tokens=..., rate_limiter=limiter)
+    """
+
+    def __init__(self, limits: typing.Optional[typing.Dict[TokenType, float]] = None):
+        self.limits: typing.Dict[TokenType, float] = {**DEFAULT_RATE_LIMITS, **(limits or {})}
+        self.token_limits: typing.Dict[Token, typing.Tuple[float, typing.Optional[float]]] = {}
+        self.buckets: typing.Dict[Token, TokenBucket] = {}
+
+    def set_token_limit(
+        self, token: Token, rate: float, capacity: typing.Optional[float] = None
+    ) -> None:
+        self.token_limits[token] = (rate, capacity)
+        self.buckets.pop(token, None)
+
+    def get_bucket(self, token: Token, token_type: TokenType = TokenType.BOT) -> TokenBucket:
+        bucket = self.buckets.get(token)
+        if bucket is None:
+            rate, capacity = self.token_limits.get(token, (self.limits[token_type], None))
+            bucket = self.buckets[token] = TokenBucket(rate, capacity)
+        return bucket
+
+    async def acquire(self, token: Token, token_type: TokenType = TokenType.BOT) -> None:
+        await self.get_bucket(token, token_type).acquire()
+
+    def levels(self) -> typing.Dict[Token, float]:
+        """Available requests of every known token (for monitoring)"""
+        return {token: bucket.level for token, bucket in self.buckets.items()}
+
+    def waiting(self) -> typing.Dict[Token, int]:
+        """Count of requests waiting for every known token (for monitoring)"""
+        return {token: bucket.waiting for token, bucket in self.buckets.items()}
@@ -0,0 +1,180 @@
+import asyncio
+import json
+import typing
+from weakref import WeakKeyDictionary
+
+from vkwave.client.types import MethodName
+
+from ._cache import LRUCacheStorage
+from ._error import APIError
+from ._utils import dump_param
+
+if typing.TYPE_CHECKING:
+    from ._abc import APIOptionsRequestContext
+
+# max count of ids in one request
+MAX_USER_IDS = 1000
+MAX_GROUP_IDS = 500
+
+_IDS_PARAMS: typing.Dict[str, typing.Tuple[str, int]] = {
+    "users.get": ("user_ids", MAX_USER_IDS),
+    "groups.getById": ("group_ids", MAX_GROUP_IDS),
+}
+
+
+class ProfileNotFound(LookupError):
+    """VK didn't return profile with requested id"""
+
+
+class _Batch:
+    def __init__(self, ctx: "APIOptionsRequestContext", method_name: MethodName, params: dict):
+        self.ctx = ctx
+        self.method_name = method_name
+        self.params = params
+        self.waiters: typing.Dict[int, typing.List["asyncio.Future[dict]"]] = {}
+
+
+def _split_batch(
+    batch: _Batch, id_: int, futures: typing.List["asyncio.Future[dict]"]
+) -> _Batch:
+    single = _Batch(batch.ctx, batch.method_name, batch.params)
+    single.waiters[id_] = futures
+    return single
+
+
+class _ContextProfileLoader:
+    # it mustn't refer to the context: it's a value of WeakKeyDictionary with contexts as keys
+    def __init__(self, loader: "ProfileLoader"):
+        self.loader = loader
+        self.cache = LRUCacheStorage(loader.cache_size)
+        self.batches: typing.Dict[str, _Batch] = {}
+        # the loop keeps only weak references to tasks
+        self.flushes: typing.Set["asyncio.Task[None]"] = set()
+
+    async def load(
+        self, ctx: "APIOptionsRequestContext", method_name: MethodName, id_: int, params: dict
+    ) -> dict:
+        params = {key: dump_param(value) for key, value in params.items() if value is not None}
+        params_key = json.dumps(params, sort_keys=True)
+        cache_key = f"{method_name}:{params_key}:{id_}"
+
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        batch_key = f"{method_name}:{params_key}"
+        batch = self.batches.get(batch_key)
+        if batch is None:
+            batch = self.batches[batch_key] = _Batch(ctx, method_name, params)
+            if self.loader.delay:
+                loop.call_later(self.loader.delay, self._flush_soon, batch_key, batch)
+            else:
+                loop.call_soon(self._flush_soon, batch_key, batch)
+
+        future: "asyncio.Future[dict]" = loop.create_future()
+        batch.waiters.setdefault(id_, []).append(future)
+        if len(batch.waiters) >= _IDS_PARAMS[method_name][1]:
+            self._flush_soon(batch_key, batch)
+        return await future
+
+    def _flush_soon(self, batch_key: str, batch: _Batch) -> None:
+        if self.batches.get(batch_key) is not batch:
+            return  # already sent
+        del self.batches[batch_key]
+        task = asyncio.get_running_loop().create_task(self._flush(batch))
+        self.flushes.add(task)
+        task.add_done_callback(self.flushes.discard)
+
+    async def _flush(self, batch: _Batch) -> None:
+        try:
+            await self._load(batch)
+        except BaseException as exc:
+            # callers must not wait forever, whatever happened
+            for futures in batch.waiters.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+
+    async def _load(self, batch: _Batch) -> None:
+        ids_param, _ = _IDS_PARAMS[batch.method_name]
+        params = {ids_param: ",".join(str(id_) for id_ in batch.waiters), **batch.params}
+        try:
+            result = await batch.ctx.api_request(batch.method_name, params)
+        except APIError:
+            if len(batch.waiters) == 1:
+                raise
+            # e.g. one invalid id fails the whole request, so ids are loaded one by one
+            await asyncio.gather(
+                *(
+                    self._flush(_split_batch(batch, id_, futures))
+                    for id_, futures in batch.waiters.items()
+                )
+            )
+            return
+
+        items = result["response"]
+        if isinstance(items, dict):  # groups.getById since 5.194
+            items = items.get("groups", [])
+        profiles = {item["id"]: item for item in items}
+
+        params_key = json.dumps(batch.params, sort_keys=True)
+        for id_, futures in batch.waiters.items():
+            profile = profiles.get(id_)
+            if profile is not None:
+                await self.cache.put(
+                    f"{batch.method_name}:{params_key}:{id_}", profile, self.loader.ttl
+                )
+            for future in futures:
+                if future.done():
+                    continue
+                if profile is None:
+                    future.set_exception(ProfileNotFound(f"{batch.method_name}: {id_}"))
+                else:
+                    future.set_result(profile)
+
+
+class ProfileLoader:
+    """
+    Collects users (groups) lookups made within one loop iteration (or `delay`) and loads them
+    with one `users.get` (`groups.getById`) request. Loaded profiles are cached for `ttl` seconds.
+
+    >>> loader = ProfileLoader()
+    >>> api = API(tokens=..., profile_loader=loader)
+    >>> user = await loader.load_user(api.get_context(), 1, fields=["sex"])
+    """
+
+    def __init__(self, delay: float = 0.0, cache_size: int = 10000, ttl: float = 300.0):
+        """
+        :param delay: how long (in seconds) to wait for other lookups. 0 means one loop iteration
+        :param cache_size: max count of cached profiles of every token
+        :param ttl: how long (in seconds) profiles are cached
+        """
+        self.delay = delay
+        self.cache_size = cache_size
+        self.ttl = ttl
+        self._loaders: "WeakKeyDictionary[APIOptionsRequestContext, _ContextProfileLoader]" = (
+            WeakKeyDictionary()
+        )
+
+    def _get_loader(self, ctx: "APIOptionsRequestContext") -> _ContextProfileLoader:
+        loader = self._loaders.get(ctx)
+        if loader is None:
+            loader = self._loaders[ctx] = _ContextProfileLoader(self)
+        return loader
+
+    async def load_user(
+        self, ctx: "APIOptionsRequestContext", user_id: int, **params: typing.Any
+    ) -> dict:
+        """Raw user object. `params` are the other params of `users.get`"""
+        return await self._get_loader(ctx).load(ctx, MethodName("users.get"), user_id, params)
+
+    async def load_group(
+        self, ctx: "APIOptionsRequestContext", group_id: int, **params: typing.Any
+    ) -> dict:
+        """Raw group object. `params` are the other params of `groups.getById`"""
+        return await self._get_loader(ctx).load(
+            ctx, MethodName("groups.getById"), abs(group_id), params
+        )
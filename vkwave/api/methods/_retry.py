@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import random
+import typing
+from collections import Counter
+from json import JSONDecodeError
+
+from aiohttp import ClientConnectionError
+
+from vkwave.client.types import MethodName
+
+logger = logging.getLogger(__name__)
+
+# methods that may be sent twice on retry, VK drops duplicates with the same `random_id`
+IDEMPOTENT_BY_RANDOM_ID = frozenset({"messages.send"})
+
+
+class Backoff(typing.NamedTuple):
+    """Exponential backoff with jitter: `base_delay * factor ** attempt` (but `max_delay` at most)"""
+
+    retries: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    factor: float = 2.0
+
+    def get_delay(self, attempt: int) -> float:
+        delay = min(self.max_delay, self.base_delay * self.factor ** attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+
+# 6: too many requests per second
+# 9: flood control
+# 10: internal server error
+# 29: rate limit reached (another token may be taken on retry)
+DEFAULT_RETRY_CODES: typing.Dict[int, Backoff] = {
+    6: Backoff(retries=5, base_delay=0.35, max_delay=5.0),
+    9: Backoff(retries=2, base_delay=5.0, max_delay=30.0),
+    10: Backoff(retries=3, base_delay=1.0),
+    29: Backoff(retries=1, base_delay=1.0),
+}
+
+DEFAULT_RETRY_EXCEPTIONS: typing.Tuple[typing.Type[Exception], ...] = (
+    ClientConnectionError,
+    JSONDecodeError,
+    asyncio.TimeoutError,
+)
+
+
+class RetryPolicy:
+    """
+    Retry requests failed with transient errors.
+
+    >>> policy = RetryPolicy(codes={6: Backoff(retries=10, base_delay=0.2)})
+    >>> api = API(tokens=..., retry_policy=policy)
+    """
+
+    def __init__(
+        self,
+        codes: typing.Optional[typing.Dict[int, Backoff]] = None,
+        exceptions: typing.Optional[typing.Tuple[typing.Type[Exception], ...]] = None,
+        exceptions_backoff: typing.Optional[Backoff] = None,
+    ):
+        """
+        :param codes: backoff for API error codes (they are merged with default ones)
+        :param exceptions: exceptions of client (connection errors, broken responses and so on)
+        :param exceptions_backoff: backoff for these exceptions
+        """
+        self.codes: typing.Dict[int, Backoff] = {**DEFAULT_RETRY_CODES, **(codes or {})}
+        self.exceptions = exceptions if exceptions is not None else DEFAULT_RETRY_EXCEPTIONS
+        self.exceptions_backoff = exceptions_backoff or Backoff()
+        # count of retries by error code or exception name (for monitoring)
+        self.stats: typing.Counter[typing.Union[int, str]] = Counter()
+
+    def prepare_params(self, method_name: MethodName, params: dict) -> None:
+        """Make retries of not idempotent methods safe"""
+        if method_name in IDEMPOTENT_BY_RANDOM_ID and not params.get("random_id"):
+            params["random_id"] = random.randint(1, 2 ** 31 - 1)
+
+    def get_result_backoff(self, result: dict, attempt: int) -> typing.Optional[Backoff]:
+        error = result.get("error")
+        if not error:
+            return None
+        backoff = self.codes.get(error.get("error_code"))
+        if backoff is None or attempt >= backoff.retries:
+            return None
+        self.stats[error["error_code"]] += 1
+        return backoff
+
+    def get_exception_backoff(
+        self, exception: Exception, attempt: int
+    ) -> typing.Optional[Backoff]:
+        if not isinstance(exception, self.exceptions):
+            return None
+        if attempt >= self.exceptions_backoff.retries:
+            return None
+        self.stats[type(exception).__name__] += 1
+        return self.exceptions_backoff
+
+    async def wait(self, method_name: MethodName, backoff: Backoff, attempt: int) -> None:
+        delay = backoff.get_delay(attempt)
+        logger.debug("Retrying '%s' in %.2fs (retry #%d)", method_name, delay, attempt + 1)
+        await asyncio.sleep(delay)
@@ -0,0 +1,78 @@
+import asyncio
+import copy
+import typing
+
+from vkwave.client.types import MethodName
+
+# methods that only read data, so identical calls may share one request
+DEFAULT_SHARED_PREFIXES: typing.Tuple[str, ...] = ("get", "search", "resolve", "is")
+
+
+class SingleFlight:
+    """
+    De-duplicates identical (method, params, token) requests that are being sent at the same time:
+    the first caller sends the request and the others wait for its result.
+    Every caller gets its own copy of the result. `execute` calls are never shared.
+
+    >>> api = API(tokens=..., single_flight=SingleFlight())
+    >>> api = API(tokens=..., single_flight=SingleFlight(methods=["users.get"]))
+    """
+
+    def __init__(
+        self,
+        methods: typing.Optional[typing.Iterable[str]] = None,
+        prefixes: typing.Tuple[str, ...] = DEFAULT_SHARED_PREFIXES,
+    ):
+        """
+        :param methods: methods to de-duplicate. By default, every read-only looking method
+         (its name starts with one of `prefixes`)
+        :param prefixes: see above
+        """
+        self.methods: typing.Optional[typing.Set[str]] = (
+            set(methods) if methods is not None else None
+        )
+        self.prefixes = prefixes
+        # requests are sent by their own tasks, so cancellation of one caller doesn't affect others
+        self._in_flight: typing.Dict[str, "asyncio.Task[dict]"] = {}
+        self._waiters: typing.Dict[str, int] = {}
+        # count of requests that weren't sent (for monitoring)
+        self.shared = 0
+
+    def is_shared(self, method_name: MethodName) -> bool:
+        if method_name.startswith("execute"):
+            # stored procedures may change data, whatever their names are
+            return False
+        if self.methods is not None:
+            return method_name in self.methods
+        return method_name.partition(".")[2].startswith(self.prefixes)
+
+    def _forget(self, key: str, task: "asyncio.Task[dict]") -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+            del self._waiters[key]
+        if not task.cancelled():
+            # mark exception as retrieved: all callers may be gone
+            task.exception()
+
+    async def do(self, key: str, request: typing.Callable[[], typing.Awaitable[dict]]) -> dict:
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(request())
+            self._in_flight[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.shared += 1
+
+        self._waiters[key] += 1
+        try:
+            result = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done():
+                # only this caller is cancelled, the request is cancelled with the last one
+                self._waiters[key] -= 1
+                if not self._waiters[key]:
+                    task.cancel()
+            raise
+        # callers may change their results
+        return copy.deepcopy(result)
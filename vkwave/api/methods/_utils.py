@@ -1,8 +1,79 @@
-def get_params(func_locals: dict):
-    params = {}
-    for key, value_ in func_locals.items():
-        if key not in ["self", "return_raw_response"] and value_ is not None:
-            if isinstance(value_, list):
-                value_ = ",".join(str(item) for item in value_)
-            params[key] = value_
+import json
+import typing
+from enum import Enum
+
+# locals of generated methods that aren't params of API method
+_SKIPPED_LOCALS = ("self", "return_raw_response")
+# values of these types are sent as is
+_PLAIN_TYPES = (str, int, float)
+
+
+def _dump_item(value: typing.Any) -> typing.Any:
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def dump_param(value: typing.Any) -> typing.Any:
+    """
+    Value of param in the form VK expects it.
+
+    >>> dump_param(True)
+    1
+    >>> dump_param([UsersFields.SEX, "bdate"])
+    'sex,bdate'
+    >>> dump_param({"one_time": True})
+    '{"one_time": true}'
+    """
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return ",".join(str(_dump_item(item)) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value, ensure_ascii=False, default=_dump_item)
+    return _dump_item(value)
+
+
+def _compile_serializer(names: typing.List[str]) -> typing.Callable[[dict], dict]:
+    """
+    Serializer of params with these names: one statement per param, without loops
+    and lookups of the rest locals.
+    """
+    lines = ["def serialize(func_locals):", "    params = {}"]
+    for name in names:
+        lines += [
+            f"    value = func_locals[{name!r}]",
+            "    if value is not None:",
+            f"        params[{name!r}] = value if type(value) in plain else dump_param(value)",
+        ]
+    lines.append("    return params")
+    namespace = {"plain": _PLAIN_TYPES, "dump_param": dump_param}
+    exec("\n".join(lines), namespace)
+    return namespace["serialize"]
+
+
+# serializers of generated methods, by their names
+_serializers: typing.Dict[str, typing.Callable[[dict], dict]] = {}
+
+
+def get_params(func_locals: dict, method: typing.Optional[str] = None) -> dict:
+    """
+    Params of API method from locals of the generated method (they are its arguments only).
+    With `method` (name of the generated method), serializer of its signature is compiled
+    on the first call and reused.
+    """
+    if method is not None:
+        serializer = _serializers.get(method)
+        if serializer is None:
+            names = [name for name in func_locals if name not in _SKIPPED_LOCALS]
+            serializer = _serializers[method] = _compile_serializer(names)
+        return serializer(func_locals)
+
+    params = {key: value for key, value in func_locals.items() if value is not None}
+    for key in _SKIPPED_LOCALS:
+        params.pop(key, None)
+    # most of values are plain, so only the rest are converted
+    for key, value in params.items():
+        if type(value) not in _PLAIN_TYPES:
+            params[key] = dump_param(value)
     return params
@@ -16,13 +16,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.ban")
 
         raw_result = await self.api_request("ban", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def change_password(
@@ -42,13 +42,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.change_password")
 
         raw_result = await self.api_request("changePassword", params)
         if return_raw_response:
             return raw_result
 
-        result = AccountChangePasswordResponse(**raw_result)
+        result = self.parse_response(AccountChangePasswordResponse, raw_result)
         return result
 
     async def get_active_offers(
@@ -64,13 +64,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.get_active_offers")
 
         raw_result = await self.api_request("getActiveOffers", params)
         if return_raw_response:
             return raw_result
 
-        result = AccountGetActiveOffersResponse(**raw_result)
+        result = self.parse_response(AccountGetActiveOffersResponse, raw_result)
         return result
 
     async def get_app_permissions(
@@ -84,13 +84,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.get_app_permissions")
 
         raw_result = await self.api_request("getAppPermissions", params)
         if return_raw_response:
             return raw_result
 
-        result = AccountGetAppPermissionsResponse(**raw_result)
+        result = self.parse_response(AccountGetAppPermissionsResponse, raw_result)
         return result
 
     async def get_banned(
@@ -106,13 +106,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.get_banned")
 
         raw_result = await self.api_request("getBanned", params)
         if return_raw_response:
             return raw_result
 
-        result = AccountGetBannedResponse(**raw_result)
+        result = self.parse_response(AccountGetBannedResponse, raw_result)
         return result
 
     async def get_counters(
@@ -126,13 +126,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.get_counters")
 
         raw_result = await self.api_request("getCounters", params)
         if return_raw_response:
             return raw_result
 
-        result = AccountGetCountersResponse(**raw_result)
+        result = self.parse_response(AccountGetCountersResponse, raw_result)
         return result
 
     async def get_info(
@@ -146,13 +146,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.get_info")
 
         raw_result = await self.api_request("getInfo", params)
         if return_raw_response:
             return raw_result
 
-        result = AccountGetInfoResponse(**raw_result)
+        result = self.parse_response(AccountGetInfoResponse, raw_result)
         return result
 
     async def get_profile_info(
@@ -164,13 +164,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.get_profile_info")
 
         raw_result = await self.api_request("getProfileInfo", params)
         if return_raw_response:
             return raw_result
 
-        result = AccountGetProfileInfoResponse(**raw_result)
+        result = self.parse_response(AccountGetProfileInfoResponse, raw_result)
         return result
 
     async def get_push_settings(
@@ -184,13 +184,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.get_push_settings")
 
         raw_result = await self.api_request("getPushSettings", params)
         if return_raw_response:
             return raw_result
 
-        result = AccountGetPushSettingsResponse(**raw_result)
+        result = self.parse_response(AccountGetPushSettingsResponse, raw_result)
         return result
 
     async def register_device(
@@ -216,13 +216,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.register_device")
 
         raw_result = await self.api_request("registerDevice", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def save_profile_info(
@@ -262,13 +262,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.save_profile_info")
 
         raw_result = await self.api_request("saveProfileInfo", params)
         if return_raw_response:
             return raw_result
 
-        result = AccountSaveProfileInfoResponse(**raw_result)
+        result = self.parse_response(AccountSaveProfileInfoResponse, raw_result)
         return result
 
     async def set_info(
@@ -284,13 +284,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.set_info")
 
         raw_result = await self.api_request("setInfo", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def set_name_in_menu(
@@ -306,13 +306,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.set_name_in_menu")
 
         raw_result = await self.api_request("setNameInMenu", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def set_offline(
@@ -324,13 +324,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.set_offline")
 
         raw_result = await self.api_request("setOffline", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def set_online(
@@ -344,13 +344,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.set_online")
 
         raw_result = await self.api_request("setOnline", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def set_push_settings(
@@ -370,13 +370,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.set_push_settings")
 
         raw_result = await self.api_request("setPushSettings", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def set_silence_mode(
@@ -396,13 +396,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.set_silence_mode")
 
         raw_result = await self.api_request("setSilenceMode", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def unban(
@@ -416,13 +416,13 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.unban")
 
         raw_result = await self.api_request("unban", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def unregister_device(
@@ -438,11 +438,11 @@ class Account(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Account.unregister_device")
 
         raw_result = await self.api_request("unregisterDevice", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
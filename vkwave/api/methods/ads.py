@@ -18,13 +18,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.add_office_users")
 
         raw_result = await self.api_request("addOfficeUsers", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsAddOfficeUsersResponse(**raw_result)
+        result = self.parse_response(AdsAddOfficeUsersResponse, raw_result)
         return result
 
     async def check_link(
@@ -44,13 +44,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.check_link")
 
         raw_result = await self.api_request("checkLink", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsCheckLinkResponse(**raw_result)
+        result = self.parse_response(AdsCheckLinkResponse, raw_result)
         return result
 
     async def create_ads(
@@ -66,13 +66,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.create_ads")
 
         raw_result = await self.api_request("createAds", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsCreateAdsResponse(**raw_result)
+        result = self.parse_response(AdsCreateAdsResponse, raw_result)
         return result
 
     async def create_campaigns(
@@ -88,13 +88,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.create_campaigns")
 
         raw_result = await self.api_request("createCampaigns", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsCreateCampaignsResponse(**raw_result)
+        result = self.parse_response(AdsCreateCampaignsResponse, raw_result)
         return result
 
     async def create_clients(
@@ -110,13 +110,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.create_clients")
 
         raw_result = await self.api_request("createClients", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsCreateClientsResponse(**raw_result)
+        result = self.parse_response(AdsCreateClientsResponse, raw_result)
         return result
 
     async def create_target_group(
@@ -140,13 +140,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.create_target_group")
 
         raw_result = await self.api_request("createTargetGroup", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsCreateTargetGroupResponse(**raw_result)
+        result = self.parse_response(AdsCreateTargetGroupResponse, raw_result)
         return result
 
     async def delete_ads(
@@ -162,13 +162,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.delete_ads")
 
         raw_result = await self.api_request("deleteAds", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsDeleteAdsResponse(**raw_result)
+        result = self.parse_response(AdsDeleteAdsResponse, raw_result)
         return result
 
     async def delete_campaigns(
@@ -184,13 +184,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.delete_campaigns")
 
         raw_result = await self.api_request("deleteCampaigns", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsDeleteCampaignsResponse(**raw_result)
+        result = self.parse_response(AdsDeleteCampaignsResponse, raw_result)
         return result
 
     async def delete_clients(
@@ -206,13 +206,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.delete_clients")
 
         raw_result = await self.api_request("deleteClients", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsDeleteClientsResponse(**raw_result)
+        result = self.parse_response(AdsDeleteClientsResponse, raw_result)
         return result
 
     async def delete_target_group(
@@ -230,13 +230,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.delete_target_group")
 
         raw_result = await self.api_request("deleteTargetGroup", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get_accounts(
@@ -248,13 +248,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_accounts")
 
         raw_result = await self.api_request("getAccounts", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetAccountsResponse(**raw_result)
+        result = self.parse_response(AdsGetAccountsResponse, raw_result)
         return result
 
     async def get_ads(
@@ -282,13 +282,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_ads")
 
         raw_result = await self.api_request("getAds", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetAdsResponse(**raw_result)
+        result = self.parse_response(AdsGetAdsResponse, raw_result)
         return result
 
     async def get_ads_layout(
@@ -314,13 +314,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_ads_layout")
 
         raw_result = await self.api_request("getAdsLayout", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetAdsLayoutResponse(**raw_result)
+        result = self.parse_response(AdsGetAdsLayoutResponse, raw_result)
         return result
 
     async def get_ads_targeting(
@@ -346,13 +346,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_ads_targeting")
 
         raw_result = await self.api_request("getAdsTargeting", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetAdsTargetingResponse(**raw_result)
+        result = self.parse_response(AdsGetAdsTargetingResponse, raw_result)
         return result
 
     async def get_budget(
@@ -366,13 +366,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_budget")
 
         raw_result = await self.api_request("getBudget", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetBudgetResponse(**raw_result)
+        result = self.parse_response(AdsGetBudgetResponse, raw_result)
         return result
 
     async def get_campaigns(
@@ -394,13 +394,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_campaigns")
 
         raw_result = await self.api_request("getCampaigns", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetCampaignsResponse(**raw_result)
+        result = self.parse_response(AdsGetCampaignsResponse, raw_result)
         return result
 
     async def get_categories(
@@ -414,13 +414,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_categories")
 
         raw_result = await self.api_request("getCategories", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetCategoriesResponse(**raw_result)
+        result = self.parse_response(AdsGetCategoriesResponse, raw_result)
         return result
 
     async def get_clients(
@@ -434,13 +434,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_clients")
 
         raw_result = await self.api_request("getClients", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetClientsResponse(**raw_result)
+        result = self.parse_response(AdsGetClientsResponse, raw_result)
         return result
 
     async def get_demographics(
@@ -464,13 +464,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_demographics")
 
         raw_result = await self.api_request("getDemographics", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetDemographicsResponse(**raw_result)
+        result = self.parse_response(AdsGetDemographicsResponse, raw_result)
         return result
 
     async def get_flood_stats(
@@ -484,13 +484,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_flood_stats")
 
         raw_result = await self.api_request("getFloodStats", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetFloodStatsResponse(**raw_result)
+        result = self.parse_response(AdsGetFloodStatsResponse, raw_result)
         return result
 
     async def get_lookalike_requests(
@@ -514,13 +514,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_lookalike_requests")
 
         raw_result = await self.api_request("getLookalikeRequests", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetLookalikeRequestsResponse(**raw_result)
+        result = self.parse_response(AdsGetLookalikeRequestsResponse, raw_result)
         return result
 
     async def get_musicians(
@@ -534,13 +534,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_musicians")
 
         raw_result = await self.api_request("getMusicians", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetMusiciansResponse(**raw_result)
+        result = self.parse_response(AdsGetMusiciansResponse, raw_result)
         return result
 
     async def get_office_users(
@@ -554,13 +554,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_office_users")
 
         raw_result = await self.api_request("getOfficeUsers", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetOfficeUsersResponse(**raw_result)
+        result = self.parse_response(AdsGetOfficeUsersResponse, raw_result)
         return result
 
     async def get_posts_reach(
@@ -578,13 +578,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_posts_reach")
 
         raw_result = await self.api_request("getPostsReach", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetPostsReachResponse(**raw_result)
+        result = self.parse_response(AdsGetPostsReachResponse, raw_result)
         return result
 
     async def get_rejection_reason(
@@ -600,13 +600,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_rejection_reason")
 
         raw_result = await self.api_request("getRejectionReason", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetRejectionReasonResponse(**raw_result)
+        result = self.parse_response(AdsGetRejectionReasonResponse, raw_result)
         return result
 
     async def get_statistics(
@@ -632,13 +632,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_statistics")
 
         raw_result = await self.api_request("getStatistics", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetStatisticsResponse(**raw_result)
+        result = self.parse_response(AdsGetStatisticsResponse, raw_result)
         return result
 
     async def get_suggestions(
@@ -662,13 +662,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_suggestions")
 
         raw_result = await self.api_request("getSuggestions", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetSuggestionsResponse(**raw_result)
+        result = self.parse_response(AdsGetSuggestionsResponse, raw_result)
         return result
 
     async def get_target_groups(
@@ -686,13 +686,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_target_groups")
 
         raw_result = await self.api_request("getTargetGroups", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetTargetGroupsResponse(**raw_result)
+        result = self.parse_response(AdsGetTargetGroupsResponse, raw_result)
         return result
 
     async def get_targeting_stats(
@@ -728,13 +728,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_targeting_stats")
 
         raw_result = await self.api_request("getTargetingStats", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetTargetingStatsResponse(**raw_result)
+        result = self.parse_response(AdsGetTargetingStatsResponse, raw_result)
         return result
 
     async def get_upload_u_r_l(
@@ -750,13 +750,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_upload_u_r_l")
 
         raw_result = await self.api_request("getUploadURL", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetUploadURLResponse(**raw_result)
+        result = self.parse_response(AdsGetUploadURLResponse, raw_result)
         return result
 
     async def get_video_upload_u_r_l(
@@ -768,13 +768,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.get_video_upload_u_r_l")
 
         raw_result = await self.api_request("getVideoUploadURL", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsGetVideoUploadURLResponse(**raw_result)
+        result = self.parse_response(AdsGetVideoUploadURLResponse, raw_result)
         return result
 
     async def import_target_contacts(
@@ -794,13 +794,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.import_target_contacts")
 
         raw_result = await self.api_request("importTargetContacts", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsImportTargetContactsResponse(**raw_result)
+        result = self.parse_response(AdsImportTargetContactsResponse, raw_result)
         return result
 
     async def remove_office_users(
@@ -816,13 +816,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.remove_office_users")
 
         raw_result = await self.api_request("removeOfficeUsers", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsRemoveOfficeUsersResponse(**raw_result)
+        result = self.parse_response(AdsRemoveOfficeUsersResponse, raw_result)
         return result
 
     async def update_ads(
@@ -838,13 +838,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.update_ads")
 
         raw_result = await self.api_request("updateAds", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsUpdateAdsResponse(**raw_result)
+        result = self.parse_response(AdsUpdateAdsResponse, raw_result)
         return result
 
     async def update_campaigns(
@@ -860,13 +860,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.update_campaigns")
 
         raw_result = await self.api_request("updateCampaigns", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsUpdateCampaignsResponse(**raw_result)
+        result = self.parse_response(AdsUpdateCampaignsResponse, raw_result)
         return result
 
     async def update_clients(
@@ -882,13 +882,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.update_clients")
 
         raw_result = await self.api_request("updateClients", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsUpdateClientsResponse(**raw_result)
+        result = self.parse_response(AdsUpdateClientsResponse, raw_result)
         return result
 
     async def update_office_users(
@@ -904,13 +904,13 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.update_office_users")
 
         raw_result = await self.api_request("updateOfficeUsers", params)
         if return_raw_response:
             return raw_result
 
-        result = AdsUpdateOfficeUsersResponse(**raw_result)
+        result = self.parse_response(AdsUpdateOfficeUsersResponse, raw_result)
         return result
 
     async def update_target_group(
@@ -938,11 +938,11 @@ class Ads(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Ads.update_target_group")
 
         raw_result = await self.api_request("updateTargetGroup", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
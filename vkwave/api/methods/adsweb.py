@@ -16,13 +16,13 @@ class Adsweb(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Adsweb.get_ad_categories")
 
         raw_result = await self.api_request("getAdCategories", params)
         if return_raw_response:
             return raw_result
 
-        result = AdswebGetAdCategoriesResponse(**raw_result)
+        result = self.parse_response(AdswebGetAdCategoriesResponse, raw_result)
         return result
 
     async def get_ad_unit_code(
@@ -34,13 +34,13 @@ class Adsweb(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Adsweb.get_ad_unit_code")
 
         raw_result = await self.api_request("getAdUnitCode", params)
         if return_raw_response:
             return raw_result
 
-        result = AdswebGetAdUnitCodeResponse(**raw_result)
+        result = self.parse_response(AdswebGetAdUnitCodeResponse, raw_result)
         return result
 
     async def get_ad_units(
@@ -64,13 +64,13 @@ class Adsweb(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Adsweb.get_ad_units")
 
         raw_result = await self.api_request("getAdUnits", params)
         if return_raw_response:
             return raw_result
 
-        result = AdswebGetAdUnitsResponse(**raw_result)
+        result = self.parse_response(AdswebGetAdUnitsResponse, raw_result)
         return result
 
     async def get_fraud_history(
@@ -90,13 +90,13 @@ class Adsweb(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Adsweb.get_fraud_history")
 
         raw_result = await self.api_request("getFraudHistory", params)
         if return_raw_response:
             return raw_result
 
-        result = AdswebGetFraudHistoryResponse(**raw_result)
+        result = self.parse_response(AdswebGetFraudHistoryResponse, raw_result)
         return result
 
     async def get_sites(
@@ -118,13 +118,13 @@ class Adsweb(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Adsweb.get_sites")
 
         raw_result = await self.api_request("getSites", params)
         if return_raw_response:
             return raw_result
 
-        result = AdswebGetSitesResponse(**raw_result)
+        result = self.parse_response(AdswebGetSitesResponse, raw_result)
         return result
 
     async def get_statistics(
@@ -154,11 +154,11 @@ class Adsweb(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Adsweb.get_statistics")
 
         raw_result = await self.api_request("getStatistics", params)
         if return_raw_response:
             return raw_result
 
-        result = AdswebGetStatisticsResponse(**raw_result)
+        result = self.parse_response(AdswebGetStatisticsResponse, raw_result)
         return result
@@ -16,13 +16,13 @@ class AppWidgets(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "AppWidgets.widgets_get_app_image_upload_server")
 
         raw_result = await self.api_request("getAppImageUploadServer", params)
         if return_raw_response:
             return raw_result
 
-        result = AppWidgetsGetAppImageUploadServerResponse(**raw_result)
+        result = self.parse_response(AppWidgetsGetAppImageUploadServerResponse, raw_result)
         return result
 
     async def widgets_get_app_images(
@@ -40,13 +40,13 @@ class AppWidgets(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "AppWidgets.widgets_get_app_images")
 
         raw_result = await self.api_request("getAppImages", params)
         if return_raw_response:
             return raw_result
 
-        result = AppWidgetsGetAppImagesResponse(**raw_result)
+        result = self.parse_response(AppWidgetsGetAppImagesResponse, raw_result)
         return result
 
     async def widgets_get_group_image_upload_server(
@@ -60,13 +60,13 @@ class AppWidgets(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "AppWidgets.widgets_get_group_image_upload_server")
 
         raw_result = await self.api_request("getGroupImageUploadServer", params)
         if return_raw_response:
             return raw_result
 
-        result = AppWidgetsGetGroupImageUploadServerResponse(**raw_result)
+        result = self.parse_response(AppWidgetsGetGroupImageUploadServerResponse, raw_result)
         return result
 
     async def widgets_get_group_images(
@@ -84,13 +84,13 @@ class AppWidgets(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "AppWidgets.widgets_get_group_images")
 
         raw_result = await self.api_request("getGroupImages", params)
         if return_raw_response:
             return raw_result
 
-        result = AppWidgetsGetGroupImagesResponse(**raw_result)
+        result = self.parse_response(AppWidgetsGetGroupImagesResponse, raw_result)
         return result
 
     async def widgets_get_images_by_id(
@@ -104,13 +104,13 @@ class AppWidgets(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "AppWidgets.widgets_get_images_by_id")
 
         raw_result = await self.api_request("getImagesById", params)
         if return_raw_response:
             return raw_result
 
-        result = AppWidgetsGetImagesByIdResponse(**raw_result)
+        result = self.parse_response(AppWidgetsGetImagesByIdResponse, raw_result)
         return result
 
     async def widgets_save_app_image(
@@ -126,13 +126,13 @@ class AppWidgets(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "AppWidgets.widgets_save_app_image")
 
         raw_result = await self.api_request("saveAppImage", params)
         if return_raw_response:
             return raw_result
 
-        result = AppWidgetsSaveAppImageResponse(**raw_result)
+        result = self.parse_response(AppWidgetsSaveAppImageResponse, raw_result)
         return result
 
     async def widgets_save_group_image(
@@ -148,13 +148,13 @@ class AppWidgets(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "AppWidgets.widgets_save_group_image")
 
         raw_result = await self.api_request("saveGroupImage", params)
         if return_raw_response:
             return raw_result
 
-        result = AppWidgetsSaveGroupImageResponse(**raw_result)
+        result = self.parse_response(AppWidgetsSaveGroupImageResponse, raw_result)
         return result
 
     async def widgets_update(
@@ -170,11 +170,11 @@ class AppWidgets(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "AppWidgets.widgets_update")
 
         raw_result = await self.api_request("update", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
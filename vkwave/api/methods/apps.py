@@ -14,13 +14,13 @@ class Apps(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Apps.delete_app_requests")
 
         raw_result = await self.api_request("deleteAppRequests", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get(
@@ -46,13 +46,13 @@ class Apps(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Apps.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = AppsGetResponse(**raw_result)
+        result = self.parse_response(AppsGetResponse, raw_result)
         return result
 
     async def get_catalog(
@@ -86,13 +86,13 @@ class Apps(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Apps.get_catalog")
 
         raw_result = await self.api_request("getCatalog", params)
         if return_raw_response:
             return raw_result
 
-        result = AppsGetCatalogResponse(**raw_result)
+        result = self.parse_response(AppsGetCatalogResponse, raw_result)
         return result
 
     async def get_friends_list(
@@ -114,13 +114,13 @@ class Apps(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Apps.get_friends_list")
 
         raw_result = await self.api_request("getFriendsList", params)
         if return_raw_response:
             return raw_result
 
-        result = AppsGetFriendsListResponse(**raw_result)
+        result = self.parse_response(AppsGetFriendsListResponse, raw_result)
         return result
 
     async def get_leaderboard(
@@ -138,16 +138,16 @@ class Apps(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Apps.get_leaderboard")
 
         raw_result = await self.api_request("getLeaderboard", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            AppsGetLeaderboardResponse(**raw_result)
+            self.parse_response(AppsGetLeaderboardResponse, raw_result)
             if not extended
-            else AppsGetLeaderboardExtendedResponse(**raw_result)
+            else self.parse_response(AppsGetLeaderboardExtendedResponse, raw_result)
         )
         return result
 
@@ -162,13 +162,13 @@ class Apps(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Apps.get_scopes")
 
         raw_result = await self.api_request("getScopes", params)
         if return_raw_response:
             return raw_result
 
-        result = AppsGetScopesResponse(**raw_result)
+        result = self.parse_response(AppsGetScopesResponse, raw_result)
         return result
 
     async def get_score(
@@ -182,13 +182,13 @@ class Apps(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Apps.get_score")
 
         raw_result = await self.api_request("getScore", params)
         if return_raw_response:
             return raw_result
 
-        result = AppsGetScoreResponse(**raw_result)
+        result = self.parse_response(AppsGetScoreResponse, raw_result)
         return result
 
     async def promo_has_active_gift(
@@ -204,13 +204,13 @@ class Apps(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Apps.promo_has_active_gift")
 
         raw_result = await self.api_request("promoHasActiveGift", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseBoolResponse(**raw_result)
+        result = self.parse_response(BaseBoolResponse, raw_result)
         return result
 
     async def promo_use_gift(
@@ -226,13 +226,13 @@ class Apps(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Apps.promo_use_gift")
 
         raw_result = await self.api_request("promoUseGift", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseBoolResponse(**raw_result)
+        result = self.parse_response(BaseBoolResponse, raw_result)
         return result
 
     async def send_request(
@@ -256,11 +256,11 @@ class Apps(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Apps.send_request")
 
         raw_result = await self.api_request("sendRequest", params)
         if return_raw_response:
             return raw_result
 
-        result = AppsSendRequestResponse(**raw_result)
+        result = self.parse_response(AppsSendRequestResponse, raw_result)
         return result
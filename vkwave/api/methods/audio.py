@@ -32,13 +32,13 @@ class Audio(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Audio.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = AudioGetResponse(**raw_result)
+        result = self.parse_response(AudioGetResponse, raw_result)
         return result
 
     async def get_by_id(
@@ -52,11 +52,11 @@ class Audio(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Audio.get_by_id")
 
         raw_result = await self.api_request("getById", params)
         if return_raw_response:
             return raw_result
 
-        result = AudioGetByIdResponse(**raw_result)
+        result = self.parse_response(AudioGetByIdResponse, raw_result)
         return result
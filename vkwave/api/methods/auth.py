@@ -22,13 +22,13 @@ class Auth(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Auth.check_phone")
 
         raw_result = await self.api_request("checkPhone", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def restore(
@@ -44,11 +44,11 @@ class Auth(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Auth.restore")
 
         raw_result = await self.api_request("restore", params)
         if return_raw_response:
             return raw_result
 
-        result = AuthRestoreResponse(**raw_result)
+        result = self.parse_response(AuthRestoreResponse, raw_result)
         return result
@@ -24,13 +24,13 @@ class Board(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Board.add_topic")
 
         raw_result = await self.api_request("addTopic", params)
         if return_raw_response:
             return raw_result
 
-        result = BoardAddTopicResponse(**raw_result)
+        result = self.parse_response(BoardAddTopicResponse, raw_result)
         return result
 
     async def close_topic(
@@ -46,13 +46,13 @@ class Board(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Board.close_topic")
 
         raw_result = await self.api_request("closeTopic", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def create_comment(
@@ -78,13 +78,13 @@ class Board(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Board.create_comment")
 
         raw_result = await self.api_request("createComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BoardCreateCommentResponse(**raw_result)
+        result = self.parse_response(BoardCreateCommentResponse, raw_result)
         return result
 
     async def delete_comment(
@@ -102,13 +102,13 @@ class Board(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Board.delete_comment")
 
         raw_result = await self.api_request("deleteComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def delete_topic(
@@ -124,13 +124,13 @@ class Board(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Board.delete_topic")
 
         raw_result = await self.api_request("deleteTopic", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit_comment(
@@ -152,13 +152,13 @@ class Board(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Board.edit_comment")
 
         raw_result = await self.api_request("editComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit_topic(
@@ -176,13 +176,13 @@ class Board(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Board.edit_topic")
 
         raw_result = await self.api_request("editTopic", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def fix_topic(
@@ -198,13 +198,13 @@ class Board(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Board.fix_topic")
 
         raw_result = await self.api_request("fixTopic", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get_comments(
@@ -232,16 +232,16 @@ class Board(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Board.get_comments")
 
         raw_result = await self.api_request("getComments", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            BoardGetCommentsResponse(**raw_result)
+            self.parse_response(BoardGetCommentsResponse, raw_result)
             if not extended
-            else BoardGetCommentsExtendedResponse(**raw_result)
+            else self.parse_response(BoardGetCommentsExtendedResponse, raw_result)
         )
         return result
 
@@ -270,16 +270,16 @@ class Board(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Board.get_topics")
 
         raw_result = await self.api_request("getTopics", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            BoardGetTopicsResponse(**raw_result)
+            self.parse_response(BoardGetTopicsResponse, raw_result)
             if not extended
-            else BoardGetTopicsExtendedResponse(**raw_result)
+            else self.parse_response(BoardGetTopicsExtendedResponse, raw_result)
         )
         return result
 
@@ -296,13 +296,13 @@ class Board(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Board.open_topic")
 
         raw_result = await self.api_request("openTopic", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def restore_comment(
@@ -320,13 +320,13 @@ class Board(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Board.restore_comment")
 
         raw_result = await self.api_request("restoreComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def unfix_topic(
@@ -342,11 +342,11 @@ class Board(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Board.unfix_topic")
 
         raw_result = await self.api_request("unfixTopic", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
@@ -20,13 +20,13 @@ class Database(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Database.get_chairs")
 
         raw_result = await self.api_request("getChairs", params)
         if return_raw_response:
             return raw_result
 
-        result = DatabaseGetChairsResponse(**raw_result)
+        result = self.parse_response(DatabaseGetChairsResponse, raw_result)
         return result
 
     async def get_cities(
@@ -50,13 +50,13 @@ class Database(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Database.get_cities")
 
         raw_result = await self.api_request("getCities", params)
         if return_raw_response:
             return raw_result
 
-        result = DatabaseGetCitiesResponse(**raw_result)
+        result = self.parse_response(DatabaseGetCitiesResponse, raw_result)
         return result
 
     async def get_cities_by_id(
@@ -70,13 +70,13 @@ class Database(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Database.get_cities_by_id")
 
         raw_result = await self.api_request("getCitiesById", params)
         if return_raw_response:
             return raw_result
 
-        result = DatabaseGetCitiesByIdResponse(**raw_result)
+        result = self.parse_response(DatabaseGetCitiesByIdResponse, raw_result)
         return result
 
     async def get_countries(
@@ -96,13 +96,13 @@ class Database(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Database.get_countries")
 
         raw_result = await self.api_request("getCountries", params)
         if return_raw_response:
             return raw_result
 
-        result = DatabaseGetCountriesResponse(**raw_result)
+        result = self.parse_response(DatabaseGetCountriesResponse, raw_result)
         return result
 
     async def get_countries_by_id(
@@ -116,13 +116,13 @@ class Database(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Database.get_countries_by_id")
 
         raw_result = await self.api_request("getCountriesById", params)
         if return_raw_response:
             return raw_result
 
-        result = DatabaseGetCountriesByIdResponse(**raw_result)
+        result = self.parse_response(DatabaseGetCountriesByIdResponse, raw_result)
         return result
 
     async def get_faculties(
@@ -140,13 +140,13 @@ class Database(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Database.get_faculties")
 
         raw_result = await self.api_request("getFaculties", params)
         if return_raw_response:
             return raw_result
 
-        result = DatabaseGetFacultiesResponse(**raw_result)
+        result = self.parse_response(DatabaseGetFacultiesResponse, raw_result)
         return result
 
     async def get_metro_stations(
@@ -166,13 +166,13 @@ class Database(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Database.get_metro_stations")
 
         raw_result = await self.api_request("getMetroStations", params)
         if return_raw_response:
             return raw_result
 
-        result = DatabaseGetMetroStationsResponse(**raw_result)
+        result = self.parse_response(DatabaseGetMetroStationsResponse, raw_result)
         return result
 
     async def get_metro_stations_by_id(
@@ -186,13 +186,13 @@ class Database(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Database.get_metro_stations_by_id")
 
         raw_result = await self.api_request("getMetroStationsById", params)
         if return_raw_response:
             return raw_result
 
-        result = DatabaseGetMetroStationsByIdResponse(**raw_result)
+        result = self.parse_response(DatabaseGetMetroStationsByIdResponse, raw_result)
         return result
 
     async def get_regions(
@@ -212,13 +212,13 @@ class Database(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Database.get_regions")
 
         raw_result = await self.api_request("getRegions", params)
         if return_raw_response:
             return raw_result
 
-        result = DatabaseGetRegionsResponse(**raw_result)
+        result = self.parse_response(DatabaseGetRegionsResponse, raw_result)
         return result
 
     async def get_school_classes(
@@ -232,13 +232,13 @@ class Database(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Database.get_school_classes")
 
         raw_result = await self.api_request("getSchoolClasses", params)
         if return_raw_response:
             return raw_result
 
-        result = DatabaseGetSchoolClassesResponse(**raw_result)
+        result = self.parse_response(DatabaseGetSchoolClassesResponse, raw_result)
         return result
 
     async def get_schools(
@@ -258,13 +258,13 @@ class Database(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Database.get_schools")
 
         raw_result = await self.api_request("getSchools", params)
         if return_raw_response:
             return raw_result
 
-        result = DatabaseGetSchoolsResponse(**raw_result)
+        result = self.parse_response(DatabaseGetSchoolsResponse, raw_result)
         return result
 
     async def get_universities(
@@ -286,11 +286,11 @@ class Database(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Database.get_universities")
 
         raw_result = await self.api_request("getUniversities", params)
         if return_raw_response:
             return raw_result
 
-        result = DatabaseGetUniversitiesResponse(**raw_result)
+        result = self.parse_response(DatabaseGetUniversitiesResponse, raw_result)
         return result
@@ -20,13 +20,13 @@ class Docs(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Docs.add")
 
         raw_result = await self.api_request("add", params)
         if return_raw_response:
             return raw_result
 
-        result = DocsAddResponse(**raw_result)
+        result = self.parse_response(DocsAddResponse, raw_result)
         return result
 
     async def delete(
@@ -39,13 +39,13 @@ class Docs(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Docs.delete")
 
         raw_result = await self.api_request("delete", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit(
@@ -65,13 +65,13 @@ class Docs(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Docs.edit")
 
         raw_result = await self.api_request("edit", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get(
@@ -93,13 +93,13 @@ class Docs(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Docs.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = DocsGetResponse(**raw_result)
+        result = self.parse_response(DocsGetResponse, raw_result)
         return result
 
     async def get_by_id(
@@ -115,13 +115,13 @@ class Docs(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Docs.get_by_id")
 
         raw_result = await self.api_request("getById", params)
         if return_raw_response:
             return raw_result
 
-        result = DocsGetByIdResponse(**raw_result)
+        result = self.parse_response(DocsGetByIdResponse, raw_result)
         return result
 
     async def get_messages_upload_server(
@@ -137,13 +137,13 @@ class Docs(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Docs.get_messages_upload_server")
 
         raw_result = await self.api_request("getMessagesUploadServer", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseGetUploadServerResponse(**raw_result)
+        result = self.parse_response(BaseGetUploadServerResponse, raw_result)
         return result
 
     async def get_types(
@@ -155,13 +155,13 @@ class Docs(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Docs.get_types")
 
         raw_result = await self.api_request("getTypes", params)
         if return_raw_response:
             return raw_result
 
-        result = DocsGetTypesResponse(**raw_result)
+        result = self.parse_response(DocsGetTypesResponse, raw_result)
         return result
 
     async def get_upload_server(
@@ -173,13 +173,13 @@ class Docs(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Docs.get_upload_server")
 
         raw_result = await self.api_request("getUploadServer", params)
         if return_raw_response:
             return raw_result
 
-        result = DocsGetUploadServerResponse(**raw_result)
+        result = self.parse_response(DocsGetUploadServerResponse, raw_result)
         return result
 
     async def get_wall_upload_server(
@@ -191,13 +191,13 @@ class Docs(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Docs.get_wall_upload_server")
 
         raw_result = await self.api_request("getWallUploadServer", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseGetUploadServerResponse(**raw_result)
+        result = self.parse_response(BaseGetUploadServerResponse, raw_result)
         return result
 
     async def save(
@@ -217,13 +217,13 @@ class Docs(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Docs.save")
 
         raw_result = await self.api_request("save", params)
         if return_raw_response:
             return raw_result
 
-        result = DocsSaveResponse(**raw_result)
+        result = self.parse_response(DocsSaveResponse, raw_result)
         return result
 
     async def search(
@@ -245,11 +245,11 @@ class Docs(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Docs.search")
 
         raw_result = await self.api_request("search", params)
         if return_raw_response:
             return raw_result
 
-        result = DocsSearchResponse(**raw_result)
+        result = self.parse_response(DocsSearchResponse, raw_result)
         return result
@@ -22,13 +22,13 @@ class Donut(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Donut.get_friends")
 
         raw_result = await self.api_request("getFriends", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsGetMembersFieldsResponse(**raw_result)
+        result = self.parse_response(GroupsGetMembersFieldsResponse, raw_result)
         return result
 
     async def get_subscription(
@@ -42,13 +42,13 @@ class Donut(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Donut.get_subscription")
 
         raw_result = await self.api_request("getSubscription", params)
         if return_raw_response:
             return raw_result
 
-        result = DonutGetSubscriptionResponse(**raw_result)
+        result = self.parse_response(DonutGetSubscriptionResponse, raw_result)
         return result
 
     async def get_subscriptions(
@@ -66,13 +66,13 @@ class Donut(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Donut.get_subscriptions")
 
         raw_result = await self.api_request("getSubscriptions", params)
         if return_raw_response:
             return raw_result
 
-        result = DonutGetSubscriptionsResponse(**raw_result)
+        result = self.parse_response(DonutGetSubscriptionsResponse, raw_result)
         return result
 
     async def is_don(
@@ -86,11 +86,11 @@ class Donut(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Donut.is_don")
 
         raw_result = await self.api_request("isDon", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseBoolResponse(**raw_result)
+        result = self.parse_response(BaseBoolResponse, raw_result)
         return result
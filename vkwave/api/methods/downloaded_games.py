@@ -16,11 +16,11 @@ class DownloadedGames(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "DownloadedGames.games_get_paid_status")
 
         raw_result = await self.api_request("getPaidStatus", params)
         if return_raw_response:
             return raw_result
 
-        result = DownloadedGamesPaidStatusResponse(**raw_result)
+        result = self.parse_response(DownloadedGamesPaidStatusResponse, raw_result)
         return result
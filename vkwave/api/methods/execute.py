@@ -12,5 +12,5 @@ class Execute(Category):
         if return_raw_response:
             return raw_result
 
-        result = ExecuteResponse(**raw_result)
+        result = self.parse_response(ExecuteResponse, raw_result)
         return result
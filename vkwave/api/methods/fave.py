@@ -16,13 +16,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.add_article")
 
         raw_result = await self.api_request("addArticle", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def add_link(
@@ -36,13 +36,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.add_link")
 
         raw_result = await self.api_request("addLink", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def add_page(
@@ -58,13 +58,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.add_page")
 
         raw_result = await self.api_request("addPage", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def add_post(
@@ -82,13 +82,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.add_post")
 
         raw_result = await self.api_request("addPost", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def add_product(
@@ -106,13 +106,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.add_product")
 
         raw_result = await self.api_request("addProduct", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def add_tag(
@@ -128,13 +128,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.add_tag")
 
         raw_result = await self.api_request("addTag", params)
         if return_raw_response:
             return raw_result
 
-        result = FaveAddTagResponse(**raw_result)
+        result = self.parse_response(FaveAddTagResponse, raw_result)
         return result
 
     async def add_video(
@@ -152,13 +152,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.add_video")
 
         raw_result = await self.api_request("addVideo", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit_tag(
@@ -174,13 +174,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.edit_tag")
 
         raw_result = await self.api_request("editTag", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get(
@@ -206,16 +206,16 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            FaveGetResponse(**raw_result)
+            self.parse_response(FaveGetResponse, raw_result)
             if not extended
-            else FaveGetExtendedResponse(**raw_result)
+            else self.parse_response(FaveGetExtendedResponse, raw_result)
         )
         return result
 
@@ -238,13 +238,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.get_pages")
 
         raw_result = await self.api_request("getPages", params)
         if return_raw_response:
             return raw_result
 
-        result = FaveGetPagesResponse(**raw_result)
+        result = self.parse_response(FaveGetPagesResponse, raw_result)
         return result
 
     async def get_posts(
@@ -264,13 +264,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.get_posts")
 
         raw_result = await self.api_request("getPosts", params)
         if return_raw_response:
             return raw_result
 
-        result = FaveGetPostsResponse(**raw_result)
+        result = self.parse_response(FaveGetPostsResponse, raw_result)
         return result
 
     async def get_videos(
@@ -290,13 +290,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.get_videos")
 
         raw_result = await self.api_request("getVideos", params)
         if return_raw_response:
             return raw_result
 
-        result = FaveGetVideosResponse(**raw_result)
+        result = self.parse_response(FaveGetVideosResponse, raw_result)
         return result
 
     async def get_photos(
@@ -314,13 +314,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.get_photos")
 
         raw_result = await self.api_request("getPhotos", params)
         if return_raw_response:
             return raw_result
 
-        result = FaveGetPhotosResponse(**raw_result)
+        result = self.parse_response(FaveGetPhotosResponse, raw_result)
         return result
 
     async def get_tags(
@@ -332,13 +332,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.get_tags")
 
         raw_result = await self.api_request("getTags", params)
         if return_raw_response:
             return raw_result
 
-        result = FaveGetTagsResponse(**raw_result)
+        result = self.parse_response(FaveGetTagsResponse, raw_result)
         return result
 
     async def mark_seen(
@@ -350,13 +350,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.mark_seen")
 
         raw_result = await self.api_request("markSeen", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseBoolResponse(**raw_result)
+        result = self.parse_response(BaseBoolResponse, raw_result)
         return result
 
     async def remove_article(
@@ -372,13 +372,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.remove_article")
 
         raw_result = await self.api_request("removeArticle", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseBoolResponse(**raw_result)
+        result = self.parse_response(BaseBoolResponse, raw_result)
         return result
 
     async def remove_link(
@@ -394,13 +394,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.remove_link")
 
         raw_result = await self.api_request("removeLink", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def remove_page(
@@ -416,13 +416,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.remove_page")
 
         raw_result = await self.api_request("removePage", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def remove_post(
@@ -438,13 +438,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.remove_post")
 
         raw_result = await self.api_request("removePost", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def remove_product(
@@ -460,13 +460,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.remove_product")
 
         raw_result = await self.api_request("removeProduct", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def remove_tag(
@@ -480,13 +480,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.remove_tag")
 
         raw_result = await self.api_request("removeTag", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def remove_video(
@@ -502,13 +502,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.remove_video")
 
         raw_result = await self.api_request("removeVideo", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def reorder_tags(
@@ -522,13 +522,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.reorder_tags")
 
         raw_result = await self.api_request("reorderTags", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def set_page_tags(
@@ -546,13 +546,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.set_page_tags")
 
         raw_result = await self.api_request("setPageTags", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def set_tags(
@@ -576,13 +576,13 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.set_tags")
 
         raw_result = await self.api_request("setTags", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def track_page_interaction(
@@ -598,11 +598,11 @@ class Fave(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Fave.track_page_interaction")
 
         raw_result = await self.api_request("trackPageInteraction", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
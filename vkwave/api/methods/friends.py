@@ -20,13 +20,13 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.add")
 
         raw_result = await self.api_request("add", params)
         if return_raw_response:
             return raw_result
 
-        result = FriendsAddResponse(**raw_result)
+        result = self.parse_response(FriendsAddResponse, raw_result)
         return result
 
     async def add_list(
@@ -42,13 +42,13 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.add_list")
 
         raw_result = await self.api_request("addList", params)
         if return_raw_response:
             return raw_result
 
-        result = FriendsAddListResponse(**raw_result)
+        result = self.parse_response(FriendsAddListResponse, raw_result)
         return result
 
     async def are_friends(
@@ -66,16 +66,16 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.are_friends")
 
         raw_result = await self.api_request("areFriends", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            FriendsAreFriendsResponse(**raw_result)
+            self.parse_response(FriendsAreFriendsResponse, raw_result)
             if not extended
-            else FriendsAreFriendsExtendedResponse(**raw_result)
+            else self.parse_response(FriendsAreFriendsExtendedResponse, raw_result)
         )
         return result
 
@@ -90,13 +90,13 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.delete")
 
         raw_result = await self.api_request("delete", params)
         if return_raw_response:
             return raw_result
 
-        result = FriendsDeleteResponse(**raw_result)
+        result = self.parse_response(FriendsDeleteResponse, raw_result)
         return result
 
     async def delete_all_requests(
@@ -108,13 +108,13 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.delete_all_requests")
 
         raw_result = await self.api_request("deleteAllRequests", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def delete_list(
@@ -128,13 +128,13 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.delete_list")
 
         raw_result = await self.api_request("deleteList", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit(
@@ -150,13 +150,13 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.edit")
 
         raw_result = await self.api_request("edit", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit_list(
@@ -178,13 +178,13 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.edit_list")
 
         raw_result = await self.api_request("editList", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get(
@@ -212,16 +212,16 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            FriendsGetResponse(**raw_result)
+            self.parse_response(FriendsGetResponse, raw_result)
             if not fields
-            else FriendsGetFieldsResponse(**raw_result)
+            else self.parse_response(FriendsGetFieldsResponse, raw_result)
         )
         return result
 
@@ -234,13 +234,13 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.get_app_users")
 
         raw_result = await self.api_request("getAppUsers", params)
         if return_raw_response:
             return raw_result
 
-        result = FriendsGetAppUsersResponse(**raw_result)
+        result = self.parse_response(FriendsGetAppUsersResponse, raw_result)
         return result
 
     async def get_by_phones(
@@ -256,13 +256,13 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.get_by_phones")
 
         raw_result = await self.api_request("getByPhones", params)
         if return_raw_response:
             return raw_result
 
-        result = FriendsGetByPhonesResponse(**raw_result)
+        result = self.parse_response(FriendsGetByPhonesResponse, raw_result)
         return result
 
     async def get_lists(
@@ -278,13 +278,13 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.get_lists")
 
         raw_result = await self.api_request("getLists", params)
         if return_raw_response:
             return raw_result
 
-        result = FriendsGetListsResponse(**raw_result)
+        result = self.parse_response(FriendsGetListsResponse, raw_result)
         return result
 
     async def get_mutual(
@@ -308,13 +308,13 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.get_mutual")
 
         raw_result = await self.api_request("getMutual", params)
         if return_raw_response:
             return raw_result
 
-        result = FriendsGetMutualResponse(**raw_result)
+        result = self.parse_response(FriendsGetMutualResponse, raw_result)
         return result
 
     async def get_online(
@@ -338,13 +338,13 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.get_online")
 
         raw_result = await self.api_request("getOnline", params)
         if return_raw_response:
             return raw_result
 
-        result = FriendsGetOnlineResponse(**raw_result)
+        result = self.parse_response(FriendsGetOnlineResponse, raw_result)
         return result
 
     async def get_recent(
@@ -358,13 +358,13 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.get_recent")
 
         raw_result = await self.api_request("getRecent", params)
         if return_raw_response:
             return raw_result
 
-        result = FriendsGetRecentResponse(**raw_result)
+        result = self.parse_response(FriendsGetRecentResponse, raw_result)
         return result
 
     async def get_requests(
@@ -396,16 +396,16 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.get_requests")
 
         raw_result = await self.api_request("getRequests", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            FriendsGetRequestsResponse(**raw_result)
+            self.parse_response(FriendsGetRequestsResponse, raw_result)
             if not extended
-            else FriendsGetRequestsExtendedResponse(**raw_result)
+            else self.parse_response(FriendsGetRequestsExtendedResponse, raw_result)
         )
         return result
 
@@ -428,13 +428,13 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.get_suggestions")
 
         raw_result = await self.api_request("getSuggestions", params)
         if return_raw_response:
             return raw_result
 
-        result = FriendsGetSuggestionsResponse(**raw_result)
+        result = self.parse_response(FriendsGetSuggestionsResponse, raw_result)
         return result
 
     async def search(
@@ -458,11 +458,11 @@ class Friends(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Friends.search")
 
         raw_result = await self.api_request("search", params)
         if return_raw_response:
             return raw_result
 
-        result = FriendsSearchResponse(**raw_result)
+        result = self.parse_response(FriendsSearchResponse, raw_result)
         return result
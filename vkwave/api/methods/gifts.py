@@ -20,11 +20,11 @@ class Gifts(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Gifts.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = GiftsGetResponse(**raw_result)
+        result = self.parse_response(GiftsGetResponse, raw_result)
         return result
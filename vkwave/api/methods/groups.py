@@ -40,13 +40,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.add_address")
 
         raw_result = await self.api_request("addAddress", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsAddAddressResponse(**raw_result)
+        result = self.parse_response(GroupsAddAddressResponse, raw_result)
         return result
 
     async def add_callback_server(
@@ -66,13 +66,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.add_callback_server")
 
         raw_result = await self.api_request("addCallbackServer", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsAddCallbackServerResponse(**raw_result)
+        result = self.parse_response(GroupsAddCallbackServerResponse, raw_result)
         return result
 
     async def add_link(
@@ -90,13 +90,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.add_link")
 
         raw_result = await self.api_request("addLink", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsAddLinkResponse(**raw_result)
+        result = self.parse_response(GroupsAddLinkResponse, raw_result)
         return result
 
     async def approve_request(
@@ -112,13 +112,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.approve_request")
 
         raw_result = await self.api_request("approveRequest", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def ban(
@@ -142,13 +142,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.ban")
 
         raw_result = await self.api_request("ban", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def create(
@@ -170,13 +170,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.create")
 
         raw_result = await self.api_request("create", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsCreateResponse(**raw_result)
+        result = self.parse_response(GroupsCreateResponse, raw_result)
         return result
 
     async def delete_address(
@@ -192,13 +192,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.delete_address")
 
         raw_result = await self.api_request("deleteAddress", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def delete_callback_server(
@@ -214,13 +214,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.delete_callback_server")
 
         raw_result = await self.api_request("deleteCallbackServer", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def delete_link(
@@ -236,13 +236,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.delete_link")
 
         raw_result = await self.api_request("deleteLink", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def disable_online(
@@ -256,13 +256,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.disable_online")
 
         raw_result = await self.api_request("disableOnline", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit(
@@ -364,13 +364,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.edit")
 
         raw_result = await self.api_request("edit", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit_address(
@@ -410,13 +410,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.edit_address")
 
         raw_result = await self.api_request("editAddress", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsEditAddressResponse(**raw_result)
+        result = self.parse_response(GroupsEditAddressResponse, raw_result)
         return result
 
     async def edit_callback_server(
@@ -438,13 +438,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.edit_callback_server")
 
         raw_result = await self.api_request("editCallbackServer", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit_link(
@@ -462,13 +462,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.edit_link")
 
         raw_result = await self.api_request("editLink", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit_manager(
@@ -494,13 +494,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.edit_manager")
 
         raw_result = await self.api_request("editManager", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def enable_online(
@@ -514,13 +514,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.enable_online")
 
         raw_result = await self.api_request("enableOnline", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get(
@@ -544,16 +544,16 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            GroupsGetResponse(**raw_result)
+            self.parse_response(GroupsGetResponse, raw_result)
             if not extended
-            else GroupsGetExtendedResponse(**raw_result)
+            else self.parse_response(GroupsGetExtendedResponse, raw_result)
         )
         return result
 
@@ -580,13 +580,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get_addresses")
 
         raw_result = await self.api_request("getAddresses", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsGetAddressesResponse(**raw_result)
+        result = self.parse_response(GroupsGetAddressesResponse, raw_result)
         return result
 
     async def get_banned(
@@ -608,13 +608,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get_banned")
 
         raw_result = await self.api_request("getBanned", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsGetBannedResponse(**raw_result)
+        result = self.parse_response(GroupsGetBannedResponse, raw_result)
         return result
 
     async def get_by_id(
@@ -632,13 +632,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get_by_id")
 
         raw_result = await self.api_request("getById", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsGetByIdLegacyResponse(**raw_result)
+        result = self.parse_response(GroupsGetByIdLegacyResponse, raw_result)
         return result
 
     async def get_callback_confirmation_code(
@@ -652,13 +652,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get_callback_confirmation_code")
 
         raw_result = await self.api_request("getCallbackConfirmationCode", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsGetCallbackConfirmationCodeResponse(**raw_result)
+        result = self.parse_response(GroupsGetCallbackConfirmationCodeResponse, raw_result)
         return result
 
     async def get_callback_servers(
@@ -674,13 +674,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get_callback_servers")
 
         raw_result = await self.api_request("getCallbackServers", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsGetCallbackServersResponse(**raw_result)
+        result = self.parse_response(GroupsGetCallbackServersResponse, raw_result)
         return result
 
     async def get_callback_settings(
@@ -696,13 +696,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get_callback_settings")
 
         raw_result = await self.api_request("getCallbackSettings", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsGetCallbackSettingsResponse(**raw_result)
+        result = self.parse_response(GroupsGetCallbackSettingsResponse, raw_result)
         return result
 
     async def get_catalog(
@@ -718,13 +718,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get_catalog")
 
         raw_result = await self.api_request("getCatalog", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsGetCatalogResponse(**raw_result)
+        result = self.parse_response(GroupsGetCatalogResponse, raw_result)
         return result
 
     async def get_catalog_info(
@@ -740,16 +740,16 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get_catalog_info")
 
         raw_result = await self.api_request("getCatalogInfo", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            GroupsGetCatalogInfoResponse(**raw_result)
+            self.parse_response(GroupsGetCatalogInfoResponse, raw_result)
             if not extended
-            else GroupsGetCatalogInfoExtendedResponse(**raw_result)
+            else self.parse_response(GroupsGetCatalogInfoExtendedResponse, raw_result)
         )
         return result
 
@@ -772,13 +772,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get_invited_users")
 
         raw_result = await self.api_request("getInvitedUsers", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsGetInvitedUsersResponse(**raw_result)
+        result = self.parse_response(GroupsGetInvitedUsersResponse, raw_result)
         return result
 
     async def get_invites(
@@ -796,16 +796,16 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get_invites")
 
         raw_result = await self.api_request("getInvites", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            GroupsGetInvitesResponse(**raw_result)
+            self.parse_response(GroupsGetInvitesResponse, raw_result)
             if not extended
-            else GroupsGetInvitesExtendedResponse(**raw_result)
+            else self.parse_response(GroupsGetInvitesExtendedResponse, raw_result)
         )
         return result
 
@@ -820,13 +820,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get_long_poll_server")
 
         raw_result = await self.api_request("getLongPollServer", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsGetLongPollServerResponse(**raw_result)
+        result = self.parse_response(GroupsGetLongPollServerResponse, raw_result)
         return result
 
     async def get_long_poll_settings(
@@ -840,13 +840,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get_long_poll_settings")
 
         raw_result = await self.api_request("getLongPollSettings", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsGetLongPollSettingsResponse(**raw_result)
+        result = self.parse_response(GroupsGetLongPollSettingsResponse, raw_result)
         return result
 
     async def get_members(
@@ -870,16 +870,16 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get_members")
 
         raw_result = await self.api_request("getMembers", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            GroupsGetMembersResponse(**raw_result)
+            self.parse_response(GroupsGetMembersResponse, raw_result)
             if not fields and (not filter or filter != "managers")
-            else GroupsGetMembersFieldsResponse(**raw_result)
+            else self.parse_response(GroupsGetMembersFieldsResponse, raw_result)
         )
         return result
 
@@ -900,16 +900,16 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get_requests")
 
         raw_result = await self.api_request("getRequests", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            GroupsGetRequestsResponse(**raw_result)
+            self.parse_response(GroupsGetRequestsResponse, raw_result)
             if not fields
-            else GroupsGetRequestsFieldsResponse(**raw_result)
+            else self.parse_response(GroupsGetRequestsFieldsResponse, raw_result)
         )
         return result
 
@@ -924,13 +924,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get_settings")
 
         raw_result = await self.api_request("getSettings", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsGetSettingsResponse(**raw_result)
+        result = self.parse_response(GroupsGetSettingsResponse, raw_result)
         return result
 
     async def get_tag_list(
@@ -944,13 +944,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get_tag_list")
 
         raw_result = await self.api_request("getTagList", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsGetTagListResponse(**raw_result)
+        result = self.parse_response(GroupsGetTagListResponse, raw_result)
         return result
 
     async def get_token_permissions(
@@ -962,13 +962,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.get_token_permissions")
 
         raw_result = await self.api_request("getTokenPermissions", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsGetTokenPermissionsResponse(**raw_result)
+        result = self.parse_response(GroupsGetTokenPermissionsResponse, raw_result)
         return result
 
     async def invite(
@@ -984,13 +984,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.invite")
 
         raw_result = await self.api_request("invite", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def is_member(
@@ -1010,16 +1010,16 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.is_member")
 
         raw_result = await self.api_request("isMember", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            GroupsIsMemberResponse(**raw_result)
+            self.parse_response(GroupsIsMemberResponse, raw_result)
             if not extended
-            else GroupsIsMemberExtendedResponse(**raw_result)
+            else self.parse_response(GroupsIsMemberExtendedResponse, raw_result)
         )
         return result
 
@@ -1036,13 +1036,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.join")
 
         raw_result = await self.api_request("join", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def leave(
@@ -1056,13 +1056,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.leave")
 
         raw_result = await self.api_request("leave", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def remove_user(
@@ -1078,13 +1078,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.remove_user")
 
         raw_result = await self.api_request("removeUser", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def reorder_link(
@@ -1102,13 +1102,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.reorder_link")
 
         raw_result = await self.api_request("reorderLink", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def search(
@@ -1138,13 +1138,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.search")
 
         raw_result = await self.api_request("search", params)
         if return_raw_response:
             return raw_result
 
-        result = GroupsSearchResponse(**raw_result)
+        result = self.parse_response(GroupsSearchResponse, raw_result)
         return result
 
     async def set_callback_settings(
@@ -1266,13 +1266,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.set_callback_settings")
 
         raw_result = await self.api_request("setCallbackSettings", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def set_long_poll_settings(
@@ -1388,13 +1388,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.set_long_poll_settings")
 
         raw_result = await self.api_request("setLongPollSettings", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def set_settings(
@@ -1416,13 +1416,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.set_settings")
 
         raw_result = await self.api_request("setSettings", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def set_user_note(
@@ -1440,13 +1440,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.set_user_note")
 
         raw_result = await self.api_request("setUserNote", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseBoolResponse(**raw_result)
+        result = self.parse_response(BaseBoolResponse, raw_result)
         return result
 
     async def tag_add(
@@ -1464,13 +1464,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.tag_add")
 
         raw_result = await self.api_request("tagAdd", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseBoolResponse(**raw_result)
+        result = self.parse_response(BaseBoolResponse, raw_result)
         return result
 
     async def tag_bind(
@@ -1490,13 +1490,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.tag_bind")
 
         raw_result = await self.api_request("tagBind", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseBoolResponse(**raw_result)
+        result = self.parse_response(BaseBoolResponse, raw_result)
         return result
 
     async def tag_delete(
@@ -1512,13 +1512,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.tag_delete")
 
         raw_result = await self.api_request("tagDelete", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseBoolResponse(**raw_result)
+        result = self.parse_response(BaseBoolResponse, raw_result)
         return result
 
     async def tag_update(
@@ -1536,13 +1536,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.tag_update")
 
         raw_result = await self.api_request("tagUpdate", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseBoolResponse(**raw_result)
+        result = self.parse_response(BaseBoolResponse, raw_result)
         return result
 
     async def toggle_market(
@@ -1558,13 +1558,13 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.toggle_market")
 
         raw_result = await self.api_request("toggleMarket", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def unban(
@@ -1580,11 +1580,11 @@ class Groups(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Groups.unban")
 
         raw_result = await self.api_request("unban", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
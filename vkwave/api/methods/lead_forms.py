@@ -42,12 +42,12 @@ class LeadForms(Category):
         :param return_raw_response: - return result at dict
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "LeadForms.create")
         raw_result = await self.api_request("create", params)
         if return_raw_response:
             return raw_result
 
-        result = LeadFormsCreateResponse(**raw_result)
+        result = self.parse_response(LeadFormsCreateResponse, raw_result)
         return result
 
     async def delete(
@@ -60,12 +60,12 @@ class LeadForms(Category):
         :param return_raw_response: - return result at dict
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "LeadForms.delete")
         raw_result = await self.api_request("delete", params)
         if return_raw_response:
             return raw_result
 
-        result = LeadFormsDeleteResponse(**raw_result)
+        result = self.parse_response(LeadFormsDeleteResponse, raw_result)
         return result
 
     async def get(
@@ -78,12 +78,12 @@ class LeadForms(Category):
         :param return_raw_response: - return result at dict
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "LeadForms.get")
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = LeadFormsForm(**raw_result)
+        result = self.parse_response(LeadFormsForm, raw_result)
         return result
 
     async def get_leads(
@@ -103,12 +103,12 @@ class LeadForms(Category):
         :param return_raw_response: - return result at dict
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "LeadForms.get_leads")
         raw_result = await self.api_request("getLeads", params)
         if return_raw_response:
             return raw_result
 
-        result = LeadFormsGetLeadsResponse(**raw_result)
+        result = self.parse_response(LeadFormsGetLeadsResponse, raw_result)
         return result
 
     async def get_upload_url(
@@ -119,12 +119,12 @@ class LeadForms(Category):
         :param return_raw_response: - return result at dict
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "LeadForms.get_upload_url")
         raw_result = await self.api_request("getUploadURL", params)
         if return_raw_response:
             return raw_result
 
-        result = LeadFormsUploadUrlResponse(**raw_result)
+        result = self.parse_response(LeadFormsUploadUrlResponse, raw_result)
         return result
 
     async def list(
@@ -136,12 +136,12 @@ class LeadForms(Category):
         :param return_raw_response: - return result at dict
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "LeadForms.list")
         raw_result = await self.api_request("list", params)
         if return_raw_response:
             return raw_result
 
-        result = LeadFormsListResponse(**raw_result)
+        result = self.parse_response(LeadFormsListResponse, raw_result)
         return result
 
     async def update(
@@ -183,10 +183,10 @@ class LeadForms(Category):
         :param return_raw_response: - return result at dict
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "LeadForms.update")
         raw_result = await self.api_request("update", params)
         if return_raw_response:
             return raw_result
 
-        result = LeadFormsCreateResponse(**raw_result)
+        result = self.parse_response(LeadFormsCreateResponse, raw_result)
         return result
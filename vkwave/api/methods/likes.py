@@ -22,13 +22,13 @@ class Likes(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Likes.add")
 
         raw_result = await self.api_request("add", params)
         if return_raw_response:
             return raw_result
 
-        result = LikesAddResponse(**raw_result)
+        result = self.parse_response(LikesAddResponse, raw_result)
         return result
 
     async def delete(
@@ -48,13 +48,13 @@ class Likes(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Likes.delete")
 
         raw_result = await self.api_request("delete", params)
         if return_raw_response:
             return raw_result
 
-        result = LikesDeleteResponse(**raw_result)
+        result = self.parse_response(LikesDeleteResponse, raw_result)
         return result
 
     async def get_list(
@@ -86,16 +86,16 @@ class Likes(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Likes.get_list")
 
         raw_result = await self.api_request("getList", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            LikesGetListResponse(**raw_result)
+            self.parse_response(LikesGetListResponse, raw_result)
             if not extended
-            else LikesGetListExtendedResponse(**raw_result)
+            else self.parse_response(LikesGetListExtendedResponse, raw_result)
         )
         return result
 
@@ -116,11 +116,11 @@ class Likes(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Likes.is_liked")
 
         raw_result = await self.api_request("isLiked", params)
         if return_raw_response:
             return raw_result
 
-        result = LikesIsLikedResponse(**raw_result)
+        result = self.parse_response(LikesIsLikedResponse, raw_result)
         return result
@@ -44,13 +44,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.add")
 
         raw_result = await self.api_request("add", params)
         if return_raw_response:
             return raw_result
 
-        result = MarketAddResponse(**raw_result)
+        result = self.parse_response(MarketAddResponse, raw_result)
         return result
 
     async def add_album(
@@ -70,13 +70,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.add_album")
 
         raw_result = await self.api_request("addAlbum", params)
         if return_raw_response:
             return raw_result
 
-        result = MarketAddAlbumResponse(**raw_result)
+        result = self.parse_response(MarketAddAlbumResponse, raw_result)
         return result
 
     async def add_to_album(
@@ -94,13 +94,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.add_to_album")
 
         raw_result = await self.api_request("addToAlbum", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def create_comment(
@@ -128,13 +128,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.create_comment")
 
         raw_result = await self.api_request("createComment", params)
         if return_raw_response:
             return raw_result
 
-        result = MarketCreateCommentResponse(**raw_result)
+        result = self.parse_response(MarketCreateCommentResponse, raw_result)
         return result
 
     async def delete(
@@ -150,13 +150,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.delete")
 
         raw_result = await self.api_request("delete", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def delete_album(
@@ -172,13 +172,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.delete_album")
 
         raw_result = await self.api_request("deleteAlbum", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def delete_comment(
@@ -194,13 +194,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.delete_comment")
 
         raw_result = await self.api_request("deleteComment", params)
         if return_raw_response:
             return raw_result
 
-        result = MarketDeleteCommentResponse(**raw_result)
+        result = self.parse_response(MarketDeleteCommentResponse, raw_result)
         return result
 
     async def edit(
@@ -234,13 +234,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.edit")
 
         raw_result = await self.api_request("edit", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit_album(
@@ -262,13 +262,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.edit_album")
 
         raw_result = await self.api_request("editAlbum", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit_comment(
@@ -288,13 +288,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.edit_comment")
 
         raw_result = await self.api_request("editComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit_order(
@@ -332,13 +332,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.edit_order")
 
         raw_result = await self.api_request("editOrder", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get(
@@ -360,16 +360,16 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            MarketGetResponse(**raw_result)
+            self.parse_response(MarketGetResponse, raw_result)
             if not extended
-            else MarketGetExtendedResponse(**raw_result)
+            else self.parse_response(MarketGetExtendedResponse, raw_result)
         )
         return result
 
@@ -386,13 +386,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.get_album_by_id")
 
         raw_result = await self.api_request("getAlbumById", params)
         if return_raw_response:
             return raw_result
 
-        result = MarketGetAlbumByIdResponse(**raw_result)
+        result = self.parse_response(MarketGetAlbumByIdResponse, raw_result)
         return result
 
     async def get_albums(
@@ -410,13 +410,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.get_albums")
 
         raw_result = await self.api_request("getAlbums", params)
         if return_raw_response:
             return raw_result
 
-        result = MarketGetAlbumsResponse(**raw_result)
+        result = self.parse_response(MarketGetAlbumsResponse, raw_result)
         return result
 
     async def get_by_id(
@@ -432,16 +432,16 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.get_by_id")
 
         raw_result = await self.api_request("getById", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            MarketGetByIdResponse(**raw_result)
+            self.parse_response(MarketGetByIdResponse, raw_result)
             if not extended
-            else MarketGetByIdExtendedResponse(**raw_result)
+            else self.parse_response(MarketGetByIdExtendedResponse, raw_result)
         )
         return result
 
@@ -458,13 +458,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.get_categories")
 
         raw_result = await self.api_request("getCategories", params)
         if return_raw_response:
             return raw_result
 
-        result = MarketGetCategoriesNewResponse(**raw_result)
+        result = self.parse_response(MarketGetCategoriesNewResponse, raw_result)
         return result
 
     async def get_comments(
@@ -494,13 +494,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.get_comments")
 
         raw_result = await self.api_request("getComments", params)
         if return_raw_response:
             return raw_result
 
-        result = MarketGetCommentsResponse(**raw_result)
+        result = self.parse_response(MarketGetCommentsResponse, raw_result)
         return result
 
     async def get_group_orders(
@@ -518,13 +518,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.get_group_orders")
 
         raw_result = await self.api_request("getGroupOrders", params)
         if return_raw_response:
             return raw_result
 
-        result = MarketGetGroupOrdersResponse(**raw_result)
+        result = self.parse_response(MarketGetGroupOrdersResponse, raw_result)
         return result
 
     async def get_order_by_id(
@@ -542,13 +542,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.get_order_by_id")
 
         raw_result = await self.api_request("getOrderById", params)
         if return_raw_response:
             return raw_result
 
-        result = MarketGetOrderByIdResponse(**raw_result)
+        result = self.parse_response(MarketGetOrderByIdResponse, raw_result)
         return result
 
     async def get_order_items(
@@ -568,13 +568,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.get_order_items")
 
         raw_result = await self.api_request("getOrderItems", params)
         if return_raw_response:
             return raw_result
 
-        result = MarketGetOrderItemsResponse(**raw_result)
+        result = self.parse_response(MarketGetOrderItemsResponse, raw_result)
         return result
 
     async def get_orders(
@@ -592,16 +592,16 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.get_orders")
 
         raw_result = await self.api_request("getOrders", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            MarketGetOrdersResponse(**raw_result)
+            self.parse_response(MarketGetOrdersResponse, raw_result)
             if not extended
-            else MarketGetOrdersExtendedResponse(**raw_result)
+            else self.parse_response(MarketGetOrdersExtendedResponse, raw_result)
         )
         return result
 
@@ -620,13 +620,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.remove_from_album")
 
         raw_result = await self.api_request("removeFromAlbum", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def reorder_albums(
@@ -646,13 +646,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.reorder_albums")
 
         raw_result = await self.api_request("reorderAlbums", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def reorder_items(
@@ -674,13 +674,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.reorder_items")
 
         raw_result = await self.api_request("reorderItems", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def report(
@@ -698,13 +698,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.report")
 
         raw_result = await self.api_request("report", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def report_comment(
@@ -722,13 +722,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.report_comment")
 
         raw_result = await self.api_request("reportComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def restore(
@@ -744,13 +744,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.restore")
 
         raw_result = await self.api_request("restore", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def restore_comment(
@@ -766,13 +766,13 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.restore_comment")
 
         raw_result = await self.api_request("restoreComment", params)
         if return_raw_response:
             return raw_result
 
-        result = MarketRestoreCommentResponse(**raw_result)
+        result = self.parse_response(MarketRestoreCommentResponse, raw_result)
         return result
 
     async def search(
@@ -806,15 +806,15 @@ class Market(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Market.search")
 
         raw_result = await self.api_request("search", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            MarketSearchResponse(**raw_result)
+            self.parse_response(MarketSearchResponse, raw_result)
             if not extended
-            else MarketSearchExtendedResponse(**raw_result)
+            else self.parse_response(MarketSearchExtendedResponse, raw_result)
         )
         return result
@@ -21,13 +21,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.add_chat_user")
 
         raw_result = await self.api_request("addChatUser", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def allow_messages_from_group(
@@ -43,13 +43,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.allow_messages_from_group")
 
         raw_result = await self.api_request("allowMessagesFromGroup", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def create_chat(
@@ -67,13 +67,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.create_chat")
 
         raw_result = await self.api_request("createChat", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesCreateChatResponse(**raw_result)
+        result = self.parse_response(MessagesCreateChatResponse, raw_result)
         return result
 
     async def delete(
@@ -97,13 +97,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.delete")
 
         raw_result = await self.api_request("delete", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesDeleteResponse(**raw_result)
+        result = self.parse_response(MessagesDeleteResponse, raw_result)
         return result
 
     async def delete_chat_photo(
@@ -119,13 +119,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.delete_chat_photo")
 
         raw_result = await self.api_request("deleteChatPhoto", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesDeleteChatPhotoResponse(**raw_result)
+        result = self.parse_response(MessagesDeleteChatPhotoResponse, raw_result)
         return result
 
     async def delete_conversation(
@@ -143,13 +143,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.delete_conversation")
 
         raw_result = await self.api_request("deleteConversation", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesDeleteConversationResponse(**raw_result)
+        result = self.parse_response(MessagesDeleteConversationResponse, raw_result)
         return result
 
     async def deny_messages_from_group(
@@ -163,13 +163,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.deny_messages_from_group")
 
         raw_result = await self.api_request("denyMessagesFromGroup", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit(
@@ -209,13 +209,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.edit")
 
         raw_result = await self.api_request("edit", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesEditResponse(**raw_result)
+        result = self.parse_response(MessagesEditResponse, raw_result)
         return result
 
     async def edit_chat(
@@ -231,13 +231,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.edit_chat")
 
         raw_result = await self.api_request("editChat", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get_by_conversation_message_id(
@@ -259,13 +259,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.get_by_conversation_message_id")
 
         raw_result = await self.api_request("getByConversationMessageId", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesGetByConversationMessageIdResponse(**raw_result)
+        result = self.parse_response(MessagesGetByConversationMessageIdResponse, raw_result)
         return result
 
     async def get_by_id(
@@ -287,16 +287,16 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.get_by_id")
 
         raw_result = await self.api_request("getById", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            MessagesGetByIdResponse(**raw_result)
+            self.parse_response(MessagesGetByIdResponse, raw_result)
             if not extended
-            else MessagesGetByIdExtendedResponse(**raw_result)
+            else self.parse_response(MessagesGetByIdExtendedResponse, raw_result)
         )
         return result
 
@@ -315,13 +315,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.get_chat_preview")
 
         raw_result = await self.api_request("getChatPreview", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesGetChatPreviewResponse(**raw_result)
+        result = self.parse_response(MessagesGetChatPreviewResponse, raw_result)
         return result
 
     async def get_conversation_members(
@@ -339,13 +339,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.get_conversation_members")
 
         raw_result = await self.api_request("getConversationMembers", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesGetConversationMembersResponse(**raw_result)
+        result = self.parse_response(MessagesGetConversationMembersResponse, raw_result)
         return result
 
     async def get_conversations(
@@ -371,13 +371,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.get_conversations")
 
         raw_result = await self.api_request("getConversations", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesGetConversationsResponse(**raw_result)
+        result = self.parse_response(MessagesGetConversationsResponse, raw_result)
         return result
 
     async def get_conversations_by_id(
@@ -401,16 +401,16 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.get_conversations_by_id")
 
         raw_result = await self.api_request("getConversationsById", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            MessagesGetConversationsByIdResponse(**raw_result)
+            self.parse_response(MessagesGetConversationsByIdResponse, raw_result)
             if not extended
-            else MessagesGetConversationsByIdExtendedResponse(**raw_result)
+            else self.parse_response(MessagesGetConversationsByIdExtendedResponse, raw_result)
         )
         return result
 
@@ -441,13 +441,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.get_history")
 
         raw_result = await self.api_request("getHistory", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesGetHistoryResponse(**raw_result)
+        result = self.parse_response(MessagesGetHistoryResponse, raw_result)
         return result
 
     async def get_history_attachments(
@@ -477,13 +477,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.get_history_attachments")
 
         raw_result = await self.api_request("getHistoryAttachments", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesGetHistoryAttachmentsResponse(**raw_result)
+        result = self.parse_response(MessagesGetHistoryAttachmentsResponse, raw_result)
         return result
 
     async def get_important_messages(
@@ -513,16 +513,16 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.get_important_messages")
 
         raw_result = await self.api_request("getImportantMessages", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            MessagesGetImportantMessagesResponse(**raw_result)
+            self.parse_response(MessagesGetImportantMessagesResponse, raw_result)
             if not extended
-            else MessagesGetImportantMessagesExtendedResponse(**raw_result)
+            else self.parse_response(MessagesGetImportantMessagesExtendedResponse, raw_result)
         )
         return result
 
@@ -541,13 +541,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.get_invite_link")
 
         raw_result = await self.api_request("getInviteLink", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesGetInviteLinkResponse(**raw_result)
+        result = self.parse_response(MessagesGetInviteLinkResponse, raw_result)
         return result
 
     async def get_last_activity(
@@ -561,13 +561,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.get_last_activity")
 
         raw_result = await self.api_request("getLastActivity", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesGetLastActivityResponse(**raw_result)
+        result = self.parse_response(MessagesGetLastActivityResponse, raw_result)
         return result
 
     async def get_long_poll_history(
@@ -603,13 +603,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.get_long_poll_history")
 
         raw_result = await self.api_request("getLongPollHistory", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesGetLongPollHistoryResponse(**raw_result)
+        result = self.parse_response(MessagesGetLongPollHistoryResponse, raw_result)
         return result
 
     async def get_long_poll_server(
@@ -627,13 +627,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.get_long_poll_server")
 
         raw_result = await self.api_request("getLongPollServer", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesGetLongPollServerResponse(**raw_result)
+        result = self.parse_response(MessagesGetLongPollServerResponse, raw_result)
         return result
 
     async def is_messages_from_group_allowed(
@@ -649,13 +649,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.is_messages_from_group_allowed")
 
         raw_result = await self.api_request("isMessagesFromGroupAllowed", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesIsMessagesFromGroupAllowedResponse(**raw_result)
+        result = self.parse_response(MessagesIsMessagesFromGroupAllowedResponse, raw_result)
         return result
 
     async def join_chat_by_invite_link(
@@ -669,13 +669,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.join_chat_by_invite_link")
 
         raw_result = await self.api_request("joinChatByInviteLink", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesJoinChatByInviteLinkResponse(**raw_result)
+        result = self.parse_response(MessagesJoinChatByInviteLinkResponse, raw_result)
         return result
 
     async def mark_as_answered_conversation(
@@ -693,13 +693,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.mark_as_answered_conversation")
 
         raw_result = await self.api_request("markAsAnsweredConversation", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def mark_as_important(
@@ -715,13 +715,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.mark_as_important")
 
         raw_result = await self.api_request("markAsImportant", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesMarkAsImportantResponse(**raw_result)
+        result = self.parse_response(MessagesMarkAsImportantResponse, raw_result)
         return result
 
     async def mark_as_important_conversation(
@@ -739,13 +739,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.mark_as_important_conversation")
 
         raw_result = await self.api_request("markAsImportantConversation", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def mark_as_read(
@@ -767,13 +767,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.mark_as_read")
 
         raw_result = await self.api_request("markAsRead", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def pin(
@@ -791,13 +791,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.pin")
 
         raw_result = await self.api_request("pin", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesPinResponse(**raw_result)
+        result = self.parse_response(MessagesPinResponse, raw_result)
         return result
 
     async def remove_chat_user(
@@ -815,13 +815,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.remove_chat_user")
 
         raw_result = await self.api_request("removeChatUser", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def restore(
@@ -837,13 +837,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.restore")
 
         raw_result = await self.api_request("restore", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def search(
@@ -873,13 +873,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.search")
 
         raw_result = await self.api_request("search", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesSearchResponse(**raw_result)
+        result = self.parse_response(MessagesSearchResponse, raw_result)
         return result
 
     async def search_conversations(
@@ -901,13 +901,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.search_conversations")
 
         raw_result = await self.api_request("searchConversations", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesSearchConversationsResponse(**raw_result)
+        result = self.parse_response(MessagesSearchConversationsResponse, raw_result)
         return result
 
     async def send(
@@ -971,16 +971,16 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.send")
 
         raw_result = await self.api_request("send", params)
         if return_raw_response:
             return raw_result
 
         if user_ids or peer_ids:
-            result = MessagesSendPeerIdsResponse(**raw_result)
+            result = self.parse_response(MessagesSendPeerIdsResponse, raw_result)
         else:
-            result = MessagesSendResponse(**raw_result)
+            result = self.parse_response(MessagesSendResponse, raw_result)
         return result
 
     async def send_message_event_answer(
@@ -1000,13 +1000,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.send_message_event_answer")
 
         raw_result = await self.api_request("sendMessageEventAnswer", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def set_activity(
@@ -1026,13 +1026,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.set_activity")
 
         raw_result = await self.api_request("setActivity", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def set_chat_photo(
@@ -1046,13 +1046,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.set_chat_photo")
 
         raw_result = await self.api_request("setChatPhoto", params)
         if return_raw_response:
             return raw_result
 
-        result = MessagesSetChatPhotoResponse(**raw_result)
+        result = self.parse_response(MessagesSetChatPhotoResponse, raw_result)
         return result
 
     async def unpin(
@@ -1068,13 +1068,13 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.unpin")
 
         raw_result = await self.api_request("unpin", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def set_conversation_style(
@@ -1092,10 +1092,10 @@ class Messages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Messages.set_conversation_style")
 
         raw_result = await self.api_request("setConversationStyle", params)
         if return_raw_response:
             return raw_result
 
-        return BaseOkResponse(**raw_result)
+        return self.parse_response(BaseOkResponse, raw_result)
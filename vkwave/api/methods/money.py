@@ -28,11 +28,11 @@ class Money(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Money.send_request")
 
         raw_result = await self.api_request("sendRequest", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
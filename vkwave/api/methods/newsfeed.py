@@ -18,13 +18,13 @@ class Newsfeed(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Newsfeed.add_ban")
 
         raw_result = await self.api_request("addBan", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def delete_ban(
@@ -40,13 +40,13 @@ class Newsfeed(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Newsfeed.delete_ban")
 
         raw_result = await self.api_request("deleteBan", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def delete_list(
@@ -60,13 +60,13 @@ class Newsfeed(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Newsfeed.delete_list")
 
         raw_result = await self.api_request("deleteList", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get(
@@ -98,13 +98,13 @@ class Newsfeed(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Newsfeed.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = NewsfeedGenericResponse(**raw_result)
+        result = self.parse_response(NewsfeedGenericResponse, raw_result)
         return result
 
     async def get_banned(
@@ -122,16 +122,16 @@ class Newsfeed(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Newsfeed.get_banned")
 
         raw_result = await self.api_request("getBanned", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            NewsfeedGetBannedResponse(**raw_result)
+            self.parse_response(NewsfeedGetBannedResponse, raw_result)
             if not extended
-            else NewsfeedGetBannedExtendedResponse(**raw_result)
+            else self.parse_response(NewsfeedGetBannedExtendedResponse, raw_result)
         )
         return result
 
@@ -160,13 +160,13 @@ class Newsfeed(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Newsfeed.get_comments")
 
         raw_result = await self.api_request("getComments", params)
         if return_raw_response:
             return raw_result
 
-        result = NewsfeedGetCommentsResponse(**raw_result)
+        result = self.parse_response(NewsfeedGetCommentsResponse, raw_result)
         return result
 
     async def get_lists(
@@ -182,16 +182,16 @@ class Newsfeed(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Newsfeed.get_lists")
 
         raw_result = await self.api_request("getLists", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            NewsfeedGetListsResponse(**raw_result)
+            self.parse_response(NewsfeedGetListsResponse, raw_result)
             if not extended
-            else NewsfeedGetListsExtendedResponse(**raw_result)
+            else self.parse_response(NewsfeedGetListsExtendedResponse, raw_result)
         )
         return result
 
@@ -214,13 +214,13 @@ class Newsfeed(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Newsfeed.get_mentions")
 
         raw_result = await self.api_request("getMentions", params)
         if return_raw_response:
             return raw_result
 
-        result = NewsfeedGetMentionsResponse(**raw_result)
+        result = self.parse_response(NewsfeedGetMentionsResponse, raw_result)
         return result
 
     async def get_recommended(
@@ -244,13 +244,13 @@ class Newsfeed(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Newsfeed.get_recommended")
 
         raw_result = await self.api_request("getRecommended", params)
         if return_raw_response:
             return raw_result
 
-        result = NewsfeedGenericResponse(**raw_result)
+        result = self.parse_response(NewsfeedGenericResponse, raw_result)
         return result
 
     async def get_suggested_sources(
@@ -270,13 +270,13 @@ class Newsfeed(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Newsfeed.get_suggested_sources")
 
         raw_result = await self.api_request("getSuggestedSources", params)
         if return_raw_response:
             return raw_result
 
-        result = NewsfeedGetSuggestedSourcesResponse(**raw_result)
+        result = self.parse_response(NewsfeedGetSuggestedSourcesResponse, raw_result)
         return result
 
     async def ignore_item(
@@ -294,13 +294,13 @@ class Newsfeed(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Newsfeed.ignore_item")
 
         raw_result = await self.api_request("ignoreItem", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def save_list(
@@ -320,13 +320,13 @@ class Newsfeed(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Newsfeed.save_list")
 
         raw_result = await self.api_request("saveList", params)
         if return_raw_response:
             return raw_result
 
-        result = NewsfeedSaveListResponse(**raw_result)
+        result = self.parse_response(NewsfeedSaveListResponse, raw_result)
         return result
 
     async def search(
@@ -356,16 +356,16 @@ class Newsfeed(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Newsfeed.search")
 
         raw_result = await self.api_request("search", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            NewsfeedSearchResponse(**raw_result)
+            self.parse_response(NewsfeedSearchResponse, raw_result)
             if not extended
-            else NewsfeedSearchExtendedResponse(**raw_result)
+            else self.parse_response(NewsfeedSearchExtendedResponse, raw_result)
         )
         return result
 
@@ -386,13 +386,13 @@ class Newsfeed(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Newsfeed.unignore_item")
 
         raw_result = await self.api_request("unignoreItem", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def unsubscribe(
@@ -410,11 +410,11 @@ class Newsfeed(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Newsfeed.unsubscribe")
 
         raw_result = await self.api_request("unsubscribe", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
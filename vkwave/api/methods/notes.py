@@ -22,13 +22,13 @@ class Notes(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Notes.add")
 
         raw_result = await self.api_request("add", params)
         if return_raw_response:
             return raw_result
 
-        result = NotesAddResponse(**raw_result)
+        result = self.parse_response(NotesAddResponse, raw_result)
         return result
 
     async def create_comment(
@@ -50,13 +50,13 @@ class Notes(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Notes.create_comment")
 
         raw_result = await self.api_request("createComment", params)
         if return_raw_response:
             return raw_result
 
-        result = NotesCreateCommentResponse(**raw_result)
+        result = self.parse_response(NotesCreateCommentResponse, raw_result)
         return result
 
     async def delete(
@@ -70,13 +70,13 @@ class Notes(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Notes.delete")
 
         raw_result = await self.api_request("delete", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def delete_comment(
@@ -92,13 +92,13 @@ class Notes(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Notes.delete_comment")
 
         raw_result = await self.api_request("deleteComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit(
@@ -120,13 +120,13 @@ class Notes(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Notes.edit")
 
         raw_result = await self.api_request("edit", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit_comment(
@@ -144,13 +144,13 @@ class Notes(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Notes.edit_comment")
 
         raw_result = await self.api_request("editComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get(
@@ -172,13 +172,13 @@ class Notes(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Notes.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = NotesGetResponse(**raw_result)
+        result = self.parse_response(NotesGetResponse, raw_result)
         return result
 
     async def get_by_id(
@@ -196,13 +196,13 @@ class Notes(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Notes.get_by_id")
 
         raw_result = await self.api_request("getById", params)
         if return_raw_response:
             return raw_result
 
-        result = NotesGetByIdResponse(**raw_result)
+        result = self.parse_response(NotesGetByIdResponse, raw_result)
         return result
 
     async def get_comments(
@@ -224,13 +224,13 @@ class Notes(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Notes.get_comments")
 
         raw_result = await self.api_request("getComments", params)
         if return_raw_response:
             return raw_result
 
-        result = NotesGetCommentsResponse(**raw_result)
+        result = self.parse_response(NotesGetCommentsResponse, raw_result)
         return result
 
     async def restore_comment(
@@ -246,11 +246,11 @@ class Notes(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Notes.restore_comment")
 
         raw_result = await self.api_request("restoreComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
@@ -24,13 +24,13 @@ class Notifications(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Notifications.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = NotificationsGetResponse(**raw_result)
+        result = self.parse_response(NotificationsGetResponse, raw_result)
         return result
 
     async def mark_as_viewed(
@@ -42,13 +42,13 @@ class Notifications(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Notifications.mark_as_viewed")
 
         raw_result = await self.api_request("markAsViewed", params)
         if return_raw_response:
             return raw_result
 
-        result = NotificationsMarkAsViewedResponse(**raw_result)
+        result = self.parse_response(NotificationsMarkAsViewedResponse, raw_result)
         return result
 
     async def send_message(
@@ -70,11 +70,11 @@ class Notifications(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Notifications.send_message")
 
         raw_result = await self.api_request("sendMessage", params)
         if return_raw_response:
             return raw_result
 
-        result = NotificationsSendMessageResponse(**raw_result)
+        result = self.parse_response(NotificationsSendMessageResponse, raw_result)
         return result
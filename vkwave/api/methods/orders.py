@@ -20,13 +20,13 @@ class Orders(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Orders.cancel_subscription")
 
         raw_result = await self.api_request("cancelSubscription", params)
         if return_raw_response:
             return raw_result
 
-        result = OrdersCancelSubscriptionResponse(**raw_result)
+        result = self.parse_response(OrdersCancelSubscriptionResponse, raw_result)
         return result
 
     async def change_state(
@@ -46,13 +46,13 @@ class Orders(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Orders.change_state")
 
         raw_result = await self.api_request("changeState", params)
         if return_raw_response:
             return raw_result
 
-        result = OrdersChangeStateResponse(**raw_result)
+        result = self.parse_response(OrdersChangeStateResponse, raw_result)
         return result
 
     async def get(
@@ -70,13 +70,13 @@ class Orders(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Orders.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = OrdersGetResponse(**raw_result)
+        result = self.parse_response(OrdersGetResponse, raw_result)
         return result
 
     async def get_amount(
@@ -92,13 +92,13 @@ class Orders(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Orders.get_amount")
 
         raw_result = await self.api_request("getAmount", params)
         if return_raw_response:
             return raw_result
 
-        result = OrdersGetAmountResponse(**raw_result)
+        result = self.parse_response(OrdersGetAmountResponse, raw_result)
         return result
 
     async def get_by_id(
@@ -116,13 +116,13 @@ class Orders(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Orders.get_by_id")
 
         raw_result = await self.api_request("getById", params)
         if return_raw_response:
             return raw_result
 
-        result = OrdersGetByIdResponse(**raw_result)
+        result = self.parse_response(OrdersGetByIdResponse, raw_result)
         return result
 
     async def get_user_subscription_by_id(
@@ -138,13 +138,13 @@ class Orders(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Orders.get_user_subscription_by_id")
 
         raw_result = await self.api_request("getUserSubscriptionById", params)
         if return_raw_response:
             return raw_result
 
-        result = OrdersGetUserSubscriptionByIdResponse(**raw_result)
+        result = self.parse_response(OrdersGetUserSubscriptionByIdResponse, raw_result)
         return result
 
     async def get_user_subscriptions(
@@ -158,13 +158,13 @@ class Orders(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Orders.get_user_subscriptions")
 
         raw_result = await self.api_request("getUserSubscriptions", params)
         if return_raw_response:
             return raw_result
 
-        result = OrdersGetUserSubscriptionsResponse(**raw_result)
+        result = self.parse_response(OrdersGetUserSubscriptionsResponse, raw_result)
         return result
 
     async def update_subscription(
@@ -182,11 +182,11 @@ class Orders(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Orders.update_subscription")
 
         raw_result = await self.api_request("updateSubscription", params)
         if return_raw_response:
             return raw_result
 
-        result = OrdersUpdateSubscriptionResponse(**raw_result)
+        result = self.parse_response(OrdersUpdateSubscriptionResponse, raw_result)
         return result
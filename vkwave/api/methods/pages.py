@@ -16,13 +16,13 @@ class Pages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Pages.clear_cache")
 
         raw_result = await self.api_request("clearCache", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get(
@@ -48,13 +48,13 @@ class Pages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Pages.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = PagesGetResponse(**raw_result)
+        result = self.parse_response(PagesGetResponse, raw_result)
         return result
 
     async def get_history(
@@ -72,13 +72,13 @@ class Pages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Pages.get_history")
 
         raw_result = await self.api_request("getHistory", params)
         if return_raw_response:
             return raw_result
 
-        result = PagesGetHistoryResponse(**raw_result)
+        result = self.parse_response(PagesGetHistoryResponse, raw_result)
         return result
 
     async def get_titles(
@@ -92,13 +92,13 @@ class Pages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Pages.get_titles")
 
         raw_result = await self.api_request("getTitles", params)
         if return_raw_response:
             return raw_result
 
-        result = PagesGetTitlesResponse(**raw_result)
+        result = self.parse_response(PagesGetTitlesResponse, raw_result)
         return result
 
     async def get_version(
@@ -118,13 +118,13 @@ class Pages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Pages.get_version")
 
         raw_result = await self.api_request("getVersion", params)
         if return_raw_response:
             return raw_result
 
-        result = PagesGetVersionResponse(**raw_result)
+        result = self.parse_response(PagesGetVersionResponse, raw_result)
         return result
 
     async def parse_wiki(
@@ -140,13 +140,13 @@ class Pages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Pages.parse_wiki")
 
         raw_result = await self.api_request("parseWiki", params)
         if return_raw_response:
             return raw_result
 
-        result = PagesParseWikiResponse(**raw_result)
+        result = self.parse_response(PagesParseWikiResponse, raw_result)
         return result
 
     async def save(
@@ -168,13 +168,13 @@ class Pages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Pages.save")
 
         raw_result = await self.api_request("save", params)
         if return_raw_response:
             return raw_result
 
-        result = PagesSaveResponse(**raw_result)
+        result = self.parse_response(PagesSaveResponse, raw_result)
         return result
 
     async def save_access(
@@ -196,11 +196,11 @@ class Pages(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Pages.save_access")
 
         raw_result = await self.api_request("saveAccess", params)
         if return_raw_response:
             return raw_result
 
-        result = PagesSaveAccessResponse(**raw_result)
+        result = self.parse_response(PagesSaveAccessResponse, raw_result)
         return result
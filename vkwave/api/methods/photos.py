@@ -20,13 +20,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.confirm_tag")
 
         raw_result = await self.api_request("confirmTag", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def copy(
@@ -44,13 +44,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.copy")
 
         raw_result = await self.api_request("copy", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosCopyResponse(**raw_result)
+        result = self.parse_response(PhotosCopyResponse, raw_result)
         return result
 
     async def create_album(
@@ -76,13 +76,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.create_album")
 
         raw_result = await self.api_request("createAlbum", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosCreateAlbumResponse(**raw_result)
+        result = self.parse_response(PhotosCreateAlbumResponse, raw_result)
         return result
 
     async def create_comment(
@@ -112,13 +112,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.create_comment")
 
         raw_result = await self.api_request("createComment", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosCreateCommentResponse(**raw_result)
+        result = self.parse_response(PhotosCreateCommentResponse, raw_result)
         return result
 
     async def delete(
@@ -134,13 +134,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.delete")
 
         raw_result = await self.api_request("delete", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def delete_album(
@@ -156,13 +156,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.delete_album")
 
         raw_result = await self.api_request("deleteAlbum", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def delete_comment(
@@ -178,13 +178,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.delete_comment")
 
         raw_result = await self.api_request("deleteComment", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosDeleteCommentResponse(**raw_result)
+        result = self.parse_response(PhotosDeleteCommentResponse, raw_result)
         return result
 
     async def edit(
@@ -212,13 +212,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.edit")
 
         raw_result = await self.api_request("edit", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit_album(
@@ -246,13 +246,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.edit_album")
 
         raw_result = await self.api_request("editAlbum", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit_comment(
@@ -272,13 +272,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.edit_comment")
 
         raw_result = await self.api_request("editComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get(
@@ -310,13 +310,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosGetResponse(**raw_result)
+        result = self.parse_response(PhotosGetResponse, raw_result)
         return result
 
     async def get_albums(
@@ -342,13 +342,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get_albums")
 
         raw_result = await self.api_request("getAlbums", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosGetAlbumsResponse(**raw_result)
+        result = self.parse_response(PhotosGetAlbumsResponse, raw_result)
         return result
 
     async def get_albums_count(
@@ -364,13 +364,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get_albums_count")
 
         raw_result = await self.api_request("getAlbumsCount", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosGetAlbumsCountResponse(**raw_result)
+        result = self.parse_response(PhotosGetAlbumsCountResponse, raw_result)
         return result
 
     async def get_all(
@@ -398,16 +398,16 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get_all")
 
         raw_result = await self.api_request("getAll", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            PhotosGetAllResponse(**raw_result)
+            self.parse_response(PhotosGetAllResponse, raw_result)
             if not extended
-            else PhotosGetAllExtendedResponse(**raw_result)
+            else self.parse_response(PhotosGetAllExtendedResponse, raw_result)
         )
         return result
 
@@ -430,13 +430,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get_all_comments")
 
         raw_result = await self.api_request("getAllComments", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosGetAllCommentsResponse(**raw_result)
+        result = self.parse_response(PhotosGetAllCommentsResponse, raw_result)
         return result
 
     async def get_by_id(
@@ -454,13 +454,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get_by_id")
 
         raw_result = await self.api_request("getById", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosGetByIdResponse(**raw_result)
+        result = self.parse_response(PhotosGetByIdResponse, raw_result)
         return result
 
     async def get_chat_upload_server(
@@ -480,13 +480,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get_chat_upload_server")
 
         raw_result = await self.api_request("getChatUploadServer", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseGetUploadServerResponse(**raw_result)
+        result = self.parse_response(BaseGetUploadServerResponse, raw_result)
         return result
 
     async def get_comments(
@@ -518,16 +518,16 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get_comments")
 
         raw_result = await self.api_request("getComments", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            PhotosGetCommentsResponse(**raw_result)
+            self.parse_response(PhotosGetCommentsResponse, raw_result)
             if not extended
-            else PhotosGetCommentsExtendedResponse(**raw_result)
+            else self.parse_response(PhotosGetCommentsExtendedResponse, raw_result)
         )
         return result
 
@@ -542,13 +542,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get_market_album_upload_server")
 
         raw_result = await self.api_request("getMarketAlbumUploadServer", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseGetUploadServerResponse(**raw_result)
+        result = self.parse_response(BaseGetUploadServerResponse, raw_result)
         return result
 
     async def get_market_upload_server(
@@ -570,13 +570,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get_market_upload_server")
 
         raw_result = await self.api_request("getMarketUploadServer", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosGetMarketUploadServerResponse(**raw_result)
+        result = self.parse_response(PhotosGetMarketUploadServerResponse, raw_result)
         return result
 
     async def get_messages_upload_server(
@@ -590,13 +590,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get_messages_upload_server")
 
         raw_result = await self.api_request("getMessagesUploadServer", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosGetMessagesUploadServerResponse(**raw_result)
+        result = self.parse_response(PhotosGetMessagesUploadServerResponse, raw_result)
         return result
 
     async def get_new_tags(
@@ -612,13 +612,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get_new_tags")
 
         raw_result = await self.api_request("getNewTags", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosGetNewTagsResponse(**raw_result)
+        result = self.parse_response(PhotosGetNewTagsResponse, raw_result)
         return result
 
     async def get_owner_cover_photo_upload_server(
@@ -640,13 +640,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get_owner_cover_photo_upload_server")
 
         raw_result = await self.api_request("getOwnerCoverPhotoUploadServer", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseGetUploadServerResponse(**raw_result)
+        result = self.parse_response(BaseGetUploadServerResponse, raw_result)
         return result
 
     async def get_owner_photo_upload_server(
@@ -660,13 +660,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get_owner_photo_upload_server")
 
         raw_result = await self.api_request("getOwnerPhotoUploadServer", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseGetUploadServerResponse(**raw_result)
+        result = self.parse_response(BaseGetUploadServerResponse, raw_result)
         return result
 
     async def get_tags(
@@ -684,13 +684,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get_tags")
 
         raw_result = await self.api_request("getTags", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosGetTagsResponse(**raw_result)
+        result = self.parse_response(PhotosGetTagsResponse, raw_result)
         return result
 
     async def get_upload_server(
@@ -706,13 +706,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get_upload_server")
 
         raw_result = await self.api_request("getUploadServer", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosGetUploadServerResponse(**raw_result)
+        result = self.parse_response(PhotosGetUploadServerResponse, raw_result)
         return result
 
     async def get_user_photos(
@@ -734,13 +734,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get_user_photos")
 
         raw_result = await self.api_request("getUserPhotos", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosGetUserPhotosResponse(**raw_result)
+        result = self.parse_response(PhotosGetUserPhotosResponse, raw_result)
         return result
 
     async def get_wall_upload_server(
@@ -754,13 +754,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.get_wall_upload_server")
 
         raw_result = await self.api_request("getWallUploadServer", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosGetWallUploadServerResponse(**raw_result)
+        result = self.parse_response(PhotosGetWallUploadServerResponse, raw_result)
         return result
 
     async def make_cover(
@@ -778,13 +778,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.make_cover")
 
         raw_result = await self.api_request("makeCover", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def move(
@@ -802,13 +802,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.move")
 
         raw_result = await self.api_request("move", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def put_tag(
@@ -834,13 +834,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.put_tag")
 
         raw_result = await self.api_request("putTag", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosPutTagResponse(**raw_result)
+        result = self.parse_response(PhotosPutTagResponse, raw_result)
         return result
 
     async def remove_tag(
@@ -858,13 +858,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.remove_tag")
 
         raw_result = await self.api_request("removeTag", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def reorder_albums(
@@ -884,13 +884,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.reorder_albums")
 
         raw_result = await self.api_request("reorderAlbums", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def reorder_photos(
@@ -910,13 +910,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.reorder_photos")
 
         raw_result = await self.api_request("reorderPhotos", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def report(
@@ -934,13 +934,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.report")
 
         raw_result = await self.api_request("report", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def report_comment(
@@ -958,13 +958,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.report_comment")
 
         raw_result = await self.api_request("reportComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def restore(
@@ -980,13 +980,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.restore")
 
         raw_result = await self.api_request("restore", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def restore_comment(
@@ -1002,13 +1002,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.restore_comment")
 
         raw_result = await self.api_request("restoreComment", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosRestoreCommentResponse(**raw_result)
+        result = self.parse_response(PhotosRestoreCommentResponse, raw_result)
         return result
 
     async def save(
@@ -1036,13 +1036,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.save")
 
         raw_result = await self.api_request("save", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosSaveResponse(**raw_result)
+        result = self.parse_response(PhotosSaveResponse, raw_result)
         return result
 
     async def save_market_album_photo(
@@ -1062,13 +1062,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.save_market_album_photo")
 
         raw_result = await self.api_request("saveMarketAlbumPhoto", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosSaveMarketAlbumPhotoResponse(**raw_result)
+        result = self.parse_response(PhotosSaveMarketAlbumPhotoResponse, raw_result)
         return result
 
     async def save_market_photo(
@@ -1092,13 +1092,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.save_market_photo")
 
         raw_result = await self.api_request("saveMarketPhoto", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosSaveMarketPhotoResponse(**raw_result)
+        result = self.parse_response(PhotosSaveMarketPhotoResponse, raw_result)
         return result
 
     async def save_messages_photo(
@@ -1116,13 +1116,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.save_messages_photo")
 
         raw_result = await self.api_request("saveMessagesPhoto", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosSaveMessagesPhotoResponse(**raw_result)
+        result = self.parse_response(PhotosSaveMessagesPhotoResponse, raw_result)
         return result
 
     async def save_owner_cover_photo(
@@ -1138,13 +1138,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.save_owner_cover_photo")
 
         raw_result = await self.api_request("saveOwnerCoverPhoto", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosSaveOwnerCoverPhotoResponse(**raw_result)
+        result = self.parse_response(PhotosSaveOwnerCoverPhotoResponse, raw_result)
         return result
 
     async def save_owner_photo(
@@ -1162,13 +1162,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.save_owner_photo")
 
         raw_result = await self.api_request("saveOwnerPhoto", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosSaveOwnerPhotoResponse(**raw_result)
+        result = self.parse_response(PhotosSaveOwnerPhotoResponse, raw_result)
         return result
 
     async def save_wall_photo(
@@ -1196,13 +1196,13 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.save_wall_photo")
 
         raw_result = await self.api_request("saveWallPhoto", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosSaveWallPhotoResponse(**raw_result)
+        result = self.parse_response(PhotosSaveWallPhotoResponse, raw_result)
         return result
 
     async def search(
@@ -1232,11 +1232,11 @@ class Photos(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Photos.search")
 
         raw_result = await self.api_request("search", params)
         if return_raw_response:
             return raw_result
 
-        result = PhotosSearchResponse(**raw_result)
+        result = self.parse_response(PhotosSearchResponse, raw_result)
         return result
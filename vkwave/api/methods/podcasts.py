@@ -14,13 +14,13 @@ class Podcasts(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Podcasts.clear_recent_searches")
 
         raw_result = await self.api_request("clearRecentSearches", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get_popular(
@@ -32,13 +32,13 @@ class Podcasts(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Podcasts.get_popular")
 
         raw_result = await self.api_request("getPopular", params)
         if return_raw_response:
             return raw_result
 
-        result = PodcastsGetPopularResponse(**raw_result)
+        result = self.parse_response(PodcastsGetPopularResponse, raw_result)
         return result
 
     async def get_recent_search_requests(
@@ -50,13 +50,13 @@ class Podcasts(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Podcasts.get_recent_search_requests")
 
         raw_result = await self.api_request("getRecentSearchRequests", params)
         if return_raw_response:
             return raw_result
 
-        result = PodcastsGetRecentSearchRequestsResponse(**raw_result)
+        result = self.parse_response(PodcastsGetRecentSearchRequestsResponse, raw_result)
         return result
 
     async def search(
@@ -74,11 +74,11 @@ class Podcasts(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Podcasts.search")
 
         raw_result = await self.api_request("search", params)
         if return_raw_response:
             return raw_result
 
-        result = PodcastsSearchResponse(**raw_result)
+        result = self.parse_response(PodcastsSearchResponse, raw_result)
         return result
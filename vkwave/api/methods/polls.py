@@ -22,13 +22,13 @@ class Polls(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Polls.add_vote")
 
         raw_result = await self.api_request("addVote", params)
         if return_raw_response:
             return raw_result
 
-        result = PollsAddVoteResponse(**raw_result)
+        result = self.parse_response(PollsAddVoteResponse, raw_result)
         return result
 
     async def create(
@@ -58,13 +58,13 @@ class Polls(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Polls.create")
 
         raw_result = await self.api_request("create", params)
         if return_raw_response:
             return raw_result
 
-        result = PollsCreateResponse(**raw_result)
+        result = self.parse_response(PollsCreateResponse, raw_result)
         return result
 
     async def delete_vote(
@@ -84,13 +84,13 @@ class Polls(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Polls.delete_vote")
 
         raw_result = await self.api_request("deleteVote", params)
         if return_raw_response:
             return raw_result
 
-        result = PollsDeleteVoteResponse(**raw_result)
+        result = self.parse_response(PollsDeleteVoteResponse, raw_result)
         return result
 
     async def edit(
@@ -120,13 +120,13 @@ class Polls(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Polls.edit")
 
         raw_result = await self.api_request("edit", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get_by_id(
@@ -152,13 +152,13 @@ class Polls(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Polls.get_by_id")
 
         raw_result = await self.api_request("getById", params)
         if return_raw_response:
             return raw_result
 
-        result = PollsGetByIdResponse(**raw_result)
+        result = self.parse_response(PollsGetByIdResponse, raw_result)
         return result
 
     async def get_voters(
@@ -188,11 +188,11 @@ class Polls(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Polls.get_voters")
 
         raw_result = await self.api_request("getVoters", params)
         if return_raw_response:
             return raw_result
 
-        result = PollsGetVotersResponse(**raw_result)
+        result = self.parse_response(PollsGetVotersResponse, raw_result)
         return result
@@ -28,13 +28,13 @@ class PrettyCards(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "PrettyCards.cards_create")
 
         raw_result = await self.api_request("create", params)
         if return_raw_response:
             return raw_result
 
-        result = PrettyCardsCreateResponse(**raw_result)
+        result = self.parse_response(PrettyCardsCreateResponse, raw_result)
         return result
 
     async def cards_delete(
@@ -50,13 +50,13 @@ class PrettyCards(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "PrettyCards.cards_delete")
 
         raw_result = await self.api_request("delete", params)
         if return_raw_response:
             return raw_result
 
-        result = PrettyCardsDeleteResponse(**raw_result)
+        result = self.parse_response(PrettyCardsDeleteResponse, raw_result)
         return result
 
     async def cards_edit(
@@ -84,13 +84,13 @@ class PrettyCards(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "PrettyCards.cards_edit")
 
         raw_result = await self.api_request("edit", params)
         if return_raw_response:
             return raw_result
 
-        result = PrettyCardsEditResponse(**raw_result)
+        result = self.parse_response(PrettyCardsEditResponse, raw_result)
         return result
 
     async def cards_get(
@@ -108,13 +108,13 @@ class PrettyCards(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "PrettyCards.cards_get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = PrettyCardsGetResponse(**raw_result)
+        result = self.parse_response(PrettyCardsGetResponse, raw_result)
         return result
 
     async def cards_get_by_id(
@@ -130,13 +130,13 @@ class PrettyCards(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "PrettyCards.cards_get_by_id")
 
         raw_result = await self.api_request("getById", params)
         if return_raw_response:
             return raw_result
 
-        result = PrettyCardsGetByIdResponse(**raw_result)
+        result = self.parse_response(PrettyCardsGetByIdResponse, raw_result)
         return result
 
     async def cards_get_upload_u_r_l(
@@ -148,11 +148,11 @@ class PrettyCards(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "PrettyCards.cards_get_upload_u_r_l")
 
         raw_result = await self.api_request("getUploadURL", params)
         if return_raw_response:
             return raw_result
 
-        result = PrettyCardsGetUploadURLResponse(**raw_result)
+        result = self.parse_response(PrettyCardsGetUploadURLResponse, raw_result)
         return result
@@ -26,11 +26,11 @@ class Search(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Search.get_hints")
 
         raw_result = await self.api_request("getHints", params)
         if return_raw_response:
             return raw_result
 
-        result = SearchGetHintsResponse(**raw_result)
+        result = self.parse_response(SearchGetHintsResponse, raw_result)
         return result
@@ -20,13 +20,13 @@ class Secure(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Secure.add_app_event")
 
         raw_result = await self.api_request("addAppEvent", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def check_token(
@@ -42,13 +42,13 @@ class Secure(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Secure.check_token")
 
         raw_result = await self.api_request("checkToken", params)
         if return_raw_response:
             return raw_result
 
-        result = SecureCheckTokenResponse(**raw_result)
+        result = self.parse_response(SecureCheckTokenResponse, raw_result)
         return result
 
     async def get_app_balance(
@@ -60,13 +60,13 @@ class Secure(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Secure.get_app_balance")
 
         raw_result = await self.api_request("getAppBalance", params)
         if return_raw_response:
             return raw_result
 
-        result = SecureGetAppBalanceResponse(**raw_result)
+        result = self.parse_response(SecureGetAppBalanceResponse, raw_result)
         return result
 
     async def get_s_m_s_history(
@@ -86,13 +86,13 @@ class Secure(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Secure.get_s_m_s_history")
 
         raw_result = await self.api_request("getSMSHistory", params)
         if return_raw_response:
             return raw_result
 
-        result = SecureGetSMSHistoryResponse(**raw_result)
+        result = self.parse_response(SecureGetSMSHistoryResponse, raw_result)
         return result
 
     async def get_transactions_history(
@@ -116,13 +116,13 @@ class Secure(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Secure.get_transactions_history")
 
         raw_result = await self.api_request("getTransactionsHistory", params)
         if return_raw_response:
             return raw_result
 
-        result = SecureGetTransactionsHistoryResponse(**raw_result)
+        result = self.parse_response(SecureGetTransactionsHistoryResponse, raw_result)
         return result
 
     async def get_user_level(
@@ -136,13 +136,13 @@ class Secure(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Secure.get_user_level")
 
         raw_result = await self.api_request("getUserLevel", params)
         if return_raw_response:
             return raw_result
 
-        result = SecureGetUserLevelResponse(**raw_result)
+        result = self.parse_response(SecureGetUserLevelResponse, raw_result)
         return result
 
     async def give_event_sticker(
@@ -158,13 +158,13 @@ class Secure(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Secure.give_event_sticker")
 
         raw_result = await self.api_request("giveEventSticker", params)
         if return_raw_response:
             return raw_result
 
-        result = SecureGiveEventStickerResponse(**raw_result)
+        result = self.parse_response(SecureGiveEventStickerResponse, raw_result)
         return result
 
     async def send_notification(
@@ -182,13 +182,13 @@ class Secure(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Secure.send_notification")
 
         raw_result = await self.api_request("sendNotification", params)
         if return_raw_response:
             return raw_result
 
-        result = SecureSendNotificationResponse(**raw_result)
+        result = self.parse_response(SecureSendNotificationResponse, raw_result)
         return result
 
     async def send_s_m_s_notification(
@@ -204,13 +204,13 @@ class Secure(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Secure.send_s_m_s_notification")
 
         raw_result = await self.api_request("sendSMSNotification", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def set_counter(
@@ -230,11 +230,11 @@ class Secure(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Secure.set_counter")
 
         raw_result = await self.api_request("setCounter", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
@@ -32,13 +32,13 @@ class Stats(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stats.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = StatsGetResponse(**raw_result)
+        result = self.parse_response(StatsGetResponse, raw_result)
         return result
 
     async def get_post_reach(
@@ -54,13 +54,13 @@ class Stats(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stats.get_post_reach")
 
         raw_result = await self.api_request("getPostReach", params)
         if return_raw_response:
             return raw_result
 
-        result = StatsGetPostReachResponse(**raw_result)
+        result = self.parse_response(StatsGetPostReachResponse, raw_result)
         return result
 
     async def track_visitor(
@@ -74,11 +74,11 @@ class Stats(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stats.track_visitor")
 
         raw_result = await self.api_request("trackVisitor", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
@@ -18,13 +18,13 @@ class Status(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Status.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = StatusGetResponse(**raw_result)
+        result = self.parse_response(StatusGetResponse, raw_result)
         return result
 
     async def set(
@@ -40,13 +40,13 @@ class Status(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Status.set")
 
         raw_result = await self.api_request("set", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def set_image(
@@ -60,11 +60,11 @@ class Status(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Status.set_image")
 
         raw_result = await self.api_request("setImage", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
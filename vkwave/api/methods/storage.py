@@ -20,13 +20,13 @@ class Storage(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Storage.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = StorageGetResponse(**raw_result)
+        result = self.parse_response(StorageGetResponse, raw_result)
         return result
 
     async def get_keys(
@@ -44,13 +44,13 @@ class Storage(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Storage.get_keys")
 
         raw_result = await self.api_request("getKeys", params)
         if return_raw_response:
             return raw_result
 
-        result = StorageGetKeysResponse(**raw_result)
+        result = self.parse_response(StorageGetKeysResponse, raw_result)
         return result
 
     async def set(
@@ -68,11 +68,11 @@ class Storage(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Storage.set")
 
         raw_result = await self.api_request("set", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
@@ -16,13 +16,13 @@ class Stories(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stories.ban_owner")
 
         raw_result = await self.api_request("banOwner", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def delete(
@@ -40,13 +40,13 @@ class Stories(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stories.delete")
 
         raw_result = await self.api_request("delete", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get(
@@ -64,13 +64,13 @@ class Stories(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stories.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = StoriesGetV5113Response(**raw_result)
+        result = self.parse_response(StoriesGetV5113Response, raw_result)
         return result
 
     async def get_banned(
@@ -86,16 +86,16 @@ class Stories(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stories.get_banned")
 
         raw_result = await self.api_request("getBanned", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            StoriesGetBannedResponse(**raw_result)
+            self.parse_response(StoriesGetBannedResponse, raw_result)
             if not extended
-            else StoriesGetBannedExtendedResponse(**raw_result)
+            else self.parse_response(StoriesGetBannedExtendedResponse, raw_result)
         )
         return result
 
@@ -114,13 +114,13 @@ class Stories(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stories.get_by_id")
 
         raw_result = await self.api_request("getById", params)
         if return_raw_response:
             return raw_result
 
-        result = StoriesGetByIdExtendedResponse(**raw_result)
+        result = self.parse_response(StoriesGetByIdExtendedResponse, raw_result)
         return result
 
     async def get_photo_upload_server(
@@ -146,13 +146,13 @@ class Stories(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stories.get_photo_upload_server")
 
         raw_result = await self.api_request("getPhotoUploadServer", params)
         if return_raw_response:
             return raw_result
 
-        result = StoriesGetPhotoUploadServerResponse(**raw_result)
+        result = self.parse_response(StoriesGetPhotoUploadServerResponse, raw_result)
         return result
 
     async def get_replies(
@@ -174,13 +174,13 @@ class Stories(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stories.get_replies")
 
         raw_result = await self.api_request("getReplies", params)
         if return_raw_response:
             return raw_result
 
-        result = StoriesGetV5113Response(**raw_result)
+        result = self.parse_response(StoriesGetV5113Response, raw_result)
         return result
 
     async def get_stats(
@@ -196,13 +196,13 @@ class Stories(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stories.get_stats")
 
         raw_result = await self.api_request("getStats", params)
         if return_raw_response:
             return raw_result
 
-        result = StoriesGetStatsResponse(**raw_result)
+        result = self.parse_response(StoriesGetStatsResponse, raw_result)
         return result
 
     async def get_video_upload_server(
@@ -228,13 +228,13 @@ class Stories(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stories.get_video_upload_server")
 
         raw_result = await self.api_request("getVideoUploadServer", params)
         if return_raw_response:
             return raw_result
 
-        result = StoriesGetVideoUploadServerResponse(**raw_result)
+        result = self.parse_response(StoriesGetVideoUploadServerResponse, raw_result)
         return result
 
     async def get_viewers(
@@ -260,16 +260,16 @@ class Stories(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stories.get_viewers")
 
         raw_result = await self.api_request("getViewers", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            StoriesGetViewersExtendedV5115Response(**raw_result)
+            self.parse_response(StoriesGetViewersExtendedV5115Response, raw_result)
             if not extended
-            else StoriesGetViewersExtendedV5115Response(**raw_result)
+            else self.parse_response(StoriesGetViewersExtendedV5115Response, raw_result)
         )
         return result
 
@@ -286,13 +286,13 @@ class Stories(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stories.hide_all_replies")
 
         raw_result = await self.api_request("hideAllReplies", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def hide_reply(
@@ -308,13 +308,13 @@ class Stories(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stories.hide_reply")
 
         raw_result = await self.api_request("hideReply", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def save(
@@ -328,13 +328,13 @@ class Stories(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stories.save")
 
         raw_result = await self.api_request("save", params)
         if return_raw_response:
             return raw_result
 
-        result = StoriesSaveResponse(**raw_result)
+        result = self.parse_response(StoriesSaveResponse, raw_result)
         return result
 
     async def search(
@@ -364,13 +364,13 @@ class Stories(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stories.search")
 
         raw_result = await self.api_request("search", params)
         if return_raw_response:
             return raw_result
 
-        result = StoriesGetV5113Response(**raw_result)
+        result = self.parse_response(StoriesGetV5113Response, raw_result)
         return result
 
     async def send_interaction(
@@ -392,13 +392,13 @@ class Stories(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stories.send_interaction")
 
         raw_result = await self.api_request("sendInteraction", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def unban_owner(
@@ -412,11 +412,11 @@ class Stories(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Stories.unban_owner")
 
         raw_result = await self.api_request("unbanOwner", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
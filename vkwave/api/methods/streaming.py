@@ -14,13 +14,13 @@ class Streaming(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Streaming.get_server_url")
 
         raw_result = await self.api_request("getServerUrl", params)
         if return_raw_response:
             return raw_result
 
-        result = StreamingGetServerUrlResponse(**raw_result)
+        result = self.parse_response(StreamingGetServerUrlResponse, raw_result)
         return result
 
     async def set_settings(
@@ -34,11 +34,11 @@ class Streaming(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Streaming.set_settings")
 
         raw_result = await self.api_request("setSettings", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
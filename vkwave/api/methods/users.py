@@ -20,13 +20,13 @@ class Users(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Users.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = UsersGetResponse(**raw_result)
+        result = self.parse_response(UsersGetResponse, raw_result)
         return result
 
     async def get_followers(
@@ -48,16 +48,16 @@ class Users(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Users.get_followers")
 
         raw_result = await self.api_request("getFollowers", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            UsersGetFollowersResponse(**raw_result)
+            self.parse_response(UsersGetFollowersResponse, raw_result)
             if not fields
-            else UsersGetFollowersFieldsResponse(**raw_result)
+            else self.parse_response(UsersGetFollowersFieldsResponse, raw_result)
         )
         return result
 
@@ -80,16 +80,16 @@ class Users(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Users.get_subscriptions")
 
         raw_result = await self.api_request("getSubscriptions", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            UsersGetSubscriptionsResponse(**raw_result)
+            self.parse_response(UsersGetSubscriptionsResponse, raw_result)
             if not extended
-            else UsersGetSubscriptionsExtendedResponse(**raw_result)
+            else self.parse_response(UsersGetSubscriptionsExtendedResponse, raw_result)
         )
         return result
 
@@ -108,13 +108,13 @@ class Users(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Users.report")
 
         raw_result = await self.api_request("report", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def search(
@@ -190,11 +190,11 @@ class Users(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Users.search")
 
         raw_result = await self.api_request("search", params)
         if return_raw_response:
             return raw_result
 
-        result = UsersSearchResponse(**raw_result)
+        result = self.parse_response(UsersSearchResponse, raw_result)
         return result
@@ -16,13 +16,13 @@ class Utils(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Utils.check_link")
 
         raw_result = await self.api_request("checkLink", params)
         if return_raw_response:
             return raw_result
 
-        result = UtilsCheckLinkResponse(**raw_result)
+        result = self.parse_response(UtilsCheckLinkResponse, raw_result)
         return result
 
     async def delete_from_last_shortened(
@@ -36,13 +36,13 @@ class Utils(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Utils.delete_from_last_shortened")
 
         raw_result = await self.api_request("deleteFromLastShortened", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get_last_shortened_links(
@@ -58,13 +58,13 @@ class Utils(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Utils.get_last_shortened_links")
 
         raw_result = await self.api_request("getLastShortenedLinks", params)
         if return_raw_response:
             return raw_result
 
-        result = UtilsGetLastShortenedLinksResponse(**raw_result)
+        result = self.parse_response(UtilsGetLastShortenedLinksResponse, raw_result)
         return result
 
     async def get_link_stats(
@@ -88,16 +88,16 @@ class Utils(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Utils.get_link_stats")
 
         raw_result = await self.api_request("getLinkStats", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            UtilsGetLinkStatsResponse(**raw_result)
+            self.parse_response(UtilsGetLinkStatsResponse, raw_result)
             if not extended
-            else UtilsGetLinkStatsExtendedResponse(**raw_result)
+            else self.parse_response(UtilsGetLinkStatsExtendedResponse, raw_result)
         )
         return result
 
@@ -110,13 +110,13 @@ class Utils(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Utils.get_server_time")
 
         raw_result = await self.api_request("getServerTime", params)
         if return_raw_response:
             return raw_result
 
-        result = UtilsGetServerTimeResponse(**raw_result)
+        result = self.parse_response(UtilsGetServerTimeResponse, raw_result)
         return result
 
     async def get_short_link(
@@ -132,13 +132,13 @@ class Utils(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Utils.get_short_link")
 
         raw_result = await self.api_request("getShortLink", params)
         if return_raw_response:
             return raw_result
 
-        result = UtilsGetShortLinkResponse(**raw_result)
+        result = self.parse_response(UtilsGetShortLinkResponse, raw_result)
         return result
 
     async def resolve_screen_name(
@@ -152,11 +152,11 @@ class Utils(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Utils.resolve_screen_name")
 
         raw_result = await self.api_request("resolveScreenName", params)
         if return_raw_response:
             return raw_result
 
-        result = UtilsResolveScreenNameResponse(**raw_result)
+        result = self.parse_response(UtilsResolveScreenNameResponse, raw_result)
         return result
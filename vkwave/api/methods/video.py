@@ -20,13 +20,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.add")
 
         raw_result = await self.api_request("add", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def add_album(
@@ -44,13 +44,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.add_album")
 
         raw_result = await self.api_request("addAlbum", params)
         if return_raw_response:
             return raw_result
 
-        result = VideoAddAlbumResponse(**raw_result)
+        result = self.parse_response(VideoAddAlbumResponse, raw_result)
         return result
 
     async def add_to_album(
@@ -72,13 +72,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.add_to_album")
 
         raw_result = await self.api_request("addToAlbum", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def create_comment(
@@ -106,13 +106,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.create_comment")
 
         raw_result = await self.api_request("createComment", params)
         if return_raw_response:
             return raw_result
 
-        result = VideoCreateCommentResponse(**raw_result)
+        result = self.parse_response(VideoCreateCommentResponse, raw_result)
         return result
 
     async def delete(
@@ -130,13 +130,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.delete")
 
         raw_result = await self.api_request("delete", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def delete_album(
@@ -152,13 +152,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.delete_album")
 
         raw_result = await self.api_request("deleteAlbum", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def delete_comment(
@@ -174,13 +174,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.delete_comment")
 
         raw_result = await self.api_request("deleteComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit(
@@ -208,13 +208,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.edit")
 
         raw_result = await self.api_request("edit", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit_album(
@@ -234,13 +234,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.edit_album")
 
         raw_result = await self.api_request("editAlbum", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit_comment(
@@ -260,13 +260,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.edit_comment")
 
         raw_result = await self.api_request("editComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get(
@@ -290,13 +290,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
-        result = VideoGetResponse(**raw_result)
+        result = self.parse_response(VideoGetResponse, raw_result)
         return result
 
     async def get_album_by_id(
@@ -312,13 +312,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.get_album_by_id")
 
         raw_result = await self.api_request("getAlbumById", params)
         if return_raw_response:
             return raw_result
 
-        result = VideoGetAlbumByIdResponse(**raw_result)
+        result = self.parse_response(VideoGetAlbumByIdResponse, raw_result)
         return result
 
     async def get_albums(
@@ -340,16 +340,16 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.get_albums")
 
         raw_result = await self.api_request("getAlbums", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            VideoGetAlbumsResponse(**raw_result)
+            self.parse_response(VideoGetAlbumsResponse, raw_result)
             if not extended
-            else VideoGetAlbumsExtendedResponse(**raw_result)
+            else self.parse_response(VideoGetAlbumsExtendedResponse, raw_result)
         )
         return result
 
@@ -370,16 +370,16 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.get_albums_by_video")
 
         raw_result = await self.api_request("getAlbumsByVideo", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            VideoGetAlbumsByVideoResponse(**raw_result)
+            self.parse_response(VideoGetAlbumsByVideoResponse, raw_result)
             if not extended
-            else VideoGetAlbumsByVideoExtendedResponse(**raw_result)
+            else self.parse_response(VideoGetAlbumsByVideoExtendedResponse, raw_result)
         )
         return result
 
@@ -410,16 +410,16 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.get_comments")
 
         raw_result = await self.api_request("getComments", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            VideoGetCommentsResponse(**raw_result)
+            self.parse_response(VideoGetCommentsResponse, raw_result)
             if not extended
-            else VideoGetCommentsExtendedResponse(**raw_result)
+            else self.parse_response(VideoGetCommentsExtendedResponse, raw_result)
         )
         return result
 
@@ -442,13 +442,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.remove_from_album")
 
         raw_result = await self.api_request("removeFromAlbum", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def reorder_albums(
@@ -468,13 +468,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.reorder_albums")
 
         raw_result = await self.api_request("reorderAlbums", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def reorder_videos(
@@ -502,13 +502,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.reorder_videos")
 
         raw_result = await self.api_request("reorderVideos", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def report(
@@ -530,13 +530,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.report")
 
         raw_result = await self.api_request("report", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def report_comment(
@@ -554,13 +554,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.report_comment")
 
         raw_result = await self.api_request("reportComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def restore(
@@ -576,13 +576,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.restore")
 
         raw_result = await self.api_request("restore", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def restore_comment(
@@ -598,13 +598,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.restore_comment")
 
         raw_result = await self.api_request("restoreComment", params)
         if return_raw_response:
             return raw_result
 
-        result = VideoRestoreCommentResponse(**raw_result)
+        result = self.parse_response(VideoRestoreCommentResponse, raw_result)
         return result
 
     async def save(
@@ -640,13 +640,13 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.save")
 
         raw_result = await self.api_request("save", params)
         if return_raw_response:
             return raw_result
 
-        result = VideoSaveResponse(**raw_result)
+        result = self.parse_response(VideoSaveResponse, raw_result)
         return result
 
     async def search(
@@ -680,15 +680,15 @@ class Video(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Video.search")
 
         raw_result = await self.api_request("search", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            VideoSearchResponse(**raw_result)
+            self.parse_response(VideoSearchResponse, raw_result)
             if not extended
-            else VideoSearchExtendedResponse(**raw_result)
+            else self.parse_response(VideoSearchExtendedResponse, raw_result)
         )
         return result
@@ -16,13 +16,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.check_copyright_link")
 
         raw_result = await self.api_request("checkCopyrightLink", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseBoolResponse(**raw_result)
+        result = self.parse_response(BaseBoolResponse, raw_result)
         return result
 
     async def close_comments(
@@ -38,13 +38,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.close_comments")
 
         raw_result = await self.api_request("closeComments", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseBoolResponse(**raw_result)
+        result = self.parse_response(BaseBoolResponse, raw_result)
         return result
 
     async def create_comment(
@@ -72,13 +72,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.create_comment")
 
         raw_result = await self.api_request("createComment", params)
         if return_raw_response:
             return raw_result
 
-        result = WallCreateCommentResponse(**raw_result)
+        result = self.parse_response(WallCreateCommentResponse, raw_result)
         return result
 
     async def delete(
@@ -94,13 +94,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.delete")
 
         raw_result = await self.api_request("delete", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def delete_comment(
@@ -116,13 +116,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.delete_comment")
 
         raw_result = await self.api_request("deleteComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit(
@@ -170,13 +170,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.edit")
 
         raw_result = await self.api_request("edit", params)
         if return_raw_response:
             return raw_result
 
-        result = WallEditResponse(**raw_result)
+        result = self.parse_response(WallEditResponse, raw_result)
         return result
 
     async def edit_ads_stealth(
@@ -212,13 +212,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.edit_ads_stealth")
 
         raw_result = await self.api_request("editAdsStealth", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def edit_comment(
@@ -238,13 +238,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.edit_comment")
 
         raw_result = await self.api_request("editComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def get(
@@ -270,16 +270,16 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.get")
 
         raw_result = await self.api_request("get", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            WallGetResponse(**raw_result)
+            self.parse_response(WallGetResponse, raw_result)
             if not extended
-            else WallGetExtendedResponse(**raw_result)
+            else self.parse_response(WallGetExtendedResponse, raw_result)
         )
         return result
 
@@ -300,16 +300,16 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.get_by_id")
 
         raw_result = await self.api_request("getById", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            WallGetByIdLegacyResponse(**raw_result)
+            self.parse_response(WallGetByIdLegacyResponse, raw_result)
             if not extended
-            else WallGetByIdExtendedResponse(**raw_result)
+            else self.parse_response(WallGetByIdExtendedResponse, raw_result)
         )
         return result
 
@@ -330,16 +330,16 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.get_comment")
 
         raw_result = await self.api_request("getComment", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            WallGetCommentResponse(**raw_result)
+            self.parse_response(WallGetCommentResponse, raw_result)
             if not extended
-            else WallGetCommentExtendedResponse(**raw_result)
+            else self.parse_response(WallGetCommentExtendedResponse, raw_result)
         )
         return result
 
@@ -376,16 +376,16 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.get_comments")
 
         raw_result = await self.api_request("getComments", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            WallGetCommentsResponse(**raw_result)
+            self.parse_response(WallGetCommentsResponse, raw_result)
             if not extended
-            else WallGetCommentsExtendedResponse(**raw_result)
+            else self.parse_response(WallGetCommentsExtendedResponse, raw_result)
         )
         return result
 
@@ -406,13 +406,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.get_reposts")
 
         raw_result = await self.api_request("getReposts", params)
         if return_raw_response:
             return raw_result
 
-        result = WallGetRepostsResponse(**raw_result)
+        result = self.parse_response(WallGetRepostsResponse, raw_result)
         return result
 
     async def open_comments(
@@ -428,13 +428,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.open_comments")
 
         raw_result = await self.api_request("openComments", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseBoolResponse(**raw_result)
+        result = self.parse_response(BaseBoolResponse, raw_result)
         return result
 
     async def pin(
@@ -450,13 +450,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.pin")
 
         raw_result = await self.api_request("pin", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def post(
@@ -504,13 +504,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.post")
 
         raw_result = await self.api_request("post", params)
         if return_raw_response:
             return raw_result
 
-        result = WallPostResponse(**raw_result)
+        result = self.parse_response(WallPostResponse, raw_result)
         return result
 
     async def post_ads_stealth(
@@ -546,13 +546,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.post_ads_stealth")
 
         raw_result = await self.api_request("postAdsStealth", params)
         if return_raw_response:
             return raw_result
 
-        result = WallPostAdsStealthResponse(**raw_result)
+        result = self.parse_response(WallPostAdsStealthResponse, raw_result)
         return result
 
     async def report_comment(
@@ -570,13 +570,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.report_comment")
 
         raw_result = await self.api_request("reportComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def report_post(
@@ -594,13 +594,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.report_post")
 
         raw_result = await self.api_request("reportPost", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def repost(
@@ -622,13 +622,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.repost")
 
         raw_result = await self.api_request("repost", params)
         if return_raw_response:
             return raw_result
 
-        result = WallRepostResponse(**raw_result)
+        result = self.parse_response(WallRepostResponse, raw_result)
         return result
 
     async def restore(
@@ -644,13 +644,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.restore")
 
         raw_result = await self.api_request("restore", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def restore_comment(
@@ -666,13 +666,13 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.restore_comment")
 
         raw_result = await self.api_request("restoreComment", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
 
     async def search(
@@ -700,16 +700,16 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.search")
 
         raw_result = await self.api_request("search", params)
         if return_raw_response:
             return raw_result
 
         result = (
-            WallSearchResponse(**raw_result)
+            self.parse_response(WallSearchResponse, raw_result)
             if not extended
-            else WallSearchExtendedResponse(**raw_result)
+            else self.parse_response(WallSearchExtendedResponse, raw_result)
         )
         return result
 
@@ -726,11 +726,11 @@ class Wall(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Wall.unpin")
 
         raw_result = await self.api_request("unpin", params)
         if return_raw_response:
             return raw_result
 
-        result = BaseOkResponse(**raw_result)
+        result = self.parse_response(BaseOkResponse, raw_result)
         return result
@@ -28,13 +28,13 @@ class Widgets(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Widgets.get_comments")
 
         raw_result = await self.api_request("getComments", params)
         if return_raw_response:
             return raw_result
 
-        result = WidgetsGetCommentsResponse(**raw_result)
+        result = self.parse_response(WidgetsGetCommentsResponse, raw_result)
         return result
 
     async def get_pages(
@@ -56,11 +56,11 @@ class Widgets(Category):
         :return:
         """
 
-        params = get_params(locals())
+        params = get_params(locals(), "Widgets.get_pages")
 
         raw_result = await self.api_request("getPages", params)
         if return_raw_response:
             return raw_result
 
-        result = WidgetsGetPagesResponse(**raw_result)
+        result = self.parse_response(WidgetsGetPagesResponse, raw_result)
         return result
@@ -1,16 +1,46 @@
+import time
 from abc import ABC, abstractmethod
 from random import choice
-from typing import List, Tuple, Union, cast
+from typing import Dict, Hashable, List, Optional, Tuple, Union, cast
 
 from vkwave.api.token.token import (
     ABCAsyncToken,
     ABCSyncToken,
     AnyABCToken,
+    BotSyncPoolTokens,
     GetTokenType,
     Token,
     TokenType,
 )
 
+AnyTokenCandidate = Union[Token, AnyABCToken]
+
+# error codes after which token shouldn't be used for a while and default cooldowns (seconds)
+# 6: too many requests per second; 9: flood control; 29: rate limit reached
+DEFAULT_COOLDOWNS: Dict[int, float] = {6: 1.0, 9: 60.0, 29: 3600.0}
+
+
+async def resolve_token(token: AnyTokenCandidate) -> Token:
+    if isinstance(token, str):
+        return cast(Token, token)
+
+    if token.get_token_type is GetTokenType.ASYNC:
+        token = cast(ABCAsyncToken, token)
+        return await token.get_token()
+    token = cast(ABCSyncToken, token)
+    return token.get_token()
+
+
+def expand_pools(tokens: List[AnyABCToken]) -> List[AnyTokenCandidate]:
+    """Replace pools with their tokens, so strategy can choose between all of them"""
+    expanded: List[AnyTokenCandidate] = []
+    for token in tokens:
+        if isinstance(token, BotSyncPoolTokens):
+            expanded.extend(token.tokens)
+        else:
+            expanded.append(token)
+    return expanded
+
 
 class ABCGetTokenStrategy(ABC):
     token_type: Union[TokenType, Tuple[TokenType, ...]]
@@ -20,18 +50,94 @@ class ABCGetTokenStrategy(ABC):
     async def get_token(self, tokens: List[AnyABCToken]) -> Token:
         ...
 
+    def release_token(self, token: Token, error_code: Optional[int] = None) -> None:
+        """It's called when request with token (got from `get_token`) is done."""
+
 
 class RandomGetTokenStrategy(ABCGetTokenStrategy):
     token_type = (TokenType.BOT, TokenType.USER)
     get_token_type = (GetTokenType.SYNC, GetTokenType.ASYNC)
 
     async def get_token(self, tokens: List[AnyABCToken]) -> Token:
-        token = choice(tokens)
-        if isinstance(token, str):
-            return cast(Token, token)
-
-        if token.get_token_type is GetTokenType.ASYNC:
-            token = cast(ABCAsyncToken, token)
-            return await token.get_token()
-        token = cast(ABCSyncToken, token)
-        return token.get_token()
+        return await resolve_token(choice(tokens))
+
+
+class RoundRobinGetTokenStrategy(ABCGetTokenStrategy):
+    """Takes tokens one by one."""
+
+    token_type = (TokenType.BOT, TokenType.USER)
+    get_token_type = (GetTokenType.SYNC, GetTokenType.ASYNC)
+
+    def __init__(self):
+        self._index = -1
+
+    async def get_token(self, tokens: List[AnyABCToken]) -> Token:
+        candidates = expand_pools(tokens)
+        self._index = (self._index + 1) % len(candidates)
+        return await resolve_token(candidates[self._index])
+
+
+class LeastInFlightGetTokenStrategy(ABCGetTokenStrategy):
+    """Takes token with the least count of requests that are being sent right now."""
+
+    token_type = (TokenType.BOT, TokenType.USER)
+    get_token_type = (GetTokenType.SYNC, GetTokenType.ASYNC)
+
+    def __init__(self):
+        self.in_flight: Dict[Hashable, int] = {}
+        self._candidates: Dict[Token, AnyTokenCandidate] = {}
+        self._offset = 0
+
+    def _choose(self, candidates: List[AnyTokenCandidate]) -> AnyTokenCandidate:
+        # start from the next token every time, so idle tokens are taken in turn
+        self._offset = (self._offset + 1) % len(candidates)
+        rotated = candidates[self._offset :] + candidates[: self._offset]
+        return min(rotated, key=lambda candidate: self.in_flight.get(candidate, 0))
+
+    async def get_token(self, tokens: List[AnyABCToken]) -> Token:
+        candidate = self._choose(expand_pools(tokens))
+        token = await resolve_token(candidate)
+        self._candidates[token] = candidate
+        self.in_flight[candidate] = self.in_flight.get(candidate, 0) + 1
+        return token
+
+    def release_token(self, token: Token, error_code: Optional[int] = None) -> None:
+        candidate = self._candidates.get(token, token)
+        in_flight = self.in_flight.get(candidate, 0) - 1
+        if in_flight > 0:
+            self.in_flight[candidate] = in_flight
+        else:
+            self.in_flight.pop(candidate, None)
+
+
+class BudgetAwareGetTokenStrategy(LeastInFlightGetTokenStrategy):
+    """
+    Like `LeastInFlightGetTokenStrategy`, but skips tokens that got
+    "too many requests" errors (6, 9, 29) until their cooldown is over.
+
+    >>> BudgetAwareGetTokenStrategy(cooldowns={6: 0.5, 9: 30})
+    """
+
+    def __init__(self, cooldowns: Optional[Dict[int, float]] = None):
+        super().__init__()
+        self.cooldowns: Dict[int, float] = {**DEFAULT_COOLDOWNS, **(cooldowns or {})}
+        self.cooling_until: Dict[Hashable, float] = {}
+
+    def _choose(self, candidates: List[AnyTokenCandidate]) -> AnyTokenCandidate:
+        now = time.monotonic()
+        available = [
+            candidate
+            for candidate in candidates
+            if self.cooling_until.get(candidate, 0) <= now
+        ]
+        if not available:
+            # every token is cooling down, so take the one that will be ready first
+            return min(candidates, key=lambda candidate: self.cooling_until[candidate])
+        return super()._choose(available)
+
+    def release_token(self, token: Token, error_code: Optional[int] = None) -> None:
+        super().release_token(token, error_code)
+        cooldown = self.cooldowns.get(error_code)  # type: ignore
+        if cooldown is not None:
+            candidate = self._candidates.get(token, token)
+            self.cooling_until[candidate] = time.monotonic() + cooldown
@@ -1,7 +1,6 @@
 """
 Working with API tokens.
 """
-import random
 from enum import Enum, auto
 from typing import ClassVar, List, NewType, Union
 
@@ -74,6 +73,12 @@ class BotSyncSingleToken(ABCBotSyncToken):
 class BotSyncPoolTokens(ABCBotSyncToken):
     def __init__(self, tokens: List[Token]):
         self._tokens = tokens
+        self._index = -1
+
+    @property
+    def tokens(self) -> List[Token]:
+        return self._tokens
 
     def get_token(self, *args, **kwargs) -> Token:
-        return random.choice(self._tokens)
+        self._index = (self._index + 1) % len(self._tokens)
+        return self._tokens[self._index]
@@ -1,19 +1,3 @@
-from vkwave.bots.addons.easy import (
-    ClonesBot,
-    SimpleBotEvent,
-    SimpleCallbackBot,
-    SimpleLongPollBot,
-    SimpleLongPollUserBot,
-    SimpleUserEvent,
-    TaskManager,
-    create_api_session_aiohttp,
-    simple_bot_handler,
-    simple_bot_message_handler,
-    simple_user_handler,
-    simple_user_message_handler,
-)
-
-from .addons.low_level_dispatching import LowLevelBot
 from .core.dispatching.dp.dp import Dispatcher
 from .core.dispatching.dp.middleware.middleware import BaseMiddleware, MiddlewareResult
 from .core.dispatching.events.base import BaseEvent, BotEvent, BotType, UserEvent
@@ -64,3 +48,22 @@ from .utils import (
     VoiceUploader,
     WallPhotoUploader,
 )
+
+# addons use names above, so they are imported last
+from vkwave.bots.addons.easy import (  # isort: skip
+    ClonesBot,
+    SimpleBotEvent,
+    SimpleCallbackBot,
+    SimpleLongPollBot,
+    SimpleLongPollUserBot,
+    SimpleUserEvent,
+    TaskManager,
+    create_api_session_aiohttp,
+    simple_bot_handler,
+    simple_bot_message_handler,
+    simple_bot_process_handler,
+    simple_user_handler,
+    simple_user_message_handler,
+)
+
+from .addons.low_level_dispatching import LowLevelBot  # isort: skip
@@ -10,4 +10,11 @@ from .easy_handlers import (
     simple_user_message_handler,
 )
 from .easy_userbot import SimpleLongPollUserBot
+from .process_handlers import (
+    AttachmentAnswer,
+    ProcessCallback,
+    ProcessMessage,
+    UploadRequest,
+    simple_bot_process_handler,
+)
 from .task_manager import TaskManager
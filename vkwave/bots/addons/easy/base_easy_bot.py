@@ -49,6 +49,7 @@ from vkwave.bots.addons.easy.easy_handlers import (
     SimpleUserEvent,
 )
 from vkwave.bots.core import BaseFilter
+from vkwave.bots.core.dispatching.dp.executor import BaseDispatchExecutor
 from vkwave.bots.core.dispatching.dp.middleware.middleware import BaseMiddleware, MiddlewareResult
 from vkwave.bots.core.dispatching.filters.builtin import (
     AttachmentTypeFilter,
@@ -68,7 +69,7 @@ class _APIContextManager:
         self, tokens: typing.Union[str, typing.List[str]], bot_type: BotType, client: AIOHTTPClient
     ):
         self.client = client
-        if bot_type.USER:
+        if bot_type is BotType.USER:
             self.tokens = (
                 UserSyncSingleToken(Token(tokens))
                 if isinstance(tokens, str)
@@ -110,6 +111,7 @@ class BaseSimpleLongPollBot:
         event: typing.Optional[
             typing.Union[typing.Type[SimpleBotEvent], typing.Type[SimpleUserEvent]]
         ] = None,
+        executor: typing.Optional[BaseDispatchExecutor] = None,
     ):
         if uvloop:
             import uvloop
@@ -126,13 +128,17 @@ class BaseSimpleLongPollBot:
             self.SimpleBotEvent = SimpleUserEvent
             self._lp = UserLongpoll(self.api_context, UserLongpollData())
             self._token_storage = UserTokenStorage[UserId](tokens)
-            self.dispatcher = Dispatcher(self.api_session.api, self._token_storage)
+            self.dispatcher = Dispatcher(
+                self.api_session.api, self._token_storage, executor=executor
+            )
             self._lp = UserLongpollExtension(self.dispatcher, self._lp)
         else:
             self.SimpleBotEvent = SimpleBotEvent
             self._lp = BotLongpoll(self.api_context, BotLongpollData(group_id))
             self._token_storage = TokenStorage[GroupId]()
-            self.dispatcher = Dispatcher(self.api_session.api, self._token_storage)
+            self.dispatcher = Dispatcher(
+                self.api_session.api, self._token_storage, executor=executor
+            )
             self._lp = BotLongpollExtension(self.dispatcher, self._lp)
 
         self.event = event or self.SimpleBotEvent
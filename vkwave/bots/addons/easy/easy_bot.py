@@ -3,6 +3,7 @@ import typing
 from vkwave.bots import GroupId
 from vkwave.bots.addons.easy.base_easy_bot import BaseSimpleLongPollBot
 from vkwave.bots.addons.easy.easy_handlers import SimpleBotEvent
+from vkwave.bots.core.dispatching.dp.executor import BaseDispatchExecutor
 from vkwave.bots.core.dispatching.extensions.callback import AIOHTTPCallbackExtension
 from vkwave.bots.core.dispatching.extensions.callback.conf import ConfirmationStorage
 from vkwave.bots.core.dispatching.router.router import BaseRouter
@@ -19,6 +20,7 @@ class SimpleLongPollBot(BaseSimpleLongPollBot):
         uvloop: bool = False,
         client: typing.Optional[AIOHTTPClient] = None,
         event: typing.Optional[typing.Type[SimpleBotEvent]] = None,
+        executor: typing.Optional[BaseDispatchExecutor] = None,
     ):
         super().__init__(
             tokens,
@@ -28,6 +30,7 @@ class SimpleLongPollBot(BaseSimpleLongPollBot):
             uvloop=uvloop,
             client=client,
             event=event or SimpleBotEvent,
+            executor=executor,
         )
 
 
@@ -43,9 +46,15 @@ class SimpleCallbackBot(BaseSimpleLongPollBot):
         secret: typing.Optional[str] = None,
         router: typing.Optional[BaseRouter] = None,
         uvloop: bool = False,
+        executor: typing.Optional[BaseDispatchExecutor] = None,
     ):
         super().__init__(
-            tokens, bot_type=BotType.BOT, group_id=group_id, router=router, uvloop=uvloop
+            tokens,
+            bot_type=BotType.BOT,
+            group_id=group_id,
+            router=router,
+            uvloop=uvloop,
+            executor=executor,
         )
         storage = ConfirmationStorage()
         storage.add_confirmation(GroupId(group_id), confirmation_key)
@@ -1,3 +1,4 @@
+import copy
 import json
 import random
 import warnings
@@ -5,11 +6,13 @@ from typing import Any, Callable, Dict, List, NoReturn, Optional, Type, Union
 
 from pydantic.v1 import PrivateAttr
 
+from vkwave.api import APIOptionsRequestContext
 from vkwave.bots import BotEvent, BotType, EventTypeFilter, UserEvent
 from vkwave.bots.core import BaseFilter
 from vkwave.bots.core.dispatching.filters.builtin import get_payload, get_text
 from vkwave.bots.core.dispatching.handler.callback import BaseCallback
 from vkwave.bots.core.dispatching.handler.cast import caster as callback_caster
+from vkwave.bots.core.dispatching.offload import ThreadOffloader
 from vkwave.bots.core.dispatching.router.router import BaseRouter
 from vkwave.bots.core.types.json_types import JSONEncoder
 from vkwave.types.bot_events import BotEventType
@@ -28,10 +31,19 @@ except ImportError:
     aiofile = None
 
 
+async def _get_raw_user(api_ctx: APIOptionsRequestContext, user_id: int, **kwargs) -> dict:
+    loader = api_ctx.api_options.profile_loader
+    if loader is not None:
+        # lookups of the same loop iteration are loaded with one request
+        return await loader.load_user(api_ctx, user_id, **kwargs)
+    return (await api_ctx.api_request("users.get", {"user_ids": user_id, **kwargs}))["response"][0]
+
+
 class SimpleUserEvent(UserEvent):
     def __init__(self, event: UserEvent):
         super().__init__(event.object, event.api_ctx)
         self.user_data = event.user_data
+        self._facts = event._facts
 
     def __setitem__(self, key: Any, item: Any) -> None:
         self.user_data[key] = item
@@ -45,11 +57,11 @@ class SimpleUserEvent(UserEvent):
 
     @property
     def peer_id(self) -> int:
-        return self.object.object.peer_id
+        return self.facts.peer_id
 
     @property
     def from_id(self) -> int:
-        return self.object.object.message_data.from_id
+        return self.facts.from_id
 
     @property
     def user_id(self) -> int:
@@ -58,9 +70,7 @@ class SimpleUserEvent(UserEvent):
     async def get_user(
         self, raw_mode: bool = False, **kwargs
     ) -> Union["UsersUser", dict]:  # getting information about the sender
-        raw_user = (
-            await self.api_ctx.api_request("users.get", {"user_ids": self.user_id, **kwargs})
-        )["response"][0]
+        raw_user = await _get_raw_user(self.api_ctx, self.user_id, **kwargs)
         return raw_user if raw_mode else UsersUser(**raw_user)
 
     async def answer(
@@ -318,7 +328,8 @@ class SimpleAttachment(MessagesMessageAttachment):
             raise RuntimeError("cannot download this attachment type")
 
         url = self.url
-        client, token = await self._event.api_ctx.api_options.get_client_and_token()
+        # files are downloaded without token, so it isn't taken from strategy
+        client = self._event.api_ctx.api_options.get_client()
         data = await client.http_client.request_data(method="GET", url=url)
 
         self._data = data
@@ -353,8 +364,8 @@ class SimpleBotEvent(BotEvent):
     def __init__(self, event: BotEvent):
         super().__init__(event.object, event.api_ctx)
         self.user_data = event.user_data
+        self._facts = event._facts
         self._attachments: Optional[Attachments] = None
-        self._payload: Optional[dict] = None
 
     def __setitem__(self, key: Any, item: Any) -> None:
         self.user_data[key] = item
@@ -378,9 +389,7 @@ class SimpleBotEvent(BotEvent):
         Returns:
             int: идентификатор чата
         """
-        if self.object.type == BotEventType.MESSAGE_EVENT.value:
-            return self.object.object.peer_id
-        return self.object.object.message.peer_id
+        return self.facts.peer_id
 
     @property
     def from_id(self) -> int:
@@ -389,9 +398,7 @@ class SimpleBotEvent(BotEvent):
         Returns:
             int: идентификатор отправителя
         """
-        if self.object.type == BotEventType.MESSAGE_EVENT.value:
-            return self.object.object.user_id
-        return self.object.object.message.from_id
+        return self.facts.from_id
 
     @property
     def payload(self) -> Optional[dict]:
@@ -400,16 +407,9 @@ class SimpleBotEvent(BotEvent):
         Returns:
             int: payload события
         """
-        current_payload = get_payload(self)
-        if current_payload is None:
-            return current_payload
-        if self._payload is None:
-            self._payload = (
-                json.loads(current_payload)
-                if not isinstance(current_payload, dict)
-                else current_payload
-            )
-        return self._payload
+        if get_payload(self) is None:
+            return None
+        return self.facts.get_payload_data()
 
     @property
     def attachments(self) -> Optional[List[SimpleAttachment]]:
@@ -439,9 +439,7 @@ class SimpleBotEvent(BotEvent):
         Returns:
             Union["UsersUser", dict]: Объект пользователя
         """
-        raw_user = (
-            await self.api_ctx.api_request("users.get", {"user_ids": self.user_id, **kwargs})
-        )["response"][0]
+        raw_user = await _get_raw_user(self.api_ctx, self.user_id, **kwargs)
         return raw_user if raw_mode else UsersUser(**raw_user)
 
     async def edit(
@@ -771,6 +769,14 @@ class SimpleBotCallback(BaseCallback):
             new_event = self.event_type(event)
         return await self.func.execute(new_event)
 
+    def offloaded(self, offloader: ThreadOffloader) -> BaseCallback:
+        func = self.func.offloaded(offloader)
+        if func is self.func:
+            return self
+        callback = copy.copy(self)
+        callback.func = func
+        return callback
+
     def __repr__(self):
         return f"<SimpleBotCallback {self.func.__name__} bot_type={self.bot_type}>"
 
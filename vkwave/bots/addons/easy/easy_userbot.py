@@ -2,6 +2,7 @@ import typing
 
 from vkwave.bots.addons.easy.base_easy_bot import BaseSimpleLongPollBot
 from vkwave.bots.addons.easy.easy_handlers import SimpleUserEvent
+from vkwave.bots.core.dispatching.dp.executor import BaseDispatchExecutor
 from vkwave.bots.core.dispatching.router.router import BaseRouter
 from vkwave.bots.core.types.bot_type import BotType
 from vkwave.client import AIOHTTPClient
@@ -15,6 +16,7 @@ class SimpleLongPollUserBot(BaseSimpleLongPollBot):
         uvloop: bool = False,
         client: typing.Optional[AIOHTTPClient] = None,
         event: typing.Optional[typing.Type[SimpleUserEvent]] = None,
+        executor: typing.Optional[BaseDispatchExecutor] = None,
     ):
         super().__init__(
             tokens,
@@ -24,4 +26,5 @@ class SimpleLongPollUserBot(BaseSimpleLongPollBot):
             uvloop=uvloop,
             client=client,
             event=event or SimpleUserEvent,
+            executor=executor,
         )
@@ -0,0 +1,242 @@
+"""
+Handlers that run in other processes, for CPU-heavy work (images, voice messages and so on).
+
+Attachments of message are downloaded in the main process and passed to handler through shared
+memory, so they aren't pickled. Handler gets `ProcessMessage` and returns text of answer,
+`UploadRequest` (file to upload and send) or `AttachmentAnswer` (attachment to send),
+the main process sends it with API. Handler must be a module-level function.
+Shared memory needs Python 3.8+.
+
+>>> def grayscale(message: ProcessMessage):
+...     image = Image.open(io.BytesIO(message.attachments[0].data)).convert("L")
+...     output = io.BytesIO()
+...     image.save(output, "png")
+...     return UploadRequest(output.getvalue(), file_extension="png", message="Done")
+>>> processes = ProcessOffloader(max_workers=4)
+>>> processes_handler = simple_bot_process_handler(router, offloader=processes)
+>>> processes_handler(grayscale)
+"""
+
+import asyncio
+import logging
+import random
+import typing
+from io import BytesIO
+
+from vkwave.bots import EventTypeFilter
+from vkwave.bots.core import BaseFilter
+from vkwave.bots.core.dispatching.events.base import BaseEvent
+from vkwave.bots.core.dispatching.handler.callback import BaseCallback
+from vkwave.bots.core.dispatching.offload import ProcessOffloader
+from vkwave.bots.core.dispatching.router.router import BaseRouter
+from vkwave.bots.utils.uploaders import (
+    BaseUploader,
+    DocUploader,
+    GraffitiUploader,
+    PhotoUploader,
+    VoiceUploader,
+)
+from vkwave.types.bot_events import BotEventType
+
+from .easy_handlers import SimpleAttachment
+
+if typing.TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+logger = logging.getLogger(__name__)
+
+Span = typing.Tuple[str, int, int]
+
+
+class ProcessAttachment(typing.NamedTuple):
+    type: str
+    # view of shared memory, it's valid only while handler runs
+    data: memoryview
+
+
+class ProcessMessage(typing.NamedTuple):
+    text: typing.Optional[str]
+    peer_id: typing.Optional[int]
+    from_id: typing.Optional[int]
+    # raw payload (usually it's a JSON string)
+    payload: typing.Any
+    attachments: typing.List[ProcessAttachment]
+
+
+class UploadRequest(typing.NamedTuple):
+    data: bytes
+    # key of `UPLOADERS`
+    uploader: str = "photo"
+    file_name: typing.Optional[str] = None
+    file_extension: typing.Optional[str] = None
+    message: typing.Optional[str] = None
+
+
+class AttachmentAnswer(typing.NamedTuple):
+    # e.g. "photo-1_2"
+    attachment: str
+    message: typing.Optional[str] = None
+
+
+UPLOADERS: typing.Dict[str, typing.Type[BaseUploader]] = {
+    "photo": PhotoUploader,
+    "doc": DocUploader,
+    "voice": VoiceUploader,
+    "graffiti": GraffitiUploader,
+}
+
+
+class _SharedMessage(typing.NamedTuple):
+    """Message that is sent to another process: attachments are in shared memory"""
+
+    text: typing.Optional[str]
+    peer_id: typing.Optional[int]
+    from_id: typing.Optional[int]
+    payload: typing.Any
+    memory_name: typing.Optional[str]
+    # types, offsets and sizes of attachments in the memory
+    spans: typing.List[Span]
+
+
+def _run_in_process(func: typing.Callable[[ProcessMessage], typing.Any], shared: _SharedMessage):
+    def call(attachments: typing.List[ProcessAttachment]) -> typing.Any:
+        text, peer_id, from_id, payload = shared[:4]
+        return func(ProcessMessage(text, peer_id, from_id, payload, attachments))
+
+    if shared.memory_name is None:
+        return call([])
+
+    from multiprocessing import shared_memory  # Python 3.8+
+
+    memory = shared_memory.SharedMemory(name=shared.memory_name)
+    views = [memory.buf[offset : offset + size] for _, offset, size in shared.spans]
+    try:
+        return call(
+            [ProcessAttachment(type_, view) for (type_, _, _), view in zip(shared.spans, views)]
+        )
+    finally:
+        try:
+            for view in views:
+                view.release()
+            memory.close()
+        except BufferError:
+            logger.warning("Handler kept views of attachments, they can't be released")
+
+
+def _share(
+    attachments: typing.List[typing.Tuple[str, bytes]]
+) -> typing.Tuple[typing.Optional["SharedMemory"], typing.List[Span]]:
+    """Copy attachments into one block of shared memory"""
+    if not attachments:
+        return None, []
+    from multiprocessing import shared_memory  # Python 3.8+
+
+    size = sum(len(data) for _, data in attachments)
+    memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    spans: typing.List[Span] = []
+    offset = 0
+    for type_, data in attachments:
+        memory.buf[offset : offset + len(data)] = data
+        spans.append((type_, offset, len(data)))
+        offset += len(data)
+    return memory, spans
+
+
+async def _download(attachment: SimpleAttachment) -> typing.Optional[typing.Tuple[str, bytes]]:
+    try:
+        data = await attachment.download()
+    except RuntimeError:  # attachments of some types can't be downloaded
+        return None
+    return getattr(attachment.type, "value", attachment.type), data
+
+
+class ProcessCallback(BaseCallback):
+    """
+    It runs `func` in `offloader`'s processes. Attachments of bot's messages are downloaded
+    (if `download_attachments`) and passed to `func` through shared memory.
+    """
+
+    def __init__(
+        self,
+        func: typing.Callable[[ProcessMessage], typing.Any],
+        offloader: ProcessOffloader,
+        download_attachments: bool = True,
+    ):
+        self.func = func
+        self.offloader = offloader
+        self.download_attachments = download_attachments
+
+    async def _download_attachments(
+        self, event: BaseEvent
+    ) -> typing.List[typing.Tuple[str, bytes]]:
+        message = event.facts.message
+        if not self.download_attachments or message is None or not message.attachments:
+            return []
+        downloads = await asyncio.gather(
+            *(
+                _download(SimpleAttachment(attachment, event=event))  # type: ignore
+                for attachment in message.attachments
+            )
+        )
+        return [download for download in downloads if download is not None]
+
+    async def execute(self, event: BaseEvent) -> typing.Any:
+        facts = event.facts
+        memory, spans = _share(await self._download_attachments(event))
+        try:
+            shared = _SharedMessage(
+                facts.text,
+                facts.peer_id,
+                facts.from_id,
+                facts.payload,
+                memory.name if memory is not None else None,
+                spans,
+            )
+            result = await self.offloader.run(_run_in_process, self.func, shared)
+        finally:
+            if memory is not None:
+                memory.close()
+                memory.unlink()
+        return await self._send(result, event)
+
+    async def _send(self, result: typing.Any, event: BaseEvent) -> typing.Any:
+        """Send uploads and attachments, the rest results are cast as usual"""
+        if isinstance(result, UploadRequest):
+            uploader = UPLOADERS[result.uploader](event.api_ctx)
+            attachment = await uploader.get_attachment_from_io(
+                event.facts.peer_id,  # type: ignore
+                BytesIO(result.data),
+                file_name=result.file_name,
+                file_extension=result.file_extension,
+            )
+            result = AttachmentAnswer(attachment, result.message)
+        if isinstance(result, AttachmentAnswer):
+            await event.api_ctx.messages.send(
+                random_id=random.randint(-2147483648, 2147483647),
+                peer_id=event.facts.peer_id,
+                message=result.message,
+                attachment=result.attachment,
+            )
+            return None
+        return result
+
+    def __repr__(self):
+        return f"<ProcessCallback {self.func.__name__}>"
+
+
+def simple_bot_process_handler(
+    router: BaseRouter, *filters: BaseFilter, offloader: ProcessOffloader
+):
+    """
+    Handler only for message events, it runs in `offloader`'s processes
+    """
+
+    def decorator(func: typing.Callable[[ProcessMessage], typing.Any]):
+        record = router.registrar.new()
+        record.with_filters(*filters)
+        record.filters.append(EventTypeFilter(BotEventType.MESSAGE_NEW))
+        record.handle(ProcessCallback(func, offloader))
+        router.registrar.register(record.ready())
+        return func
+
+    return decorator
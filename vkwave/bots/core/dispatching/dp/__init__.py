@@ -1 +1,9 @@
+from .executor import (
+    LOW_PRIORITY_EVENTS,
+    BaseDispatchExecutor,
+    EventPriority,
+    TaskExecutor,
+    WorkerPoolExecutor,
+    get_peer_id,
+)
 from .result_caster import BaseResultCaster, ResultCaster
@@ -1,17 +1,21 @@
+import functools
 import logging
-from typing import List, NewType, Optional, Union, cast
+from typing import Dict, List, NewType, Optional, Set, Tuple, Union, cast
 
-from vkwave.api.methods import API
-from vkwave.api.token.token import AnyABCToken
+from vkwave.api.methods import API, APIOptionsRequestContext
+from vkwave.api.token.token import AnyABCToken, TokenType
 from vkwave.bots.core.dispatching.events.base import BaseEvent, BotEvent, UserEvent
 from vkwave.bots.core.dispatching.events.raw import ExtensionEvent
+from vkwave.bots.core.dispatching.router.registrar import EventType
 from vkwave.bots.core.dispatching.router.router import HANDLER_NOT_FOUND, BaseRouter
 from vkwave.bots.core.tokens.storage import TokenStorage, UserTokenStorage
 from vkwave.bots.core.tokens.types import GroupId
 from vkwave.bots.core.types.bot_type import BotType
+from vkwave.client.sampling import LogSampler
 from vkwave.types.bot_events import get_event_object
 from vkwave.types.user_events import get_event_object as user_get_event_object
 
+from .executor import BaseDispatchExecutor, TaskExecutor, get_event_type
 from .middleware.middleware import MiddlewareManager
 from .processing_options import ProcessEventOptions
 from .result_caster import BaseResultCaster, ResultCaster
@@ -28,41 +32,154 @@ class Dispatcher:
         token_storage: Union[TokenStorage, UserTokenStorage],
         bot_type: BotType = BotType.BOT,
         result_caster: Optional[BaseResultCaster] = None,
+        executor: Optional[BaseDispatchExecutor] = None,
+        skip_unsubscribed_events: bool = False,
+        log_sampler: Optional[LogSampler] = None,
     ):
+        """
+        :param skip_unsubscribed_events: drop raw events of types that routers don't process
+            (by their `EventTypeFilter`s) before parsing. Middlewares don't get them too.
+        :param log_sampler: which events are logged in full (with DEBUG level),
+            all of them by default
+        """
         self.bot_type: BotType = bot_type
         self.api: API = api
         self.middleware_manager = MiddlewareManager()
         self.token_storage: Union[TokenStorage, UserTokenStorage] = token_storage
         self.routers: List[BaseRouter] = []
         self.result_caster: BaseResultCaster = result_caster or ResultCaster()
+        self.executor: BaseDispatchExecutor = executor or TaskExecutor()
+        self.skip_unsubscribed_events = skip_unsubscribed_events
+        self.skipped_events = 0
+        self.log_sampler = log_sampler or LogSampler()
+        # event types of routers and versions of their registrars they were got for
+        self._event_types: Optional[Set[EventType]] = None
+        self._event_types_key: Optional[tuple] = None
 
     def add_router(self, router: BaseRouter):
         self.routers.append(router)
+        self._event_types_key = None
+
+    def get_event_types(self) -> Optional[Set[EventType]]:
+        """
+        Event types that routers may process (`None` means any type).
+        They are cached until handlers of routers change.
+        """
+        key = tuple(router.registrar.version for router in self.routers)
+        if key == self._event_types_key:
+            return self._event_types
+
+        types: Optional[Set[EventType]] = set()
+        for router in self.routers:
+            router_types = router.get_event_types()
+            if router_types is None:
+                types = None
+                break
+            types.update(router_types)  # type: ignore
+        self._event_types = types
+        self._event_types_key = key
+        return types
+
+    async def dispatch(self, revent: ExtensionEvent, options: ProcessEventOptions) -> None:
+        """Process event with executor. It waits while executor is overloaded."""
+        await self.executor.submit(self.process_event, revent, options)
+
+    def dispatch_nowait(self, revent: ExtensionEvent, options: ProcessEventOptions) -> bool:
+        """Process event with executor. Return false if executor dropped it."""
+        return self.executor.submit_nowait(self.process_event, revent, options)
+
+    async def _get_api_ctx(
+        self, revent: ExtensionEvent, contexts: Dict[Optional[int], APIOptionsRequestContext]
+    ) -> APIOptionsRequestContext:
+        """Context with token of event. Contexts are cached by group (for bots) in `contexts`."""
+        group_id: Optional[int] = None
+        if revent.bot_type is BotType.BOT:
+            group_id = cast(dict, revent.raw_event)["group_id"]
+        api_ctx = contexts.get(group_id)
+        if api_ctx is None:
+            if group_id is None:
+                token = await self.token_storage.get_token()  # type: ignore
+            else:
+                token = await self.token_storage.get_token(GroupId(group_id))
+            # tokens of storages may be raw strings, their type is known by bot's type
+            token_type = TokenType.USER if revent.bot_type is BotType.USER else TokenType.BOT
+            api_ctx = contexts[group_id] = self.api.with_token(token, token_type)
+        return api_ctx
+
+    def _make_event(self, revent: ExtensionEvent, api_ctx: APIOptionsRequestContext) -> BaseEvent:
+        if revent.bot_type is BotType.BOT:
+            revent.raw_event = cast(dict, revent.raw_event)
+            return BotEvent(get_event_object(revent.raw_event), api_ctx)
+        revent.raw_event = cast(list, revent.raw_event)
+        return UserEvent(user_get_event_object(revent.raw_event), api_ctx)
+
+    def _is_unsubscribed(
+        self, revent: ExtensionEvent, event_types: Optional[Set[EventType]]
+    ) -> bool:
+        if event_types is not None and get_event_type(revent) not in event_types:
+            self.skipped_events += 1
+            logger.debug("Nobody processes events of this type, event was skipped")
+            return True
+        return False
+
+    def _should_log(self) -> bool:
+        # events aren't formatted at all unless they are logged
+        return logger.isEnabledFor(logging.DEBUG) and self.log_sampler.sample()
 
     async def process_event(
         self, revent: ExtensionEvent, options: ProcessEventOptions
     ) -> ProcessingResult:
-        event: BaseEvent
-
-        logger.debug(f"ProcessEventOptions:\n{options}")
-        logger.debug(f"New event! Raw:\n{revent}")
+        should_log = self._should_log()
+        if should_log:
+            logger.debug("ProcessEventOptions:\n%s", options)
+            logger.debug("New event! Raw:\n%s", revent)
 
         if options.do_not_handle:
-            logger.debug("ProcessEventOptions.do_not_handle is True")
-            logger.debug("Event was skipped")
+            if should_log:
+                logger.debug("ProcessEventOptions.do_not_handle is True")
+                logger.debug("Event was skipped")
             return ProcessingResult(False)
 
-        if revent.bot_type is BotType.BOT:
-            revent.raw_event = cast(dict, revent.raw_event)
-            group_id = revent.raw_event["group_id"]
-            token = await self.token_storage.get_token(GroupId(group_id))
-            event = BotEvent(get_event_object(revent.raw_event), self.api.with_token(token))
-        else:
-            revent.raw_event = cast(list, revent.raw_event)
-            obj = user_get_event_object(revent.raw_event)
-            event = UserEvent(obj, self.api.with_token(await self.token_storage.get_token()))
+        if self.skip_unsubscribed_events and self._is_unsubscribed(revent, self.get_event_types()):
+            return ProcessingResult(False)
 
-        logger.debug(f"New event! Formatted:\n{event}")
+        event = self._make_event(revent, await self._get_api_ctx(revent, {}))
+        return await self._handle_event(event, should_log)
+
+    async def process_events(
+        self, revents: List[ExtensionEvent], options: ProcessEventOptions
+    ) -> None:
+        """
+        Process batch of events (e.g. one longpoll response) with executor. Tokens and API contexts
+        are looked up once for the batch, middlewares get the whole batch (`pre_process_events`)
+        before processing of its events. It waits while executor is overloaded.
+        """
+        if options.do_not_handle:
+            logger.debug("ProcessEventOptions.do_not_handle is True")
+            logger.debug("Batch was skipped")
+            return
+
+        event_types = self.get_event_types() if self.skip_unsubscribed_events else None
+        contexts: Dict[Optional[int], APIOptionsRequestContext] = {}
+        events: List[Tuple[ExtensionEvent, BaseEvent]] = []
+        for revent in revents:
+            if self._is_unsubscribed(revent, event_types):
+                continue
+            try:
+                events.append(
+                    (revent, self._make_event(revent, await self._get_api_ctx(revent, contexts)))
+                )
+            except Exception:
+                logger.exception("Can't build event:\n%s", revent)
+
+        await self.middleware_manager.execute_pre_process_events([event for _, event in events])
+        for revent, event in events:
+            handle = functools.partial(self._handle_event, should_log=self._should_log())
+            await self.executor.submit_event(handle, event, revent, options)
+
+    async def _handle_event(self, event: BaseEvent, should_log: bool) -> ProcessingResult:
+        if should_log:
+            logger.debug("New event! Formatted:\n%s", event)
 
         if not await self.middleware_manager.execute_pre_process_event(event):
             return ProcessingResult(False)
@@ -72,11 +189,13 @@ class Dispatcher:
                 if result is HANDLER_NOT_FOUND:
                     continue
                 await self.result_caster.cast(result, event)
-                logger.debug("Event was successfully handled")
+                if should_log:
+                    logger.debug("Event was successfully handled")
 
                 await self.middleware_manager.execute_post_process_event(event)
                 return ProcessingResult(True)
-        logger.debug("Event wasn't handled")
+        if should_log:
+            logger.debug("Event wasn't handled")
         await self.middleware_manager.execute_post_process_event(event)
         return ProcessingResult(False)
 
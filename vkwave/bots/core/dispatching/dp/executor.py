@@ -0,0 +1,404 @@
+"""
+Executors run processing of events that extensions (longpolls, callback servers) receive.
+
+>>> dp = Dispatcher(api, token_storage, executor=WorkerPoolExecutor(workers=16, queue_size=1000))
+>>> await dp.dispatch(revent, options)  # waits while the queue is full
+>>> dp.dispatch_nowait(revent, options)  # drops the event if the queue is full
+>>> dp.executor.stats
+ExecutorStats(queued=0, processed=120, dropped=0, shed=0, timed_out=0, failed=1)
+"""
+
+import asyncio
+import collections
+import enum
+import itertools
+import logging
+import typing
+from abc import ABC, abstractmethod
+
+from vkwave.bots.core.dispatching.events.base import BaseEvent
+from vkwave.bots.core.dispatching.events.raw import ExtensionEvent
+from vkwave.bots.core.types.bot_type import BotType
+from vkwave.types.bot_events import BotEventType
+from vkwave.types.user_events import EventId
+
+from .processing_options import ProcessEventOptions
+
+logger = logging.getLogger(__name__)
+
+ProcessEvent = typing.Callable[[ExtensionEvent, ProcessEventOptions], typing.Awaitable[typing.Any]]
+HandleEvent = typing.Callable[[BaseEvent], typing.Awaitable[typing.Any]]
+
+
+class ExecutorStats:
+    __slots__ = ("queued", "processed", "dropped", "shed", "timed_out", "failed")
+
+    def __init__(self):
+        self.queued = 0
+        self.processed = 0
+        self.dropped = 0
+        # low priority events that were dropped to keep place for the rest
+        self.shed = 0
+        self.timed_out = 0
+        self.failed = 0
+
+    def __repr__(self) -> str:
+        counters = ", ".join(f"{name}={getattr(self, name)}" for name in self.__slots__)
+        return f"ExecutorStats({counters})"
+
+
+class BaseDispatchExecutor(ABC):
+    stats: ExecutorStats
+
+    @abstractmethod
+    async def submit(
+        self, process: ProcessEvent, revent: ExtensionEvent, options: ProcessEventOptions
+    ) -> None:
+        """Schedule processing of the event. It waits while the executor is overloaded."""
+
+    @abstractmethod
+    def submit_nowait(
+        self, process: ProcessEvent, revent: ExtensionEvent, options: ProcessEventOptions
+    ) -> bool:
+        """Schedule processing of the event. Return false if it was dropped."""
+
+    async def submit_event(
+        self,
+        handle: HandleEvent,
+        event: BaseEvent,
+        revent: ExtensionEvent,
+        options: ProcessEventOptions,
+    ) -> None:
+        """
+        Schedule handling of the event that is built already (`revent` is its raw event,
+        it's scheduled as usual). It waits while the executor is overloaded.
+        """
+
+        async def process(revent: ExtensionEvent, options: ProcessEventOptions) -> typing.Any:
+            return await handle(event)
+
+        await self.submit(process, revent, options)
+
+    async def join(self) -> None:
+        """Wait until all scheduled events are processed"""
+
+    async def close(self) -> None:
+        """Stop processing. Events that aren't processed yet are lost."""
+
+
+class TaskExecutor(BaseDispatchExecutor):
+    """Every event is processed in its own task, there are no limits"""
+
+    def __init__(self):
+        self.stats = ExecutorStats()
+        self._tasks: typing.Set["asyncio.Task[typing.Any]"] = set()
+
+    async def submit(
+        self, process: ProcessEvent, revent: ExtensionEvent, options: ProcessEventOptions
+    ) -> None:
+        self.submit_nowait(process, revent, options)
+
+    def submit_nowait(
+        self, process: ProcessEvent, revent: ExtensionEvent, options: ProcessEventOptions
+    ) -> bool:
+        task = asyncio.get_running_loop().create_task(process(revent, options))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def join(self) -> None:
+        while self._tasks:
+            await asyncio.wait(self._tasks.copy())
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+
+class EventPriority(enum.IntEnum):
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+EventType = typing.Union[str, int]
+
+# events that nobody waits for: typing, read receipts, friends' online
+LOW_PRIORITY_EVENTS: typing.Dict[EventType, EventPriority] = dict.fromkeys(
+    (
+        BotEventType.MESSAGE_TYPING_STATE.value,
+        EventId.READ_INCOMING_MESSAGES.value,
+        EventId.READ_OUTGOING_MESSAGES.value,
+        EventId.FRIEND_ONLINE.value,
+        EventId.FRIEND_OFFLINE.value,
+        *EventId.USER_TYPING_OR_MAKING_VOICE_MESSAGE.value,
+    ),
+    EventPriority.LOW,
+)
+
+
+def get_event_type(revent: ExtensionEvent) -> typing.Optional[EventType]:
+    """Type of raw bot event or id of raw user event"""
+    if revent.bot_type is BotType.USER:
+        return revent.raw_event[0] if revent.raw_event else None  # type: ignore
+    return revent.raw_event.get("type")  # type: ignore
+
+
+class _Job:
+    __slots__ = ("process", "revent", "options", "key", "priority", "queued_priority", "taken")
+
+    def __init__(
+        self,
+        process: ProcessEvent,
+        revent: ExtensionEvent,
+        options: ProcessEventOptions,
+        key: typing.Optional[typing.Hashable],
+        priority: EventPriority,
+    ):
+        self.process = process
+        self.revent = revent
+        self.options = options
+        self.key = key
+        self.priority = priority
+        # it's raised to priority of events of the key that wait for this one
+        self.queued_priority = priority
+        self.taken = False
+
+
+# user longpoll events with peer_id at the 3rd place, the rest have it (or user_id) at the 1st one
+_USER_EVENTS_WITH_MESSAGE_ID: typing.Tuple[int, ...] = (1, 2) + EventId.MESSAGE_EVENT.value
+
+
+def get_peer_id(revent: ExtensionEvent) -> typing.Optional[int]:
+    """Conversation of raw event (peer_id, or id of user for events without peer_id)"""
+    raw_event = revent.raw_event
+    if revent.bot_type is BotType.USER:
+        if not raw_event:
+            return None
+        index = 3 if raw_event[0] in _USER_EVENTS_WITH_MESSAGE_ID else 1
+        return raw_event[index] if len(raw_event) > index else None  # type: ignore
+
+    obj = raw_event.get("object")  # type: ignore
+    if not isinstance(obj, dict):
+        return None
+    message = obj.get("message")
+    if isinstance(message, dict):
+        obj = message
+    for key in ("peer_id", "from_id", "user_id"):
+        if obj.get(key) is not None:
+            return obj[key]
+    return None
+
+
+class WorkerPoolExecutor(BaseDispatchExecutor):
+    """
+    Fixed count of workers process events from a bounded queue.
+    When the queue is full, `submit` waits (e.g. longpoll pauses) and `submit_nowait` drops events.
+
+    With `key`, events with the same key (e.g. from one conversation) are processed one by one
+    in order of arrival, events with different keys are processed in parallel.
+    Events with `None` key aren't ordered.
+
+    With `priorities` (by event type), events of higher priority are taken by workers first and
+    low priority events are dropped as soon as `shed_depth` events wait for workers.
+    With `key` too, queued events are taken with the highest priority of events that wait for them.
+
+    >>> executor = WorkerPoolExecutor(workers=16, key=get_peer_id)
+    >>> executor = WorkerPoolExecutor(workers=16, priorities=LOW_PRIORITY_EVENTS)
+    """
+
+    def __init__(
+        self,
+        workers: int = 16,
+        queue_size: int = 1000,
+        timeout: typing.Optional[float] = None,
+        key: typing.Optional[
+            typing.Callable[[ExtensionEvent], typing.Optional[typing.Hashable]]
+        ] = None,
+        priorities: typing.Optional[typing.Dict[EventType, EventPriority]] = None,
+        shed_depth: typing.Optional[int] = None,
+    ):
+        """
+        :param workers: how many events are processed at once
+        :param queue_size: how many events may wait for a worker
+        :param timeout: processing of one event is cancelled after so many seconds
+        :param key: events with the same key are processed in order
+        :param priorities: priorities of event types, the rest are `EventPriority.NORMAL`
+        :param shed_depth: low priority events are dropped when so many events wait for workers,
+            half of `queue_size` by default
+        """
+        if workers < 1:
+            raise ValueError("At least one worker is needed")
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.key = key
+        self.priorities = priorities or {}
+        self.shed_depth = shed_depth if shed_depth is not None else queue_size // 2
+        self.stats = ExecutorStats()
+        self._depth = 0  # events that wait for a worker
+        self._unfinished = 0
+        # events of keys whose previous event is queued or processed
+        self._backlogs: typing.Dict[typing.Hashable, typing.Deque[_Job]] = {}
+        # events of keys that are queued or processed
+        self._heads: typing.Dict[typing.Hashable, _Job] = {}
+        # they are created in the running loop, on the first event
+        self._ready: typing.Optional["asyncio.PriorityQueue[typing.Any]"] = None
+        self._counter = itertools.count()  # events of the same priority are taken in order
+        self._has_space: typing.Optional[asyncio.Event] = None
+        self._finished: typing.Optional[asyncio.Event] = None
+        self._workers: typing.List["asyncio.Task[None]"] = []
+
+    @property
+    def queue_depth(self) -> int:
+        return self._depth
+
+    def _start(self) -> "asyncio.PriorityQueue[typing.Any]":
+        if self._ready is None:
+            self._ready = asyncio.PriorityQueue()
+            self._has_space = asyncio.Event()
+            self._finished = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            self._workers = [
+                loop.create_task(self._work(self._ready)) for _ in range(self.workers)
+            ]
+        return self._ready
+
+    def _put_ready(self, job: _Job, priority: EventPriority) -> None:
+        job.queued_priority = priority
+        self._start().put_nowait((priority, next(self._counter), job))
+
+    def _get_priority(self, revent: ExtensionEvent) -> EventPriority:
+        if not self.priorities:
+            return EventPriority.NORMAL
+        return self.priorities.get(get_event_type(revent), EventPriority.NORMAL)  # type: ignore
+
+    def _shed(self, priority: EventPriority) -> bool:
+        if priority is EventPriority.LOW and self._depth >= self.shed_depth:
+            self.stats.shed += 1
+            logger.debug("Dispatch queue is loaded, low priority event was dropped")
+            return True
+        return False
+
+    def _add(self, job: _Job) -> None:
+        key = job.key
+        self._depth += 1
+        self._unfinished += 1
+        self.stats.queued += 1
+        if key is not None:
+            backlog = self._backlogs.get(key)
+            if backlog is not None:
+                backlog.append(job)
+                head = self._heads[key]
+                if not head.taken and job.priority < head.queued_priority:
+                    # the queued event would keep this one waiting behind lower priority events,
+                    # it's queued again with this priority (the old entry is skipped)
+                    self._put_ready(head, job.priority)
+                return
+            self._backlogs[key] = collections.deque()
+            self._heads[key] = job
+        self._put_ready(job, job.priority)
+
+    def _make_job(
+        self, process: ProcessEvent, revent: ExtensionEvent, options: ProcessEventOptions
+    ) -> _Job:
+        key = self.key(revent) if self.key is not None else None
+        return _Job(process, revent, options, key, self._get_priority(revent))
+
+    async def submit(
+        self, process: ProcessEvent, revent: ExtensionEvent, options: ProcessEventOptions
+    ) -> None:
+        self._start()
+        job = self._make_job(process, revent, options)
+        if self._shed(job.priority):
+            return  # polling isn't paused for low priority events
+        while self._depth >= self.queue_size:
+            self._has_space.clear()  # type: ignore
+            await self._has_space.wait()  # type: ignore
+        self._add(job)
+
+    def submit_nowait(
+        self, process: ProcessEvent, revent: ExtensionEvent, options: ProcessEventOptions
+    ) -> bool:
+        job = self._make_job(process, revent, options)
+        if self._shed(job.priority):
+            return False
+        if self._depth >= self.queue_size:
+            self.stats.dropped += 1
+            logger.warning("Dispatch queue is full, event was dropped")
+            return False
+        self._add(job)
+        return True
+
+    async def _process_in_time(self, job: _Job) -> bool:
+        """Return false if processing took more than `timeout` and it was cancelled"""
+        task = asyncio.ensure_future(job.process(job.revent, job.options))
+        try:
+            done, _ = await asyncio.wait((task,), timeout=self.timeout)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        if done:
+            task.result()  # errors of handlers (`TimeoutError` too) are raised as is
+            return True
+        task.cancel()
+        await asyncio.wait((task,))
+        if not task.cancelled():
+            task.exception()  # it's lost, processing is timed out anyway
+        return False
+
+    async def _process(self, job: _Job) -> None:
+        try:
+            if self.timeout is None:
+                await job.process(job.revent, job.options)
+            elif not await self._process_in_time(job):
+                self.stats.timed_out += 1
+                logger.warning(
+                    "Processing of event took more than %ss, it was cancelled", self.timeout
+                )
+                return
+        except Exception:
+            self.stats.failed += 1
+            logger.exception("Error while processing event")
+        else:
+            self.stats.processed += 1
+
+    async def _work(self, ready: "asyncio.PriorityQueue[typing.Any]") -> None:
+        while True:
+            _, _, job = await ready.get()
+            if job.taken:
+                continue  # it was queued again with higher priority
+            job.taken = True
+            self._depth -= 1
+            self._has_space.set()  # type: ignore
+            try:
+                await self._process(job)
+            finally:
+                if job.key is not None:
+                    backlog = self._backlogs[job.key]
+                    if backlog:
+                        # the next event of the key goes to the end, so other keys aren't starved
+                        head = self._heads[job.key] = backlog.popleft()
+                        priority = min(waiting.priority for waiting in (head, *backlog))
+                        self._put_ready(head, priority)
+                    else:
+                        del self._backlogs[job.key]
+                        del self._heads[job.key]
+                self._unfinished -= 1
+                if not self._unfinished:
+                    self._finished.set()  # type: ignore
+
+    async def join(self) -> None:
+        while self._unfinished:
+            self._finished.clear()  # type: ignore
+            await self._finished.wait()  # type: ignore
+
+    async def close(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+        self._ready = None
+        self._backlogs.clear()
+        self._heads.clear()
+        self._depth = 0
+        self._unfinished = 0
@@ -14,6 +14,12 @@ class BaseMiddleware(ABC):
     async def post_process_event(self, event: BaseEvent):
         pass
 
+    async def pre_process_events(self, events: List[BaseEvent]) -> None:
+        """
+        It's called with the whole batch (e.g. longpoll response) before `pre_process_event`
+        of its events, so the middleware can prepare for all of them at once.
+        """
+
 
 class MiddlewareManager:
     def __init__(self):
@@ -29,6 +35,10 @@ class MiddlewareManager:
                 return MiddlewareResult(False)
         return MiddlewareResult(True)
 
+    async def execute_pre_process_events(self, events: List[BaseEvent]) -> None:
+        for middleware in self.middlewares:
+            await middleware.pre_process_events(events)
+
     async def execute_post_process_event(self, event: BaseEvent):
         for middleware in self.middlewares:
             await middleware.post_process_event(event)
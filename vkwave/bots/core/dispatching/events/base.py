@@ -1,15 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, TypeVar
+from typing import Any, Dict, Generic, Optional, TypeVar
 
 from vkwave.api.methods._abc import APIOptionsRequestContext
 from vkwave.bots.core.types.bot_type import BotType
 from vkwave.types.bot_events import BaseBotEvent
 from vkwave.types.user_events import BaseUserEvent
 
+from .facts import EventFacts
+
 T = TypeVar("T")
 
 
 class BaseEvent(ABC, Generic[T]):
+    _facts: Optional[EventFacts] = None
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(bot_type={self.bot_type}, object={self.object}, api_ctx={self.api_ctx})"
 
@@ -36,6 +40,13 @@ class BaseEvent(ABC, Generic[T]):
     def api_ctx(self) -> APIOptionsRequestContext:
         ...
 
+    @property
+    def facts(self) -> EventFacts:
+        """Memoized facts about the event, they are shared by all filters"""
+        if self._facts is None:
+            self._facts = EventFacts(self.bot_type, self.object)
+        return self._facts
+
 
 class Event(BaseEvent[T]):
     def __init__(self):
@@ -0,0 +1,144 @@
+import json
+import typing
+
+from vkwave.bots.core.types.bot_type import BotType
+from vkwave.bots.core.types.json_types import JSONDecoder
+from vkwave.types.user_events import EventId
+
+_MISSING = object()
+
+MessageEventUser: typing.Tuple[int, ...] = EventId.MESSAGE_EVENT.value
+AdvancedMessageEventUser: typing.Tuple[int, ...] = (
+    MessageEventUser + EventId.USER_TYPING_OR_MAKING_VOICE_MESSAGE.value
+)
+MessageEventBot: str = "message_new"
+CallbackMessageEventBot: str = "message_event"
+_BOT_MESSAGE_EVENTS = (MessageEventBot, CallbackMessageEventBot)
+
+
+class EventFacts:
+    """
+    Facts about event (text, payload, ids and so on). Every fact is computed once, on first access,
+    so filters of all handlers share the work instead of inspecting the event again.
+
+    >>> event.facts.text_lower
+    >>> event.facts.get_payload_data()
+    """
+
+    # loader of payloads that is used when nobody passed another one
+    json_loader: JSONDecoder = staticmethod(json.loads)  # type: ignore
+
+    __slots__ = ("bot_type", "object", "_cache")
+
+    def __init__(self, bot_type: BotType, event_object: typing.Any):
+        self.bot_type = bot_type
+        self.object = event_object
+        self._cache: typing.Dict[str, typing.Any] = {}
+
+    def _get(self, name: str, compute: typing.Callable[[], typing.Any]) -> typing.Any:
+        value = self._cache.get(name, _MISSING)
+        if value is _MISSING:
+            value = self._cache[name] = compute()
+        return value
+
+    @property
+    def event_type(self) -> typing.Union[str, int]:
+        """Type of bot's event or id of user's event (as `EventTypeFilter` checks them)"""
+        if self.bot_type is BotType.BOT:
+            return self.object.type
+        return self.object.object.event_id
+
+    def is_message_event(self, flags_needed: bool = False) -> bool:
+        name = "is_message_event_with_flags" if flags_needed else "is_message_event"
+        return self._get(name, lambda: self._is_message(flags_needed))
+
+    def _is_message(self, flags_needed: bool) -> bool:
+        if self.bot_type is BotType.BOT:
+            return self.object.type in _BOT_MESSAGE_EVENTS
+        events = MessageEventUser if flags_needed else AdvancedMessageEventUser
+        return self.object.object.event_id in events
+
+    @property
+    def message(self) -> typing.Any:
+        """Message of bot's event (`None` for callback events and user's events)"""
+        return self._get("message", self._get_message)
+
+    def _get_message(self) -> typing.Any:
+        if self.bot_type is BotType.BOT:
+            return getattr(self.object.object, "message", None)
+        return None
+
+    @property
+    def text(self) -> typing.Optional[str]:
+        return self._get("text", self._get_text)
+
+    def _get_text(self) -> typing.Optional[str]:
+        if self.bot_type is BotType.USER:
+            return getattr(self.object.object, "text", None)
+        message = self.message
+        return message.text if message is not None else None
+
+    @property
+    def text_lower(self) -> typing.Optional[str]:
+        return self._get("text_lower", lambda: None if self.text is None else self.text.lower())
+
+    @property
+    def payload(self) -> typing.Any:
+        """Raw payload (usually it's a JSON string)"""
+        return self._get("payload", self._get_payload)
+
+    def _get_payload(self) -> typing.Any:
+        if self.bot_type is BotType.USER:
+            message_data = getattr(self.object.object, "message_data", None)
+            return message_data.payload if message_data is not None else None
+        if self.message is not None:
+            return self.message.payload
+        return getattr(self.object.object, "payload", None)
+
+    def get_payload_data(self, json_loader: typing.Optional[JSONDecoder] = None) -> typing.Any:
+        """Decoded payload. It's decoded once, with the loader of the first caller."""
+        payload = self.payload
+        if payload is None or isinstance(payload, dict):
+            return payload
+        return self._get("payload_data", lambda: (json_loader or self.json_loader)(payload))
+
+    @property
+    def from_id(self) -> typing.Optional[int]:
+        """Sender of message (user of callback events)"""
+        return self._get("from_id", self._get_from_id)
+
+    def _get_from_id(self) -> typing.Optional[int]:
+        if self.bot_type is BotType.USER:
+            message_data = getattr(self.object.object, "message_data", None)
+            if message_data is None or message_data.from_id is None:
+                return None
+            return int(message_data.from_id)
+        if self.message is not None:
+            return self.message.from_id
+        return getattr(self.object.object, "user_id", None)
+
+    @property
+    def peer_id(self) -> typing.Optional[int]:
+        return self._get("peer_id", self._get_peer_id)
+
+    def _get_peer_id(self) -> typing.Optional[int]:
+        if self.message is not None:
+            return self.message.peer_id
+        return getattr(self.object.object, "peer_id", None)
+
+    @property
+    def attachment_types(self) -> typing.Tuple[str, ...]:
+        return self._get("attachment_types", self._get_attachment_types)
+
+    def _get_attachment_types(self) -> typing.Tuple[str, ...]:
+        if self.bot_type is BotType.USER:
+            extra = getattr(self.object.object, "extra_message_data", None) or {}
+            return tuple(
+                value
+                for key, value in extra.items()
+                if key.startswith("attach") and key.endswith("_type")
+            )
+        if self.message is None or not self.message.attachments:
+            return ()
+        types = (attachment.type for attachment in self.message.attachments)
+        return tuple(getattr(type_, "value", type_) for type_ in types)
@@ -38,7 +38,9 @@ class CallbackView(web.View):
         options = ProcessEventOptions(do_not_handle=False)
         revent = ExtensionEvent(BotType.BOT, event)
 
-        get_running_loop().create_task(self.request.app["dp"].process_event(revent, options))
+        # VK repeats events that weren't answered with "ok", so events are dropped when dispatcher
+        # is overloaded
+        self.request.app["dp"].dispatch_nowait(revent, options)
 
         return web.Response(body="ok")
 
@@ -18,27 +18,33 @@ logger = logging.getLogger(__name__)
 
 
 class UserLongpollExtension(BaseExtension):
-    def __init__(self, dp: "Dispatcher", lp: UserLongpoll):
+    def __init__(self, dp: "Dispatcher", lp: UserLongpoll, batch: bool = False):
+        """
+        :param batch: process every longpoll response with `Dispatcher.process_events`.
+            Next updates are requested when dispatcher's executor took the batch.
+        """
         self.dp = dp
         self.lp = lp
+        self.batch = batch
+
+    async def _process_updates(self, events: list, options: ProcessEventOptions):
+        revents = [ExtensionEvent(BotType.USER, event) for event in events]
+        if self.batch:
+            await self.dp.process_events(revents, options)
+            return
+        for revent in revents:
+            # it waits (and doesn't poll) while dispatcher's executor is full
+            await self.dp.dispatch(revent, options)
 
     async def _start(self, ignore_errors: bool = True):
         options = ProcessEventOptions(do_not_handle=False)
         if not ignore_errors:
             while True:
-                events = await self.lp.get_updates()
-                for event in events:
-                    get_running_loop().create_task(
-                        self.dp.process_event(ExtensionEvent(BotType.USER, event), options)
-                    )
+                await self._process_updates(await self.lp.get_updates(), options)
         else:
             while True:
                 try:
-                    events = await self.lp.get_updates()
-                    for event in events:
-                        get_running_loop().create_task(
-                            self.dp.process_event(ExtensionEvent(BotType.USER, event), options)
-                        )
+                    await self._process_updates(await self.lp.get_updates(), options)
                 except Exception as e:
                     logger.error(f"Error in Longpoll ({e}): {traceback.format_exc()}")
                     continue
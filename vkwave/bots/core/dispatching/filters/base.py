@@ -1,8 +1,10 @@
+import copy
 import typing
 from abc import ABC, abstractmethod
 from typing import Awaitable, Callable, NewType
 
 from vkwave.bots.core.dispatching.events.base import BaseEvent
+from vkwave.bots.core.dispatching.offload import ThreadOffloader
 
 FilterResult = NewType("FilterResult", bool)
 
@@ -12,6 +14,13 @@ class BaseFilter(ABC):
     async def check(self, event: BaseEvent) -> FilterResult:
         ...
 
+    def offloaded(self, offloader: ThreadOffloader) -> "BaseFilter":
+        """
+        Filter that runs sync functions in `offloader` (it's `self` if there are none).
+        Filters may be shared by handlers, so they are copied, not changed.
+        """
+        return self
+
     def __and__(self, other: "BaseFilter") -> "AndFilter":
         return AndFilter(self, other)
 
@@ -36,6 +45,14 @@ class NotFilter(BaseFilter):
         res = await self.func.check(event)
         return FilterResult(not res)
 
+    def offloaded(self, offloader: ThreadOffloader) -> BaseFilter:
+        func = self.func.offloaded(offloader)
+        if func is self.func:
+            return self
+        new = copy.copy(self)
+        new.func = func
+        return new
+
 
 class AndFilter(BaseFilter):
     def __init__(self, *sfilters: BaseFilter):
@@ -48,6 +65,9 @@ class AndFilter(BaseFilter):
                 return FilterResult(False)
         return FilterResult(True)
 
+    def offloaded(self, offloader: ThreadOffloader) -> BaseFilter:
+        return _offload_funcs(self, offloader)
+
 
 class OrFilter(BaseFilter):
     def __init__(self, *sfilters: BaseFilter):
@@ -60,16 +80,46 @@ class OrFilter(BaseFilter):
 
         return FilterResult(False)
 
+    def offloaded(self, offloader: ThreadOffloader) -> BaseFilter:
+        return _offload_funcs(self, offloader)
 
-class SyncFuncFilter(BaseFilter):
-    """It accepts lambda and sync functions."""
 
-    def __init__(self, func: Callable[[BaseEvent], bool]):
+F = typing.TypeVar("F", AndFilter, OrFilter)
+
+
+def _offload_funcs(sfilter: F, offloader: ThreadOffloader) -> F:
+    funcs = tuple(func.offloaded(offloader) for func in sfilter.funcs)
+    if all(new is old for new, old in zip(funcs, sfilter.funcs)):
+        return sfilter
+    new = copy.copy(sfilter)
+    new.funcs = funcs
+    return new
+
+
+class SyncFuncFilter(BaseFilter):
+    """
+    It accepts lambda and sync functions.
+    With `offloader`, the function is called in its pool instead of the event loop.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[BaseEvent], bool],
+        offloader: typing.Optional[ThreadOffloader] = None,
+    ):
         self.func = func
+        self.offloader = offloader
 
     async def check(self, event: BaseEvent) -> FilterResult:
+        if self.offloader is not None:
+            return FilterResult(await self.offloader.run(self.func, event))
         return FilterResult(self.func(event))
 
+    def offloaded(self, offloader: ThreadOffloader) -> BaseFilter:
+        if self.offloader is not None:
+            return self
+        return SyncFuncFilter(self.func, offloader)
+
 
 class AsyncFuncFilter(BaseFilter):
     """It accepts any callables that return awaitables."""
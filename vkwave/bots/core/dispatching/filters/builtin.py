@@ -7,13 +7,19 @@ from typing import Dict, List, Optional, Tuple, Union
 from typing_extensions import Literal
 
 from vkwave.bots.core.dispatching.events.base import BaseEvent, BotEvent, UserEvent
+from vkwave.bots.core.dispatching.events.facts import (  # noqa: F401
+    AdvancedMessageEventUser,
+    CallbackMessageEventBot,
+    MessageEventBot,
+    MessageEventUser,
+)
 from vkwave.bots.core.types.bot_type import BotType
 from vkwave.bots.core.types.json_types import JSONDecoder
-from vkwave.types.bot_events import BotEventType
 from vkwave.types.objects import MessagesMessageActionStatus, MessagesMessageAttachmentType
-from vkwave.types.user_events import EventId, MessageFlag
+from vkwave.types.user_events import MessageFlag
 
 from .base import BaseFilter, FilterResult
+from .fuzzy import FuzzyIndex, levenshtein_distance
 
 logger = logging.getLogger(__name__)
 
@@ -22,12 +28,6 @@ try:
 except ImportError:
     text_filter_cyth = None
 
-MessageEventUser: Tuple[int] = EventId.MESSAGE_EVENT.value
-AdvancedMessageEventUser: Tuple[int] = (
-    MessageEventUser + EventId.USER_TYPING_OR_MAKING_VOICE_MESSAGE.value
-)
-MessageEventBot: str = "message_new"
-CallbackMessageEventBot: str = "message_event"
 InvalidEventError = ValueError(
     "Invalid event passed. Expected message event. You must add EventTypeFilter at first."
     " Also maybe filter in need of flags, but event doesn't have it"
@@ -47,53 +47,25 @@ def is_from_me(event: UserEvent) -> bool:
 
 
 def is_message_event(event: BaseEvent, flags_needed: bool = False):
-    if event.bot_type is BotType.BOT:
-        if event.object.type not in [MessageEventBot, CallbackMessageEventBot]:
-            raise InvalidEventError
-    elif event.bot_type is BotType.USER:
-        event_for_check = AdvancedMessageEventUser if not flags_needed else MessageEventUser
-        if event.object.object.event_id not in event_for_check:
-            raise InvalidEventError
+    if not event.facts.is_message_event(flags_needed):
+        raise InvalidEventError
 
 
 def get_payload(event: BaseEvent) -> Optional[str]:
     is_message_event(event)
-    if event.bot_type is BotType.USER and (
-        event.object.object.get("message_data") is not None
-        and event.object.object.message_data.payload is not None
-    ):
-        return event.object.object.message_data.payload
-
-    if event.object.type == BotEventType.MESSAGE_EVENT.value:
-        return event.object.object.payload
-
-    if event.object.object.dict()["message"].get("payload") is not None:
-        return event.object.object.message.payload
-    return None
+    return event.facts.payload
 
 
 def get_text(event: BaseEvent) -> Optional[str]:
     is_message_event(event)
-    if event.bot_type is BotType.USER:
-        if event.object.object.dict().get("text") is None:
-            return None
-        return event.object.object.text
-    else:
-        if event.object.object.dict().get("message") is None:
-            return None
-        return event.object.object.message.text
+    return event.facts.text
 
 
 def get_id(event: BaseEvent) -> Optional[int]:
     is_message_event(event)
-    if event.bot_type is BotType.USER:
-        if event.object.object.dict().get("message_data").get("from_id") is None:
-            return None
-        return int(event.object.object.message_data.from_id)
-    else:
-        if event.object.object.dict().get("message") is None:
-            return None
-        return int(event.object.object.message.from_id)
+    if event.bot_type is BotType.BOT and event.facts.message is None:
+        return None
+    return event.facts.from_id
 
 
 class EventTypeFilter(BaseFilter):
@@ -171,12 +143,11 @@ class TextFilter(BaseFilter):
         self.ic = ignore_case
 
     async def check(self, event: BaseEvent) -> FilterResult:
-        text = get_text(event)
+        is_message_event(event)
+        text = event.facts.text_lower if self.ic else event.facts.text
         if text is None:
             return FilterResult(False)
 
-        if self.ic:
-            text = text.lower()
         if text_filter_cyth:
             logger.debug("using Cythonized text filter")
             return FilterResult(text_filter_cyth(self.text, text))
@@ -193,15 +164,11 @@ class PayloadFilter(BaseFilter):
         self.payload = payload
 
     async def check(self, event: BaseEvent) -> FilterResult:
-        current_payload = get_payload(event)
-        if current_payload is None:
+        if get_payload(event) is None:
             return FilterResult(False)
         if self.payload is None:
             return FilterResult(True)
-
-        if not isinstance(current_payload, dict):
-            current_payload = self.json_loader(current_payload)
-        return FilterResult(current_payload == self.payload)
+        return FilterResult(event.facts.get_payload_data(self.json_loader) == self.payload)
 
 
 class ChatActionFilter(BaseFilter):
@@ -215,11 +182,10 @@ class ChatActionFilter(BaseFilter):
         if event.bot_type is BotType.USER:
             current_action = event.object.object.message_data.source_act
         else:
-            if event.object.object.dict().get("message") is None:
+            message = event.facts.message
+            if message is None or message.action is None:
                 return FilterResult(False)
-            if event.object.object.message.action is None:
-                return FilterResult(False)
-            current_action = event.object.object.message.action.type
+            current_action = message.action.type
         return FilterResult(current_action == self.action)
 
 
@@ -249,14 +215,12 @@ class CommandsFilter(BaseFilter):
         self.ic = ignore_case
 
     async def check(self, event: BaseEvent) -> FilterResult:
-        text = get_text(event)
+        is_message_event(event)
+        text = event.facts.text_lower if self.ic else event.facts.text
 
         if text is None:
             return FilterResult(False)
 
-        if self.ic:
-            text = text.lower()
-
         for prefix in self.prefixes:
             if not text.startswith(prefix):
                 continue
@@ -279,8 +243,10 @@ class RegexFilter(BaseFilter):
     # any email (example match: "email@example.com")  # noqa: W605
     >>> _ = regex(r"abc-\d\d", flags=re.IGNORECASE)  # example match: "Abc-54" # noqa: W605
 
-    >>> regex_filter = regex(r"user#\d{1,4}")  # example match: "user#723"  # noqa: W605
+    >>> regex_filter = regex(r"user#(\d{1,4})")  # example match: "user#723"  # noqa: W605
     >>> @router.registrar.with_decorator(regex_filter)
+    >>> async def handler(event):
+    ...     user_number = event["regex_match"].group(1)  # match is kept in event
     """
 
     def __init__(self, regex: str, flags: int = 0):
@@ -290,7 +256,11 @@ class RegexFilter(BaseFilter):
         text = get_text(event)
         if text is None:
             return FilterResult(False)
-        return FilterResult(self.pattern.match(text) is not None)
+        match = self.pattern.match(text)
+        if match is None:
+            return FilterResult(False)
+        event["regex_match"] = match
+        return FilterResult(True)
 
 
 class MessageFromConversationTypeFilter(BaseFilter):
@@ -325,10 +295,7 @@ class MessageFromConversationTypeFilter(BaseFilter):
 
     async def check(self, event: BaseEvent) -> FilterResult:
         is_message_event(event)
-        if event.bot_type is BotType.USER:
-            peer_id = event.object.object.peer_id
-        else:
-            peer_id = event.object.object.message.peer_id
+        peer_id = event.facts.peer_id
         status = (peer_id >= 2e9).real
 
         return FilterResult(self.from_what == status)
@@ -428,15 +395,11 @@ class TextContainsFilter(BaseFilter):
         self.ignore_case = ignore_case
 
     async def check(self, event: BaseEvent) -> FilterResult:
-        message_text = get_text(event)
+        is_message_event(event)
+        message_text = event.facts.text_lower if self.ignore_case else event.facts.text
         if message_text:
             for text in self.text:
-                r = (
-                    text in message_text
-                    if not self.ignore_case
-                    else text.lower() in message_text.lower()
-                )
-                if r:
+                if (text.lower() if self.ignore_case else text) in message_text:
                     return FilterResult(True)
         return FilterResult(False)
 
@@ -448,9 +411,7 @@ class TextStartswithFilter(BaseFilter):
 
     async def check(self, event: BaseEvent) -> FilterResult:
         is_message_event(event)
-        text = get_text(event)
-        if self.ignore_case:
-            text = text.lower()
+        text = event.facts.text_lower if self.ignore_case else event.facts.text
         for t in self.text:
             if text.startswith(t):
                 return FilterResult(True)
@@ -470,12 +431,9 @@ class PayloadContainsFilter(BaseFilter):
         self,
         event: BaseEvent,
     ) -> FilterResult:
-        current_payload = get_payload(event)
-        if current_payload is None:
+        if get_payload(event) is None:
             return FilterResult(False)
-        if not isinstance(current_payload, dict):
-            current_payload = self.json_loader(current_payload)
-        return FilterResult(self.key in current_payload)
+        return FilterResult(self.key in event.facts.get_payload_data(self.json_loader))
 
 
 class AttachmentTypeFilter(BaseFilter):
@@ -502,12 +460,12 @@ class AttachmentTypeFilter(BaseFilter):
         if event.bot_type == BotType.USER:
             raise RuntimeError("Сannot be used in userbot")
 
-        if not event.object.object.message.attachments:
+        attachment_types = event.facts.attachment_types
+        if not attachment_types:
             return FilterResult(False)
 
         attachments_map = map(
-            lambda attachment: attachment.type.value is self.attachment_type,
-            event.object.object.message.attachments,
+            lambda attachment_type: attachment_type == self.attachment_type, attachment_types
         )
 
         if self._any:
@@ -540,42 +498,36 @@ class IsAdminFilter(BaseFilter):
 
 
 class LevenshteinFilter(BaseFilter):
+    """
+    Message text is close to any of texts: it's at most `mistake` edits away.
+
+    >>> _ = LevenshteinFilter(("hello", "hi"), mistake=1)  # example match: "helo"
+    """
+
+    # texts are indexed when there are at least so many of them
+    INDEX_THRESHOLD = 16
+
+    levenshtein_distance = staticmethod(levenshtein_distance)
+
     def __init__(self, text: AnyText, mistake: int):
         self.text = any_text_to_list_or_tuple(text)
         self.mistake = mistake
-
-    @staticmethod
-    def levenshtein_distance(s1: str, s2: str):
-        if s1 == s2:
-            return 0
-        rows = len(s1) + 1
-        cols = len(s2) + 1
-
-        if not s1:
-            return cols - 1
-        if not s2:
-            return rows - 1
-
-        cur = range(cols)
-        for r in range(1, rows):
-            prev, cur = cur, [r] + [0] * (cols - 1)
-            for c in range(1, cols):
-                deletion = prev[c] + 1
-                insertion = cur[c - 1] + 1
-                edit = prev[c - 1] + (0 if s1[r - 1] == s2[c - 1] else 1)
-                cur[c] = min(edit, deletion, insertion)
-
-        return cur[-1]
+        self._index: Optional[FuzzyIndex] = None
+        if len(self.text) >= self.INDEX_THRESHOLD and mistake >= 0:
+            self._index = FuzzyIndex(self.text, mistake)
 
     async def check(self, event: BaseEvent) -> FilterResult:
-        text = get_text(event)
+        is_message_event(event)
+        text = event.facts.text_lower
         if text is None:
             return FilterResult(False)
 
-        text = text.lower()
+        if self._index is not None:
+            return FilterResult(next(self._index.search(text), None) is not None)
         for t in self.text:
-            if self.levenshtein_distance(t, text) <= self.mistake:
+            if levenshtein_distance(t, text, self.mistake) <= self.mistake:
                 return FilterResult(True)
+        return FilterResult(False)
 
 
 class FromIdFilter(BaseFilter):
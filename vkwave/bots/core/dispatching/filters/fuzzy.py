@@ -0,0 +1,128 @@
+"""
+Fuzzy matching of texts.
+
+>>> levenshtein_distance("hello", "helo")
+1
+>>> levenshtein_distance("hello", "goodbye", max_distance=2)  # it stops as soon as it's over 2
+3
+>>> index = FuzzyIndex(["hello", "help", "goodbye"], max_distance=1)
+>>> sorted(index.search("helo"))
+['hello', 'help']
+"""
+
+import typing
+
+
+def levenshtein_distance(s1: str, s2: str, max_distance: typing.Optional[int] = None) -> int:
+    """
+    Levenshtein distance between strings. If it's over `max_distance`, `max_distance + 1`
+    is returned: only a band of the matrix around its diagonal is computed, and computing
+    stops as soon as a whole row of the band is over `max_distance`.
+    """
+    if s1 == s2:
+        return 0
+    if len(s1) > len(s2):
+        s1, s2 = s2, s1
+    if max_distance is None:
+        max_distance = len(s2)
+    too_far = max_distance + 1
+    if len(s2) - len(s1) > max_distance:
+        return too_far
+
+    # common prefix and suffix don't change the distance
+    start = 0
+    end = len(s1)
+    while start < end and s1[start] == s2[start]:
+        start += 1
+    shift = len(s2) - len(s1)
+    while end > start and s1[end - 1] == s2[end - 1 + shift]:
+        end -= 1
+    s1 = s1[start:end]
+    s2 = s2[start : end + shift]
+    if not s1:
+        return len(s2) if len(s2) <= max_distance else too_far
+
+    columns = len(s2)
+    prev = [column if column < too_far else too_far for column in range(columns + 1)]
+    cur = [too_far] * (columns + 1)
+    for row, char in enumerate(s1, 1):
+        first = row - max_distance
+        if first <= 1:
+            first = 1
+            cur[0] = row
+        else:
+            cur[first - 1] = too_far
+        last = min(columns, row + max_distance)
+
+        row_min = too_far
+        for column in range(first, last + 1):
+            value = prev[column - 1] + (char != s2[column - 1])
+            if prev[column] + 1 < value:
+                value = prev[column] + 1
+            if cur[column - 1] + 1 < value:
+                value = cur[column - 1] + 1
+            cur[column] = value
+            if value < row_min:
+                row_min = value
+        if row_min >= too_far:
+            return too_far
+        if last < columns:
+            cur[last + 1] = too_far
+        prev, cur = cur, prev
+    return min(prev[columns], too_far)
+
+
+class FuzzyIndex:
+    """
+    Index of texts for search of ones that are at most `max_distance` edits away from a query.
+
+    Every text is split into `max_distance + 1` pieces. Edits can't touch all of them,
+    so a close query contains one of pieces as is, and near to its place in the text.
+    Only texts whose pieces are found in the query are compared with it.
+    """
+
+    def __init__(self, texts: typing.Iterable[str], max_distance: int):
+        self.max_distance = max_distance
+        # texts and offsets of their pieces
+        self._pieces: typing.Dict[str, typing.List[typing.Tuple[str, int]]] = {}
+        self._piece_lengths: typing.Set[int] = set()
+        # texts that are too short to be split are compared with every query
+        self._short_texts: typing.List[str] = []
+        self._max_length = 0
+        for text in dict.fromkeys(texts):
+            self._add(text)
+
+    def _add(self, text: str) -> None:
+        self._max_length = max(self._max_length, len(text))
+        count = self.max_distance + 1
+        if len(text) < count:
+            self._short_texts.append(text)
+            return
+        size, longer = divmod(len(text), count)
+        offset = 0
+        for number in range(count):
+            length = size + 1 if number < longer else size
+            self._pieces.setdefault(text[offset : offset + length], []).append((text, offset))
+            self._piece_lengths.add(length)
+            offset += length
+
+    def search(self, query: str) -> typing.Iterator[str]:
+        """Texts whose distance to `query` is not over `max_distance`"""
+        max_distance = self.max_distance
+        if len(query) - max_distance > self._max_length:
+            return  # e.g. long message and short commands
+        for text in self._short_texts:
+            if levenshtein_distance(text, query, max_distance) <= max_distance:
+                yield text
+
+        checked: typing.Set[str] = set()
+        for length in self._piece_lengths:
+            # pieces can be moved by edits by at most `max_distance`
+            last_position = min(len(query) - length, self._max_length + max_distance)
+            for position in range(last_position + 1):
+                for text, offset in self._pieces.get(query[position : position + length], ()):
+                    if text in checked or abs(position - offset) > max_distance:
+                        continue
+                    checked.add(text)
+                    if levenshtein_distance(text, query, max_distance) <= max_distance:
+                        yield text
@@ -4,6 +4,7 @@ from typing import Any, List, Optional
 from vkwave.bots.core.dispatching.events.base import BaseEvent
 from vkwave.bots.core.dispatching.filters.base import BaseFilter
 from vkwave.bots.core.dispatching.filters.manage import FilterManager
+from vkwave.bots.core.dispatching.offload import ThreadOffloader
 
 from .callback import BaseCallback
 
@@ -39,3 +40,12 @@ class DefaultHandler(BaseHandler):
             return FILTERS_NOT_PASSED
         c_result = await self.callback.execute(event)
         return c_result
+
+
+def offload_sync_functions(handler: BaseHandler, offloader: ThreadOffloader) -> None:
+    """Run sync callback and sync filters of handler in `offloader` (unless they have one)"""
+    callback = getattr(handler, "callback", None)
+    if isinstance(callback, BaseCallback):
+        handler.callback = callback.offloaded(offloader)  # type: ignore
+    filters = handler.filter_manager.filters
+    filters[:] = [filter.offloaded(offloader) for filter in filters]
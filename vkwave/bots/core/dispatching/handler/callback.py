@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, Optional
 
 from vkwave.bots.core.dispatching.events.base import BaseEvent
+from vkwave.bots.core.dispatching.offload import ThreadOffloader
 
 
 class BaseCallback(ABC):
@@ -9,6 +10,13 @@ class BaseCallback(ABC):
     async def execute(self, event: BaseEvent) -> Any:
         ...
 
+    def offloaded(self, offloader: ThreadOffloader) -> "BaseCallback":
+        """
+        Callback that runs sync functions in `offloader` (it's `self` if there are none).
+        Callbacks may be shared by handlers, so they are copied, not changed.
+        """
+        return self
+
 
 class AsyncFuncCallback(BaseCallback):
     def __init__(self, func: Callable[[BaseEvent], Awaitable[Any]]):
@@ -18,9 +26,31 @@ class AsyncFuncCallback(BaseCallback):
         return await self.func(event)
 
 
+class ConstantCallback(BaseCallback):
+    """It returns the same value for every event (e.g. text of answer)."""
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    async def execute(self, event: BaseEvent) -> Any:
+        return self.value
+
+
 class SyncFuncCallback(BaseCallback):
-    def __init__(self, func: Callable[[BaseEvent], Any]):
+    """With `offloader`, the function is called in its pool instead of the event loop."""
+
+    def __init__(
+        self, func: Callable[[BaseEvent], Any], offloader: Optional[ThreadOffloader] = None
+    ):
         self.func = func
+        self.offloader = offloader
 
     async def execute(self, event: BaseEvent) -> Any:
+        if self.offloader is not None:
+            return await self.offloader.run(self.func, event)
         return self.func(event)
+
+    def offloaded(self, offloader: ThreadOffloader) -> BaseCallback:
+        if self.offloader is not None:
+            return self
+        return SyncFuncCallback(self.func, offloader)
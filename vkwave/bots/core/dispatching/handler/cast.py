@@ -4,7 +4,7 @@ from typing import Any, Optional
 
 from vkwave.bots.core.dispatching.cast.default import DefaultCaster
 
-from .callback import AsyncFuncCallback, BaseCallback, SyncFuncCallback
+from .callback import AsyncFuncCallback, BaseCallback, ConstantCallback, SyncFuncCallback
 
 
 class CallbackCaster(DefaultCaster[BaseCallback]):
@@ -15,7 +15,7 @@ class CallbackCaster(DefaultCaster[BaseCallback]):
         elif isfunction(something):
             return SyncFuncCallback(something)
         elif isinstance(something, str):
-            return SyncFuncCallback(lambda event: something)
+            return ConstantCallback(something)
         else:
             return None
 
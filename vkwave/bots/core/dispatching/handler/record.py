@@ -3,7 +3,9 @@ from typing import Any, List, Optional, Type, Union, cast
 from vkwave.bots.core.dispatching.filters import filter_caster
 from vkwave.bots.core.dispatching.filters.base import BaseFilter
 from vkwave.bots.core.dispatching.handler import BaseHandler, DefaultHandler
+from vkwave.bots.core.dispatching.handler.base import offload_sync_functions
 from vkwave.bots.core.dispatching.handler.callback import BaseCallback
+from vkwave.bots.core.dispatching.offload import ThreadOffloader
 
 from .cast import caster as callback_caster
 
@@ -13,11 +15,17 @@ class HandlerRecord:
         self.filters: List[BaseFilter] = []
         self.callback: Optional[BaseCallback] = None
         self.handler_type: Type[BaseHandler] = DefaultHandler
+        self.offloader: Optional[ThreadOffloader] = None
 
     def with_handler_type(self, handler_type: Type[BaseHandler]) -> "HandlerRecord":
         self.handler_type = handler_type
         return self
 
+    def with_offloader(self, offloader: ThreadOffloader) -> "HandlerRecord":
+        """Run sync callback and sync filters of handler in `offloader`"""
+        self.offloader = offloader
+        return self
+
     def with_filters(self, *filters: Union[BaseFilter, Any]) -> "HandlerRecord":
         for filter in filters:
             if isinstance(filter, BaseFilter):
@@ -34,4 +42,7 @@ class HandlerRecord:
         return self
 
     def ready(self) -> BaseHandler:
-        return self.handler_type(cast(BaseCallback, self.callback), filters=self.filters)
+        handler = self.handler_type(cast(BaseCallback, self.callback), filters=self.filters)
+        if self.offloader is not None:
+            offload_sync_functions(handler, self.offloader)
+        return handler
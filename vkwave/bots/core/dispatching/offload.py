@@ -0,0 +1,146 @@
+"""
+Offloading of sync callbacks and filters from the event loop, so slow sync code (DB drivers,
+image processing and so on) doesn't stall processing of other events.
+
+>>> pool = ThreadOffloader(max_workers=8, max_pending=100)
+>>> router = DefaultRouter(offloader=pool)  # sync callbacks and filters of all handlers
+>>> router.register_handler(TextFilter("report"), callback=make_report, offloader=pool)
+>>> pool.stats.max_queue_time  # seconds that calls waited for a thread at most
+0.002
+
+CPU-heavy work can be run in other processes (its functions and arguments must be picklable):
+
+>>> processes = ProcessOffloader(max_workers=4)
+>>> await processes.run(resize_image, data)
+"""
+
+import asyncio
+import time
+import typing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+T = typing.TypeVar("T")
+
+
+class OffloadStats:
+    __slots__ = ("submitted", "completed", "failed", "pending", "queue_time", "max_queue_time")
+
+    def __init__(self):
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        # calls that wait for a worker or are running
+        self.pending = 0
+        # seconds that calls waited for a worker, in total and at most
+        self.queue_time = 0.0
+        self.max_queue_time = 0.0
+
+    def __repr__(self) -> str:
+        counters = ", ".join(f"{name}={getattr(self, name)}" for name in self.__slots__)
+        return f"OffloadStats({counters})"
+
+
+class BaseOffloader:
+    """Runs sync callables in `executor`"""
+
+    # clock that is shared by the loop and workers
+    clock: typing.Callable[[], float] = staticmethod(time.perf_counter)  # type: ignore
+
+    def __init__(self, executor: Executor, max_pending: typing.Optional[int] = None):
+        """
+        :param max_pending: how many callables may wait for a worker or run,
+            the rest wait in the event loop
+        """
+        if max_pending is not None and max_pending < 1:
+            raise ValueError("At least one pending call is needed")
+        self.executor = executor
+        self.max_pending = max_pending
+        self.stats = OffloadStats()
+        # it's created in the running loop, on the first call
+        self._semaphore: typing.Optional[asyncio.Semaphore] = None
+
+    @staticmethod
+    def _call(
+        clock: typing.Callable[[], float],
+        submitted_at: float,
+        func: typing.Callable[..., T],
+        *args: typing.Any,
+    ) -> typing.Tuple[float, T]:
+        # it's called in a worker, stats are updated in the loop
+        queue_time = clock() - submitted_at
+        return queue_time, func(*args)
+
+    def _record_queue_time(self, queue_time: float) -> None:
+        self.stats.queue_time += queue_time
+        if queue_time > self.stats.max_queue_time:
+            self.stats.max_queue_time = queue_time
+
+    async def _run(self, func: typing.Callable[..., T], *args: typing.Any) -> T:
+        self.stats.submitted += 1
+        self.stats.pending += 1
+        try:
+            queue_time, result = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self._call, self.clock, self.clock(), func, *args
+            )
+        except BaseException:
+            self.stats.failed += 1
+            raise
+        else:
+            self._record_queue_time(queue_time)
+            self.stats.completed += 1
+            return result
+        finally:
+            self.stats.pending -= 1
+
+    async def run(self, func: typing.Callable[..., T], *args: typing.Any) -> T:
+        """Call `func(*args)` in executor"""
+        if self.max_pending is None:
+            return await self._run(func, *args)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_pending)
+        async with self._semaphore:
+            return await self._run(func, *args)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.executor.shutdown(wait=wait)
+
+
+class ThreadOffloader(BaseOffloader):
+    """Runs sync callables in a `ThreadPoolExecutor`"""
+
+    def __init__(
+        self,
+        max_workers: typing.Optional[int] = None,
+        max_pending: typing.Optional[int] = None,
+        executor: typing.Optional[ThreadPoolExecutor] = None,
+    ):
+        """
+        :param max_workers: how many callables run at once (see `ThreadPoolExecutor`)
+        :param max_pending: how many callables may wait for a thread or run
+        :param executor: pool to use instead of a new one
+        """
+        super().__init__(
+            executor
+            or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vkwave-offload"),
+            max_pending,
+        )
+
+
+class ProcessOffloader(BaseOffloader):
+    """Runs sync callables in a `ProcessPoolExecutor`"""
+
+    # `perf_counter` of other processes may count from another point
+    clock = staticmethod(time.time)  # type: ignore
+
+    def __init__(
+        self,
+        max_workers: typing.Optional[int] = None,
+        max_pending: typing.Optional[int] = None,
+        executor: typing.Optional[ProcessPoolExecutor] = None,
+    ):
+        """
+        :param max_workers: how many processes there are (see `ProcessPoolExecutor`)
+        :param max_pending: how many callables may wait for a process or run
+        :param executor: pool to use instead of a new one
+        """
+        super().__init__(executor or ProcessPoolExecutor(max_workers=max_workers), max_pending)
@@ -1,17 +1,131 @@
-from typing import Any, Callable, List, TypeVar
+import heapq
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    KeysView,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
+from vkwave.bots.core.dispatching.events.base import BaseEvent
 from vkwave.bots.core.dispatching.filters.base import AsyncFuncFilter, BaseFilter, SyncFuncFilter
 from vkwave.bots.core.dispatching.filters.builtin import EventTypeFilter
-from vkwave.bots.core.dispatching.handler.base import BaseHandler
+from vkwave.bots.core.dispatching.handler.base import BaseHandler, offload_sync_functions
 from vkwave.bots.core.dispatching.handler.record import HandlerRecord
+from vkwave.bots.core.dispatching.offload import ThreadOffloader
+
+from .text_index import TextIndex
 
 F = TypeVar("F", bound=Callable[..., Any])
+EventType = Union[str, int]
+
+
+def get_filters_event_types(filters: List[BaseFilter]) -> Optional[Set[EventType]]:
+    """Event types that all `EventTypeFilter`s of filters pass (`None` means any type)"""
+    types: Optional[Set[EventType]] = None
+    for filter in filters:
+        if not isinstance(filter, EventTypeFilter):
+            continue
+        event_type = filter.event_type
+        filter_types = set(event_type) if isinstance(event_type, tuple) else {event_type}
+        types = filter_types if types is None else types & filter_types
+    return types
+
+
+def get_event_types(handler: BaseHandler) -> Optional[Set[EventType]]:
+    """Event types that handler's `EventTypeFilter`s pass (`None` means any type)"""
+    return get_filters_event_types(handler.filter_manager.filters)
+
+
+class _TypeIndex:
+    def __init__(self):
+        # handlers that may pass events of the type, in order of registration
+        self.by_type: Dict[EventType, List[BaseHandler]] = {}
+        # handlers without `EventTypeFilter`, they are candidates for events of any type
+        self.untyped: List[BaseHandler] = []
+
+    def add(self, handler: BaseHandler, types: Optional[Set[EventType]]) -> None:
+        if types is None:
+            self.untyped.append(handler)
+            for handlers in self.by_type.values():
+                handlers.append(handler)
+            return
+        for event_type in types:
+            handlers = self.by_type.get(event_type)
+            if handlers is None:
+                handlers = self.by_type[event_type] = self.untyped.copy()
+            handlers.append(handler)
+
+    def get(self, event_type: EventType) -> List[BaseHandler]:
+        return self.by_type.get(event_type, self.untyped)
+
+
+def _changing(name: str) -> Callable[..., Any]:
+    method = getattr(list, name)
+
+    def change(self: "_HandlerList", *args: Any, **kwargs: Any) -> Any:
+        self.changes += 1
+        return method(self, *args, **kwargs)
+
+    change.__name__ = name
+    return change
+
+
+class _HandlerList(list):
+    """List of handlers that counts changes besides appending, so indexes know they are stale"""
+
+    changes = 0
+
+    __setitem__ = _changing("__setitem__")
+    __delitem__ = _changing("__delitem__")
+    __imul__ = _changing("__imul__")
+    insert = _changing("insert")
+    remove = _changing("remove")
+    pop = _changing("pop")
+    clear = _changing("clear")
+    sort = _changing("sort")
+    reverse = _changing("reverse")
 
 
 class HandlerRegistrar:
     def __init__(self):
         self.default_filters: List[BaseFilter] = []
-        self.handlers: List[BaseHandler] = []
+        # sync callbacks and filters of handlers without their own offloader are run in it
+        self.default_offloader: Optional[ThreadOffloader] = None
+        self._handlers = _HandlerList()
+        # which list, at which change and how many of its handlers are indexed
+        self._indexed: Optional[_HandlerList] = None
+        self._indexed_changes = 0
+        self._indexed_count = 0
+        self._by_type = _TypeIndex()
+        # handlers with text filters are found by text, the rest are kept by type only
+        self._text_index = TextIndex()
+        self._text_handler_types: Dict[BaseHandler, Optional[Set[EventType]]] = {}
+        self._plain_by_type = _TypeIndex()
+        self._positions: Dict[BaseHandler, int] = {}
+
+    @property
+    def handlers(self) -> List[BaseHandler]:
+        return self._handlers
+
+    @handlers.setter
+    def handlers(self, handlers: List[BaseHandler]) -> None:
+        # lists of registrars are shared as is (clones of bot share handlers)
+        if not isinstance(handlers, _HandlerList):
+            handlers = _HandlerList(handlers)
+        self._handlers = handlers
+
+    @property
+    def version(self) -> Tuple[int, int, int]:
+        """It changes when handlers are registered, removed, replaced or moved"""
+        handlers = self._handlers
+        return id(handlers), handlers.changes, len(handlers)
 
     def add_default_filter(self, filter: BaseFilter):
         if isinstance(filter, (AsyncFuncFilter, SyncFuncFilter)):
@@ -47,5 +161,82 @@ class HandlerRegistrar:
                     break
             if to_include:
                 handler.filter_manager.add_filter(dfilter)
+        if self.default_offloader is not None:
+            offload_sync_functions(handler, self.default_offloader)
 
         self.handlers.append(handler)
+        self._update_index()
+
+    def _index_handler(self, handler: BaseHandler) -> None:
+        types = get_event_types(handler)
+        self._positions[handler] = len(self._positions)
+        self._by_type.add(handler, types)
+        if self._text_index.add(handler):
+            self._text_handler_types[handler] = types
+        else:
+            self._plain_by_type.add(handler, types)
+
+    def _update_index(self) -> None:
+        handlers = self._handlers
+        if handlers is not self._indexed or handlers.changes != self._indexed_changes:
+            # handlers were replaced, removed or moved
+            self._by_type = _TypeIndex()
+            self._text_index = TextIndex()
+            self._text_handler_types = {}
+            self._plain_by_type = _TypeIndex()
+            self._positions = {}
+            self._indexed = handlers
+            self._indexed_changes = handlers.changes
+            self._indexed_count = 0
+        elif self._indexed_count == len(handlers):
+            return
+        for handler in handlers[self._indexed_count :]:
+            self._index_handler(handler)
+        self._indexed_count = len(handlers)
+
+    def get_handlers(self, event_type: EventType) -> List[BaseHandler]:
+        """
+        Handlers that may process events of the type, in order of registration.
+        Handlers whose `EventTypeFilter`s don't pass the type are skipped.
+        """
+        self._update_index()
+        return self._by_type.get(event_type)
+
+    def get_event_types(self) -> Optional[KeysView[EventType]]:
+        """Event types that registered handlers may process (`None` means any type)"""
+        self._update_index()
+        if self._by_type.untyped:
+            return None
+        return self._by_type.by_type.keys()
+
+    def get_event_handlers(self, event: BaseEvent) -> Iterable[BaseHandler]:
+        """
+        Handlers that may process the event, in order of registration.
+        Besides `get_handlers`, handlers whose `TextFilter`, `CommandsFilter`,
+        `TextStartswithFilter` or `RegexFilter` doesn't pass text of message are skipped.
+        Patterns of `RegexFilter`s are matched lazily, as handlers are iterated.
+        """
+        facts = event.facts
+        event_type = facts.event_type
+        handlers = self.get_handlers(event_type)
+        if not self._text_handler_types or not facts.is_message_event():
+            return handlers
+
+        plain = self._plain_by_type.get(event_type)
+        text = facts.text
+        if text is None:
+            return plain
+        types = self._text_handler_types
+        candidates = [
+            handler
+            for handler in self._text_index.lookup(text, facts.text_lower)
+            if types[handler] is None or event_type in types[handler]  # type: ignore
+        ]
+        position = self._positions.__getitem__
+        candidates.sort(key=position)
+        regex_candidates = (
+            handler
+            for handler in self._text_index.match_regex(text)
+            if types[handler] is None or event_type in types[handler]  # type: ignore
+        )
+        return heapq.merge(plain, candidates, regex_candidates, key=position)
@@ -1,14 +1,15 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional, Union
+from typing import AbstractSet, Any, List, Optional, Union
 
 from vkwave.bots.core.dispatching.events.base import BaseEvent
 from vkwave.bots.core.dispatching.filters import BaseFilter
 from vkwave.bots.core.dispatching.filters.manage import FilterManager
 from vkwave.bots.core.dispatching.handler.base import FILTERS_NOT_PASSED
+from vkwave.bots.core.dispatching.offload import ThreadOffloader
 
 from ..handler.callback import BaseCallback
-from .registrar import HandlerRegistrar
+from .registrar import EventType, HandlerRegistrar, get_filters_event_types
 
 HANDLER_NOT_FOUND = object()
 logger = logging.getLogger(__name__)
@@ -28,22 +29,36 @@ class BaseRouter(ABC):
     def registrar(self) -> HandlerRegistrar:
         ...
 
+    def get_event_types(self) -> Optional[AbstractSet[EventType]]:
+        """Event types that router may process (`None` means any type)"""
+        return None
+
 
 class DefaultRouter(BaseRouter):
-    def __init__(self, filters: Optional[List[BaseFilter]] = None):
+    def __init__(
+        self,
+        filters: Optional[List[BaseFilter]] = None,
+        offloader: Optional[ThreadOffloader] = None,
+    ):
+        """
+        :param offloader: sync callbacks and sync filters of handlers are run in it
+            (unless handlers have their own one)
+        """
         self.filter_manager = FilterManager()
         filters = filters or []
         for filter in filters:
             self.filter_manager.add_filter(filter)
 
         self._registrar = HandlerRegistrar()
+        self._registrar.default_offloader = offloader
 
     @property
     def registrar(self) -> HandlerRegistrar:
         return self._registrar
 
     async def process_event(self, event: BaseEvent) -> Any:
-        for handler in self._registrar.handlers:
+        # only handlers whose event type and text filters may pass the event are visited
+        for handler in self._registrar.get_event_handlers(event):
             h_res = await handler.process_event(event)
             if h_res is FILTERS_NOT_PASSED:
                 continue
@@ -53,14 +68,27 @@ class DefaultRouter(BaseRouter):
     async def is_suitable(self, event: BaseEvent) -> bool:
         return await self.filter_manager.execute_filters(event)
 
+    def get_event_types(self) -> Optional[AbstractSet[EventType]]:
+        router_types = get_filters_event_types(self.filter_manager.filters)
+        handler_types = self._registrar.get_event_types()
+        if router_types is None:
+            return handler_types
+        if handler_types is None:
+            return router_types
+        return router_types & handler_types
+
     def register_handler(
-        self, *filters: Union[BaseFilter, Any], callback: Union[BaseCallback, Any]
+        self,
+        *filters: Union[BaseFilter, Any],
+        callback: Union[BaseCallback, Any],
+        offloader: Optional[ThreadOffloader] = None,
     ):
         """
         Register handler with one method
 
         >>> router.register_handler(EventTypeFilter("message_new"), TextFilter("123"), callback=callback)
         """
-        self._registrar.register(
-            self._registrar.new().with_filters(*filters).handle(callback).ready()
-        )
+        record = self._registrar.new().with_filters(*filters).handle(callback)
+        if offloader is not None:
+            record.with_offloader(offloader)
+        self._registrar.register(record.ready())
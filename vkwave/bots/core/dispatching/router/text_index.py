@@ -0,0 +1,194 @@
+"""
+Index of text filters of handlers.
+
+Texts of `TextFilter`s and commands of `CommandsFilter`s are kept in hash maps and prefixes of
+`TextStartswithFilter`s in a prefix trie, so one lookup finds handlers whose text filter may pass
+the message, however many of them are registered. Patterns of `RegexFilter`s are joined into one
+alternation, so one scan of the text finds the first handler whose pattern matches.
+
+>>> index = TextIndex()
+>>> index.add(handler)  # handler with TextFilter("hi")
+>>> list(index.lookup("Hi", "hi"))
+[handler]
+"""
+
+import re
+import typing
+
+from vkwave.bots.core.dispatching.filters.base import BaseFilter
+from vkwave.bots.core.dispatching.filters.builtin import (
+    CommandsFilter,
+    RegexFilter,
+    TextFilter,
+    TextStartswithFilter,
+)
+from vkwave.bots.core.dispatching.handler.base import BaseHandler
+
+# subclasses may check text another way, so they aren't indexed
+INDEXED_FILTERS = (TextFilter, CommandsFilter, TextStartswithFilter, RegexFilter)
+
+# flags that can be set for a part of pattern
+_SCOPED_FLAGS = {
+    re.IGNORECASE: "i",
+    re.MULTILINE: "m",
+    re.DOTALL: "s",
+    re.VERBOSE: "x",
+    re.ASCII: "a",
+}
+# backreferences, named groups and conditionals would refer to wrong groups in alternation
+_UNCOMBINABLE = re.compile(r"\\[1-9]|\(\?P[<=]|\(\?\(")
+
+
+def get_text_filter(handler: BaseHandler) -> typing.Optional[BaseFilter]:
+    """The first of handler's filters that is indexed (all of them have to pass anyway)"""
+    for filter in handler.filter_manager.filters:
+        if type(filter) in INDEXED_FILTERS:
+            return filter
+    return None
+
+
+def get_scoped_source(pattern: typing.Pattern) -> typing.Optional[str]:
+    """
+    Pattern with its flags that can be a part of another pattern (`None` if it can't be).
+
+    >>> get_scoped_source(re.compile("hi", re.IGNORECASE))
+    '(?i:hi)'
+    """
+    if not isinstance(pattern.pattern, str) or _UNCOMBINABLE.search(pattern.pattern):
+        return None
+    flags = pattern.flags & ~re.UNICODE
+    letters = ""
+    for flag, letter in _SCOPED_FLAGS.items():
+        if flags & flag:
+            letters += letter
+            flags &= ~flag
+    if flags:  # re.DEBUG, re.LOCALE and so on
+        return None
+    source = f"(?{letters}:{pattern.pattern})"
+    try:
+        re.compile(source)
+    except re.error:  # e.g. inline global flags
+        return None
+    return source
+
+
+class _TrieNode:
+    __slots__ = ("children", "handlers")
+
+    def __init__(self):
+        self.children: typing.Dict[str, "_TrieNode"] = {}
+        self.handlers: typing.List[BaseHandler] = []
+
+
+class _CaseIndex:
+    """Texts, commands and prefixes compared with text in the same case"""
+
+    def __init__(self):
+        self.texts: typing.Dict[str, typing.List[BaseHandler]] = {}
+        # commands are compared with the first word of text
+        self.commands: typing.Dict[str, typing.List[BaseHandler]] = {}
+        self.prefixes = _TrieNode()
+        self.has_prefixes = False
+
+    def add_prefix(self, prefix: str, handler: BaseHandler) -> None:
+        node = self.prefixes
+        for char in prefix:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+        node.handlers.append(handler)
+        self.has_prefixes = True
+
+    def lookup(self, text: str, found: typing.Dict[BaseHandler, None]) -> None:
+        for handler in self.texts.get(text, ()):
+            found[handler] = None
+        if self.commands:
+            for handler in self.commands.get(text.partition(" ")[0], ()):
+                found[handler] = None
+        if not self.has_prefixes:
+            return
+        node = self.prefixes
+        for handler in node.handlers:
+            found[handler] = None
+        for char in text:
+            node = node.children.get(char)  # type: ignore
+            if node is None:
+                return
+            for handler in node.handlers:
+                found[handler] = None
+
+
+class _RegexIndex:
+    """Patterns in order of handlers' registration, joined into alternations"""
+
+    def __init__(self):
+        self.handlers: typing.List[BaseHandler] = []
+        # pattern of the n-th handler is in group `_n`
+        self.sources: typing.List[str] = []
+        # alternations of patterns from the n-th one to the last one
+        self.alternations: typing.Dict[int, typing.Pattern] = {}
+
+    def add(self, pattern: typing.Pattern, handler: BaseHandler) -> bool:
+        source = get_scoped_source(pattern)
+        if source is None:
+            return False
+        self.sources.append(f"(?P<_{len(self.sources)}>{source})")
+        self.handlers.append(handler)
+        self.alternations.clear()
+        return True
+
+    def match(self, text: str) -> typing.Iterator[BaseHandler]:
+        start = 0
+        while start < len(self.handlers):
+            alternation = self.alternations.get(start)
+            if alternation is None:
+                alternation = re.compile("|".join(self.sources[start:]))
+                self.alternations[start] = alternation
+            # the first alternative that matches is taken, so it's the earliest handler
+            match = alternation.match(text)
+            if match is None:
+                return
+            index = int(match.lastgroup[1:])  # type: ignore
+            yield self.handlers[index]
+            start = index + 1
+
+
+class TextIndex:
+    def __init__(self):
+        # by `ignore_case` of filters
+        self._indexes = {True: _CaseIndex(), False: _CaseIndex()}
+        self._regex_index = _RegexIndex()
+
+    def add(self, handler: BaseHandler) -> bool:
+        """Index handler's text filter. Return false if handler doesn't have one."""
+        filter = get_text_filter(handler)
+        if isinstance(filter, TextFilter):
+            index = self._indexes[bool(filter.ic)]
+            for text in filter.text:
+                index.texts.setdefault(text, []).append(handler)
+        elif isinstance(filter, CommandsFilter):
+            index = self._indexes[bool(filter.ic)]
+            for prefix in filter.prefixes:
+                for command in filter.commands:
+                    index.commands.setdefault(f"{prefix}{command}", []).append(handler)
+        elif isinstance(filter, TextStartswithFilter):
+            index = self._indexes[bool(filter.ignore_case)]
+            for text in filter.text:
+                index.add_prefix(text, handler)
+        elif isinstance(filter, RegexFilter):
+            return self._regex_index.add(filter.pattern, handler)
+        else:
+            return False
+        return True
+
+    def lookup(self, text: str, text_lower: str) -> typing.Dict[BaseHandler, None]:
+        """Handlers whose text filters may pass the text (in no particular order)"""
+        found: typing.Dict[BaseHandler, None] = {}
+        self._indexes[True].lookup(text_lower, found)
+        self._indexes[False].lookup(text, found)
+        return found
+
+    def match_regex(self, text: str) -> typing.Iterator[BaseHandler]:
+        """Handlers whose patterns match the text, in order of registration"""
+        return self._regex_index.match(text)
@@ -16,18 +16,14 @@ class ForWhat(Enum):
 
 
 def get_peer_from_ids(event: BaseEvent) -> typing.Tuple[int, int]:
+    facts = event.facts
     if event.bot_type is BotType.BOT:
-        if event.object.object.dict().get("message") is not None:
-            from_id = event.object.object.message.from_id
-            peer_id = event.object.object.message.peer_id
-        else:
-            # CallbackButtonEventObject
-            from_id = event.object.object.user_id
-            peer_id = event.object.object.peer_id
-    else:
-        peer_id = from_id = event.object.object.peer_id
-        if peer_id > 2e9:
-            from_id = int(event.object.object.message_data.from_id)
+        # user_id and peer_id of CallbackButtonEventObject for callback events
+        return facts.from_id, facts.peer_id
+
+    peer_id = from_id = facts.peer_id
+    if peer_id > 2e9:
+        from_id = facts.from_id
     return from_id, peer_id
 
 
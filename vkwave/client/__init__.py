@@ -1 +1,2 @@
 from .default import AIOHTTPClient
+from .sampling import LogSampler
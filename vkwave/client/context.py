@@ -70,6 +70,8 @@ class RequestContext:
         self.request_params = request_params
         self.method_name = method_name
         self.result = ResultContext()
+        # number of retry of this request (0 for the first try), it can be used in signals
+        self.attempt: int = 0
 
         self._signals: typing.Dict[Signal, typing.List[SignalCallbackCallable]] = {
             Signal.ON_EXCEPTION: [],
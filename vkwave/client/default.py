@@ -4,7 +4,7 @@ Default implementation of HTTPClient for vkwave-client.
 
 from asyncio import AbstractEventLoop
 from json import JSONDecodeError
-from logging import getLogger
+from logging import DEBUG, getLogger
 from typing import Optional
 
 from aiohttp import ClientConnectionError, ClientSession
@@ -16,6 +16,7 @@ from vkwave.http import AIOHTTPClient as AHC_H
 from .abstract import AbstractAPIClient
 from .context import RequestContext, Signal
 from .factory import AbstractFactory, DefaultFactory
+from .sampling import LogSampler
 from .types import MethodName
 
 logger = getLogger(__name__)
@@ -23,7 +24,9 @@ logger = getLogger(__name__)
 
 async def _logging_signal_before_request(ctx: RequestContext):
     logger.debug(
-        f"Doing request to '{ctx.method_name}' method with these params: {ctx.request_params}"
+        "Doing request to '%s' method with these params: %s",
+        ctx.method_name,
+        ctx.request_params,
     )
 
 
@@ -34,9 +37,14 @@ class AIOHTTPClient(AbstractAPIClient):
         self,
         session: Optional[ClientSession] = None,
         loop: Optional[AbstractEventLoop] = None,
+        log_sampler: Optional[LogSampler] = None,
     ):
+        """
+        :param log_sampler: which requests are logged (with DEBUG level), all of them by default
+        """
         self._http_client = AHC_H(session=session, loop=loop)
         self._factory: AbstractFactory = DefaultFactory()
+        self.log_sampler = log_sampler or LogSampler()
 
     @property
     def http_client(self) -> AbstractHTTPClient:
@@ -56,7 +64,9 @@ class AIOHTTPClient(AbstractAPIClient):
             request_params=params,
             exceptions={ClientConnectionError: None, JSONDecodeError: None},
         )
-        ctx.signal(Signal.BEFORE_REQUEST, _logging_signal_before_request)
+        # params aren't formatted (and the signal isn't even set) unless they are logged
+        if logger.isEnabledFor(DEBUG) and self.log_sampler.sample():
+            ctx.signal(Signal.BEFORE_REQUEST, _logging_signal_before_request)
         return ctx
 
     async def request_callback(self, method_name: MethodName, params: dict) -> dict:
@@ -0,0 +1,28 @@
+"""
+Sampling of debug logs on hot paths (events, API requests).
+
+>>> sampler = LogSampler(rate=100)  # every 100th record is logged
+>>> if logger.isEnabledFor(logging.DEBUG) and sampler.sample():
+...     logger.debug("New event! Raw:\n%s", revent)
+"""
+
+
+class LogSampler:
+    def __init__(self, rate: int = 1):
+        """
+        :param rate: one of `rate` records is logged, all of them are logged by default
+        """
+        if rate < 1:
+            raise ValueError("Rate of sampling must be positive")
+        self.rate = rate
+        self._counter = 0
+
+    def sample(self) -> bool:
+        """Whether the next record should be logged"""
+        if self.rate == 1:
+            return True
+        self._counter += 1
+        if self._counter < self.rate:
+            return False
+        self._counter = 0
+        return True
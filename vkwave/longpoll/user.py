@@ -76,10 +76,13 @@ class UserLongpoll:
         return updates
 
     async def event_by_event(self) -> AsyncGenerator[Update, None]:
-        updates: List[Update] = []
         while True:
-            while not updates:
-                updates = await self.get_updates()
-            while updates:
-                update = updates.pop()
+            for update in await self.get_updates():
                 yield update
+
+    async def batch_by_batch(self) -> AsyncGenerator[List[Update], None]:
+        """Raw responses, as they are received (empty ones are skipped)"""
+        while True:
+            updates = await self.get_updates()
+            if updates:
+                yield updates
@@ -0,0 +1,308 @@
+"""
+Backends of vkwave.types.
+
+Types are declared as `pydantic.v1` models. With the `PYDANTIC_V2` backend they are converted
+(once, on first use) to native pydantic v2 models with the same fields, defaults and aliases.
+Native models are validated by pydantic-core, so they are parsed several times faster.
+
+The `CONSTRUCT` backend doesn't validate data at all: v1 models are built recursively from raw
+data as is (only enums are converted). Use it only for data from VK itself.
+
+>>> set_types_backend(TypesBackend.PYDANTIC_V2)
+>>> event = get_event_object(raw_event)  # native model now
+"""
+
+import enum
+import os
+import sys
+import typing
+
+import pydantic
+import pydantic.v1 as pydantic_v1
+from pydantic.v1.class_validators import make_generic_validator
+from pydantic.v1.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+from typing_extensions import Annotated, Literal, get_args, get_origin
+
+M = typing.TypeVar("M", bound=pydantic_v1.BaseModel)
+
+
+class TypesBackend(str, enum.Enum):
+    PYDANTIC_V1 = "pydantic_v1"
+    PYDANTIC_V2 = "pydantic_v2"
+    CONSTRUCT = "construct"
+
+
+_backend = TypesBackend(os.getenv("VKWAVE_TYPES_BACKEND", TypesBackend.PYDANTIC_V1.value))
+
+
+class NativeModel(pydantic.BaseModel):
+    """Base of converted models. It keeps `dict()` and `json()` of v1 without warnings."""
+
+    # v1 coerces numbers to strings and ignores unknown fields
+    model_config = pydantic.ConfigDict(
+        coerce_numbers_to_str=True,
+        extra="ignore",
+        arbitrary_types_allowed=True,
+    )
+
+    def dict(self, **kwargs: typing.Any) -> typing.Dict[str, typing.Any]:  # type: ignore
+        return self.model_dump(**kwargs)
+
+    def json(self, **kwargs: typing.Any) -> str:  # type: ignore
+        return self.model_dump_json(**kwargs)
+
+
+# converted models by v1 model; their names in the namespace used for forward references
+_native_models: typing.Dict[type, typing.Type[NativeModel]] = {}
+_namespace: typing.Dict[str, typing.Any] = {}
+
+
+def set_types_backend(backend: TypesBackend) -> None:
+    global _backend
+    _backend = TypesBackend(backend)
+
+
+def get_types_backend() -> TypesBackend:
+    return _backend
+
+
+def _native_name(model: type) -> str:
+    return f"{model.__module__}.{model.__qualname__}".replace(".", "__")
+
+
+def _resolve_type(tp: typing.Any, model: type) -> typing.Any:
+    # v1 keeps forward references inside of generic types as is
+    if not isinstance(tp, typing.ForwardRef):
+        return tp
+    # inherited fields refer to names of the module where the base model is declared
+    for base in model.__mro__:
+        namespace = vars(sys.modules[base.__module__])
+        if tp.__forward_arg__ in namespace:
+            return eval(tp.__forward_arg__, namespace)
+    raise NameError(f"Can't resolve {tp.__forward_arg__!r} of {model.__name__}")
+
+
+def _collect_models(tp: typing.Any, model: type, found: typing.Dict[type, None]) -> None:
+    tp = _resolve_type(tp, model)
+    if isinstance(tp, type) and issubclass(tp, pydantic_v1.BaseModel):
+        if tp in found or tp in _native_models:
+            return
+        found[tp] = None
+        for field in tp.__fields__.values():
+            _collect_models(field.outer_type_, tp, found)
+        return
+    for arg in get_args(tp):
+        _collect_models(arg, model, found)
+
+
+def _convert_type(tp: typing.Any, model: type) -> typing.Any:
+    tp = _resolve_type(tp, model)
+    if isinstance(tp, type) and issubclass(tp, pydantic_v1.BaseModel):
+        return typing.ForwardRef(_native_name(tp))
+
+    origin = get_origin(tp)
+    args = get_args(tp)
+    if origin is None or not args:
+        return tp
+    converted = tuple(_convert_type(arg, model) for arg in args)
+    if origin is typing.Union:
+        # v1 takes the first member of union that is valid
+        return Annotated[typing.Union[converted], pydantic.Field(union_mode="left_to_right")]
+    if origin is Literal:
+        return tp
+    if origin is list:
+        return typing.List[converted[0]]
+    if origin is dict:
+        return typing.Dict[converted[0], converted[1]]
+    if origin is tuple:
+        return typing.Tuple[converted]
+    if origin is set:
+        return typing.Set[converted[0]]
+    return tp
+
+
+def _convert_validator(model: type, field_name: str, validator: typing.Any) -> typing.Any:
+    func = make_generic_validator(validator.func)
+    v1_field = model.__fields__[field_name]
+
+    def validate(cls, value, info):
+        if value is None:
+            return value
+        return func(model, value, info.data, v1_field, model.__config__)
+
+    validate.__name__ = f"_{field_name}_{validator.func.__name__}"
+    mode = "before" if validator.pre else "after"
+    return pydantic.field_validator(field_name, mode=mode)(validate)
+
+
+def _convert_model(model: typing.Type[pydantic_v1.BaseModel]) -> typing.Type[NativeModel]:
+    fields: typing.Dict[str, typing.Any] = {}
+    validators: typing.Dict[str, typing.Any] = {}
+    for name, field in model.__fields__.items():
+        annotation = _convert_type(field.outer_type_, model)
+        if field.allow_none:
+            annotation = typing.Optional[annotation]
+
+        field_kwargs: typing.Dict[str, typing.Any] = {}
+        if field.has_alias:
+            field_kwargs["alias"] = field.alias
+        if field.field_info.description:
+            field_kwargs["description"] = field.field_info.description
+        if field.default_factory is not None:
+            field_kwargs["default_factory"] = field.default_factory
+        elif not field.required:
+            field_kwargs["default"] = field.default
+        fields[name] = (annotation, pydantic.Field(**field_kwargs))
+
+        for validator in field.class_validators.values():
+            converted = _convert_validator(model, name, validator)
+            validators[converted.__func__.__name__] = converted
+
+    return pydantic.create_model(
+        model.__name__,
+        __base__=NativeModel,
+        __doc__=model.__doc__,
+        __module__=model.__module__,
+        __validators__=validators,
+        **fields,
+    )
+
+
+def to_native_model(model: typing.Type[pydantic_v1.BaseModel]) -> typing.Type[NativeModel]:
+    """Native pydantic v2 model with fields of `model`. Converted models are cached."""
+    native = _native_models.get(model)
+    if native is not None:
+        return native
+
+    found: typing.Dict[type, None] = {}
+    _collect_models(model, model, found)
+    for v1_model in found:
+        native = _convert_model(v1_model)
+        _native_models[v1_model] = native
+        _namespace[_native_name(v1_model)] = native
+    for v1_model in found:
+        _native_models[v1_model].model_rebuild(_types_namespace=_namespace)
+    return _native_models[model]
+
+
+class _FieldKind(enum.Enum):
+    PLAIN = enum.auto()
+    MODEL = enum.auto()
+    MODEL_LIST = enum.auto()
+    ENUM = enum.auto()
+    ENUM_LIST = enum.auto()
+    # fields with validators, unions, mappings of models and so on are validated as usual
+    VALIDATE = enum.auto()
+
+
+class _FieldPlan(typing.NamedTuple):
+    name: str
+    kind: _FieldKind
+    type_: typing.Any
+    field: ModelField
+
+
+class _ConstructPlan(typing.NamedTuple):
+    # plans of fields by their aliases (keys of raw data)
+    fields: typing.Dict[str, _FieldPlan]
+    # immutable defaults are shared, the rest are copied for every object
+    defaults: typing.Dict[str, typing.Any]
+    copied_defaults: typing.List[ModelField]
+    has_private_attributes: bool
+
+
+# how to build every model without validation
+_construct_plans: typing.Dict[type, _ConstructPlan] = {}
+
+
+def _get_field_kind(field: ModelField, type_: typing.Any) -> _FieldKind:
+    if field.class_validators:
+        return _FieldKind.VALIDATE
+    if not isinstance(type_, type):  # unions, literals and so on
+        return _FieldKind.PLAIN if type_ is typing.Any else _FieldKind.VALIDATE
+
+    is_model = issubclass(type_, pydantic_v1.BaseModel)
+    is_enum = issubclass(type_, enum.Enum)
+    if field.shape not in (SHAPE_SINGLETON, SHAPE_LIST):
+        return _FieldKind.VALIDATE if is_model or is_enum else _FieldKind.PLAIN
+    is_list = field.shape == SHAPE_LIST
+    if is_model:
+        return _FieldKind.MODEL_LIST if is_list else _FieldKind.MODEL
+    if is_enum:
+        return _FieldKind.ENUM_LIST if is_list else _FieldKind.ENUM
+    return _FieldKind.PLAIN
+
+
+def _get_construct_plan(model: typing.Type[pydantic_v1.BaseModel]) -> _ConstructPlan:
+    plan = _construct_plans.get(model)
+    if plan is not None:
+        return plan
+
+    plan = _ConstructPlan({}, {}, [], bool(model.__private_attributes__))
+    for name, field in model.__fields__.items():
+        type_ = _resolve_type(field.type_, model)
+        plan.fields[field.alias] = _FieldPlan(name, _get_field_kind(field, type_), type_, field)
+        if field.default_factory is None and isinstance(field.default, _IMMUTABLE_DEFAULTS):
+            plan.defaults[name] = field.default
+        else:
+            plan.copied_defaults.append(field)
+    _construct_plans[model] = plan
+    return plan
+
+
+_IMMUTABLE_DEFAULTS = (type(None), str, int, float, bool, enum.Enum, tuple, frozenset)
+
+
+def construct_model(model: typing.Type[M], data: typing.Dict[str, typing.Any]) -> M:
+    """Build `model` from trusted raw `data` without validation"""
+    plan = _get_construct_plan(model)
+    values = plan.defaults.copy()
+    fields_set = set()
+    for alias, value in data.items():
+        field_plan = plan.fields.get(alias)
+        if field_plan is None:
+            continue
+
+        name, kind, type_, field = field_plan
+        if kind is _FieldKind.VALIDATE:
+            # validators may get `None` too
+            value, errors = field.validate(value, values, loc=alias, cls=model)
+            if errors:
+                raise pydantic_v1.ValidationError([errors], model)
+        elif kind is _FieldKind.PLAIN or value is None:
+            pass  # explicit `None` replaces default and the field is set, as in v1
+        elif kind is _FieldKind.MODEL:
+            if isinstance(value, dict):
+                value = construct_model(type_, value)
+        elif kind is _FieldKind.MODEL_LIST:
+            value = [
+                construct_model(type_, item) if isinstance(item, dict) else item for item in value
+            ]
+        elif kind is _FieldKind.ENUM:
+            # values that aren't in schema yet are kept as is
+            value = type_._value2member_map_.get(value, value)
+        elif kind is _FieldKind.ENUM_LIST:
+            members = type_._value2member_map_
+            value = [members.get(item, item) for item in value]
+        values[name] = value
+        fields_set.add(name)
+
+    for field in plan.copied_defaults:
+        if field.name not in fields_set:
+            values[field.name] = field.get_default()
+
+    obj = model.__new__(model)
+    object.__setattr__(obj, "__dict__", values)
+    object.__setattr__(obj, "__fields_set__", fields_set)
+    if plan.has_private_attributes:
+        obj._init_private_attributes()
+    return obj
+
+
+def parse_model(model: typing.Type[M], data: typing.Dict[str, typing.Any]) -> M:
+    """Build `model` from raw `data` with the current backend"""
+    if _backend is TypesBackend.PYDANTIC_V1:
+        return model(**data)
+    if _backend is TypesBackend.CONSTRUCT:
+        return construct_model(model, data)
+    return to_native_model(model).model_validate(data)  # type: ignore
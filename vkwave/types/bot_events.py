@@ -3,6 +3,7 @@ from enum import Enum
 
 import pydantic.v1 as pydantic
 
+from .backend import parse_model
 from .objects import (
     AudioAudio,
     BoardTopicComment,
@@ -639,4 +640,4 @@ def get_event_object(
 ]:
     event_type: str = raw_event["type"]
     event_model: typing.Type[BaseBotEvent] = _event_dict[event_type]
-    return event_model(**raw_event)
+    return parse_model(event_model, raw_event)
@@ -0,0 +1,79 @@
+"""
+Lazy models: raw data is validated field by field on first access.
+
+>>> history = LazyModel(MessagesGetHistoryResponse, raw_result)
+>>> history.response.count  # only `count` is validated, messages aren't touched
+"""
+
+import typing
+
+import pydantic.v1 as pydantic
+from pydantic.v1.error_wrappers import ErrorWrapper
+from pydantic.v1.errors import MissingError
+from pydantic.v1.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+
+_MISSING = object()
+
+
+class LazyModel:
+    """
+    Proxy of `model` over raw data. Every field is validated (and converted) on its first access
+    and then cached. Nested models are proxies too, so only the accessed path is validated.
+    """
+
+    __slots__ = ("_model", "_raw", "_cache")
+
+    def __init__(self, model: typing.Type[pydantic.BaseModel], raw: typing.Dict[str, typing.Any]):
+        self._model = model
+        self._raw = raw
+        self._cache: typing.Dict[str, typing.Any] = {}
+
+    def __getattr__(self, name: str) -> typing.Any:
+        # it's called only for names that aren't in slots
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+
+        field = self._model.__fields__.get(name)
+        if field is None:
+            raise AttributeError(f"{self._model.__name__!r} object has no attribute {name!r}")
+        value = self._cache[name] = self._convert(field, self._raw.get(field.alias, _MISSING))
+        return value
+
+    def _convert(self, field: ModelField, value: typing.Any) -> typing.Any:
+        if value is _MISSING:
+            if field.required:
+                error = ErrorWrapper(MissingError(), loc=field.alias)
+                raise pydantic.ValidationError([error], self._model)
+            return field.get_default()
+        if value is None:
+            return None
+
+        nested = field.type_
+        if isinstance(nested, type) and issubclass(nested, pydantic.BaseModel):
+            if field.shape == SHAPE_SINGLETON and isinstance(value, dict):
+                return LazyModel(nested, value)
+            if field.shape == SHAPE_LIST and isinstance(value, list):
+                return [
+                    LazyModel(nested, item) if isinstance(item, dict) else item for item in value
+                ]
+
+        value, errors = field.validate(value, {}, loc=field.alias, cls=self._model)
+        if errors:
+            raise pydantic.ValidationError([errors], self._model)
+        return value
+
+    def to_model(self) -> pydantic.BaseModel:
+        """Validate all the data"""
+        return self._model(**self._raw)
+
+    def dict(self) -> typing.Dict[str, typing.Any]:
+        return self.to_model().dict()
+
+    @property
+    def raw(self) -> typing.Dict[str, typing.Any]:
+        return self._raw
+
+    def __repr__(self) -> str:
+        return f"LazyModel({self._model.__name__}, validated={list(self._cache)})"
@@ -4,6 +4,7 @@ import typing
 
 import pydantic.v1 as pydantic
 
+from .backend import parse_model
 from .objects import MessagesKeyboard
 
 logger = logging.getLogger(__name__)
@@ -468,7 +469,7 @@ def _parse_event(
         _events_dict[event_id][event_number]: event_param
         for event_number, event_param in enumerate(raw_event)
     }
-    return event_model(object=event_object(**event))
+    return parse_model(event_model, {"object": parse_model(event_object, event)})
 
 
 _parse_event_dict = {